@@ -0,0 +1,77 @@
+"""Query benchmark of the EC number index
+
+Looks up the biocatalysts of EC classes, once by parsing the EC number of
+every record and once through `ECIndex`. Both must find the same records.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_ec.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import random
+import time
+
+from strendabiocat.ec_numbers import ECIndex
+
+PATTERNS = ("1.*", "3.1.1.*", "2.7.*.1")
+
+
+class Biocatalyst:
+    def __init__(self, ec_number: str):
+        self.ec_number = ec_number
+
+
+def ec_number(rng: random.Random) -> str:
+    return ".".join(
+        (
+            str(rng.randint(1, 7)),
+            str(rng.randint(1, 20)),
+            str(rng.randint(1, 10)),
+            str(rng.randint(1, 200)),
+        )
+    )
+
+
+def matches(ec: str, pattern: str) -> bool:
+    levels = ec.split(".")
+    return all(
+        wanted in ("*", "-") or wanted == level
+        for wanted, level in zip(pattern.split("."), levels)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    items = [Biocatalyst(ec_number(rng)) for _ in range(args.count)]
+
+    start = time.perf_counter()
+    index = ECIndex(items)
+    build = time.perf_counter() - start
+
+    print(f"{'build':<12}{build * 1e3:>10.1f} ms for {args.count:,} records")
+    print(f"{'pattern':<12}{'scan [ms]':>12}{'index [ms]':>12}{'matches':>10}")
+
+    for pattern in PATTERNS:
+        start = time.perf_counter()
+        expected = [item for item in items if matches(item.ec_number, pattern)]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = index.query(pattern)
+        lookup = time.perf_counter() - start
+
+        assert found == expected, "Index results differ from the scan"
+
+        print(
+            f"{pattern:<12}{scan * 1e3:>12.1f}{lookup * 1e3:>12.1f}"
+            f"{len(found):>10,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Cold-import benchmark for the strendabiocat package
+
+Measures, in fresh interpreters, how long it takes to get hold of the
+models before and after the lazy package entry point:
+
+- eager: importing all seven model modules, which is what users had to do
+  to get every model before the package had an entry point
+- package: `import strendabiocat`, which builds no models at all
+- one model: `from strendabiocat import KineticParameters`, which only
+  builds the models of `results`
+
+The pydantic baseline is the floor every variant that builds a model pays.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N]
+"""
+
+from __future__ import annotations
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+CASES = {
+    "pydantic baseline": "from pydantic import BaseModel, Field",
+    "eager, all modules": (
+        "import strendabiocat.biocatalyst, strendabiocat.components, "
+        "strendabiocat.operation_mode, strendabiocat.reaction_conditions, "
+        "strendabiocat.results, strendabiocat.sampling, "
+        "strendabiocat.vessels_and_mixing"
+    ),
+    "lazy, package": "import strendabiocat",
+    "lazy, one model": "from strendabiocat import KineticParameters",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def cold_import(statement: str) -> float:
+    """Runs a statement in a fresh interpreter and returns its duration in seconds
+
+    Args:
+        statement (str): The import statement to time
+
+    Returns:
+        float: The duration of the statement
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(statement=statement)],
+        cwd=PACKAGE_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'case':<24}{'median [ms]':>14}{'min [ms]':>12}")
+
+    for name, statement in CASES.items():
+        timings = [cold_import(statement) * 1e3 for _ in range(args.repeat)]
+        print(f"{name:<24}{statistics.median(timings):>14.1f}{min(timings):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
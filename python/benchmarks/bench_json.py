@@ -0,0 +1,84 @@
+"""Throughput benchmark of the JSON backend
+
+Encodes `KineticParameters` and `MechanicallyImpelledMixing` records once
+through pydantic's `model_dump_json` and once through `dumps`, per record
+and as one array, and decodes the JSON-LD documents once with the standard
+library and once with `loads`. Both encoders must produce the same bytes.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_json.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import time
+
+from bench_trusted import kinetic_parameters, mechanically_impelled_mixing
+
+from strendabiocat.results import KineticParameters
+from strendabiocat.serialization import JSON_BACKEND, dumps, loads
+from strendabiocat.vessels_and_mixing import MechanicallyImpelledMixing
+
+
+def timed(function, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"backend: {JSON_BACKEND}")
+    print(
+        f"{'model':<28}{'step':<8}{'default [rec/s]':>18}"
+        f"{'backend [rec/s]':>18}{'MB/s':>8}"
+    )
+
+    for model, build in (
+        (KineticParameters, kinetic_parameters),
+        (MechanicallyImpelledMixing, mechanically_impelled_mixing),
+    ):
+        items = [build(i) for i in range(args.count)]
+
+        default, expected = timed(
+            lambda: [item.model_dump_json(by_alias=True).encode() for item in items]
+        )
+        backend, encoded = timed(lambda: [dumps(item) for item in items])
+
+        assert encoded == expected, "JSON backend output differs from pydantic"
+
+        size = sum(map(len, encoded)) / 1e6
+        print(
+            f"{model.__name__:<28}{'dumps':<8}{args.count / default:>18,.0f}"
+            f"{args.count / backend:>18,.0f}{size / backend:>8.0f}"
+        )
+
+        default, expected = timed(
+            lambda: b"["
+            + b",".join(item.model_dump_json(by_alias=True).encode() for item in items)
+            + b"]"
+        )
+        backend, array = timed(dumps, items)
+
+        assert array == expected, "JSON backend output differs from pydantic"
+
+        print(
+            f"{'':<28}{'dumps[]':<8}{args.count / default:>18,.0f}"
+            f"{args.count / backend:>18,.0f}{size / backend:>8.0f}"
+        )
+
+        default, _ = timed(lambda: [json.loads(line) for line in encoded])
+        backend, _ = timed(lambda: [loads(line) for line in encoded])
+
+        print(
+            f"{'':<28}{'loads':<8}{args.count / default:>18,.0f}"
+            f"{args.count / backend:>18,.0f}{size / backend:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Query benchmark of the minimizer index
+
+Indexes the variants of several parent enzymes and looks up the variants
+of one parent, once by comparing the minimizers of all variants
+and once through `KmerIndex.query`. Both must find the same variants.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_kmers.py [--count N] [--parents N] [--threshold T]
+"""
+
+from __future__ import annotations
+import argparse
+import random
+import time
+
+from bench_sequences import parent, variant
+
+from strendabiocat.kmers import KmerIndex, minimizers
+
+
+class Variant:
+    def __init__(self, sequence: str):
+        self.sequence_amino_acid = sequence
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--parents", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    parents = [parent(seed=seed) for seed in range(args.parents)]
+    variants = [
+        Variant(variant(parents[i % args.parents], rng.randint(1, 10), rng))
+        for i in range(args.count)
+    ]
+
+    start = time.perf_counter()
+    index = KmerIndex(variants)
+    build = time.perf_counter() - start
+
+    query = minimizers(parents[0])
+    sets = [minimizers(item.sequence_amino_acid) for item in variants]
+
+    start = time.perf_counter()
+    expected = {
+        position
+        for position, found in enumerate(sets)
+        if len(query & found) / len(query | found) >= args.threshold
+    }
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = index.query(parents[0], args.threshold)
+    lookup = time.perf_counter() - start
+
+    found = {id(item) for item, _ in matches}
+    assert found == {id(variants[position]) for position in expected}, "Results differ"
+
+    print(f"{'build':<8}{build * 1e3:>10.1f} ms for {args.count:,} variants")
+    print(f"{'scan':<8}{scan * 1e3:>10.1f} ms, {len(expected):,} matches")
+    print(f"{'index':<8}{lookup * 1e3:>10.1f} ms, {len(matches):,} matches")
+
+
+if __name__ == "__main__":
+    main()
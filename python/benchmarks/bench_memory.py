@@ -0,0 +1,85 @@
+"""Memory benchmark for the shared JSON-LD defaults
+
+Builds many `SamplingDescription` time points and reports the traced
+bytes per instance, once with the shared JSON-LD context and types and
+once with a private context and type list per instance, which is what
+every instance used to allocate.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_memory.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import gc
+import tracemalloc
+
+from strendabiocat.sampling import SamplingDescription
+
+
+def record(time: float) -> dict:
+    return {
+        "volume_per_sample": 0.1,
+        "volume_per_sample_unit": "mL",
+        "mixing_during_sampling": "stirred",
+        "vessel_opened_for_sampling": "yes",
+        "gas_phase": "air",
+        "time": time,
+    }
+
+
+def shared(count: int) -> list[SamplingDescription]:
+    return [SamplingDescription(**record(float(i))) for i in range(count)]
+
+
+def per_instance(count: int) -> list[SamplingDescription]:
+    return [
+        SamplingDescription(
+            **record(float(i)),
+            ld_type=["stbc:SamplingDescription"],
+            ld_context={"stbc": "https://www.github.com/my/repo/"},
+        )
+        for i in range(count)
+    ]
+
+
+def bytes_per_instance(build, count: int) -> float:
+    """Returns the traced memory that a list of instances holds per instance
+
+    Args:
+        build: Function building the list of instances
+        count (int): The number of instances to build
+
+    Returns:
+        float: The bytes held per instance
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    instances = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del instances
+
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Warm up validators and interned defaults outside of the traced region
+    shared(10), per_instance(10)
+
+    baseline = bytes_per_instance(per_instance, args.count)
+    flyweight = bytes_per_instance(shared, args.count)
+
+    print(f"{'per-instance defaults':<24}{baseline:>10.0f} bytes/instance")
+    print(f"{'shared defaults':<24}{flyweight:>10.0f} bytes/instance")
+    print(f"{'saved':<24}{baseline - flyweight:>10.0f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Throughput benchmark of derived molecular weights
+
+Derives the molecular weight of `BiocatalystSelfProduced` variants from
+their packed amino acid sequences, once per record by summing the residue
+masses of the decoded sequence and once for the whole collection through
+`derived_molecular_weights`. Both must give the same weights.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_molecular_weight.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import time
+
+import numpy as np
+from bench_sequences import self_produced
+
+from strendabiocat.biocatalyst import BiocatalystSelfProduced
+from strendabiocat.molecular_weight import (
+    RESIDUE_MASSES,
+    WATER_MASS,
+    derived_molecular_weights,
+)
+
+
+def molecular_weight(sequence) -> float:
+    return sum(RESIDUE_MASSES[residue] for residue in str(sequence)) + WATER_MASS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    items = [BiocatalystSelfProduced(**self_produced(i)) for i in range(args.count)]
+
+    start = time.perf_counter()
+    expected = [molecular_weight(item.sequence_amino_acid) for item in items]
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    weights = derived_molecular_weights(items, "Da")
+    batch = time.perf_counter() - start
+
+    assert np.allclose(weights, expected), "Batch weights differ"
+
+    print(f"{'path':<12}{'[rec/s]':>16}")
+    print(f"{'per record':<12}{args.count / single:>16,.0f}")
+    print(f"{'batch':<12}{args.count / batch:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
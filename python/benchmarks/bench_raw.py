@@ -0,0 +1,74 @@
+"""Throughput benchmark of raw-document validation
+
+Validates dumped `KineticParameters` and `MechanicallyImpelledMixing`
+records once by building the pydantic model and once through the
+validators compiled from the packaged JSON Schemas, per document and in bulk.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_raw.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import time
+
+from bench_trusted import kinetic_parameters, mechanically_impelled_mixing
+
+from strendabiocat.results import KineticParameters
+from strendabiocat.schemas import validate_raw, validate_raw_many
+from strendabiocat.validation import validate_many
+from strendabiocat.vessels_and_mixing import MechanicallyImpelledMixing
+
+
+def throughput(check, rows: list[dict]) -> float:
+    start = time.perf_counter()
+    check(rows)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'model':<28}{'step':<8}{'pydantic [rec/s]':>18}"
+        f"{'raw [rec/s]':>14}{'speedup':>10}"
+    )
+
+    for model, build, schema in (
+        (KineticParameters, kinetic_parameters, "results/KineticParameters"),
+        (
+            MechanicallyImpelledMixing,
+            mechanically_impelled_mixing,
+            "vessels_and_mixing/MechanicallyImpelledMixing",
+        ),
+    ):
+        rows = [build(i).model_dump(mode="json") for i in range(args.count)]
+
+        # Compile the validator outside of the timed region
+        validate_raw(schema, rows[0])
+
+        for step, pydantic, raw in (
+            (
+                "single",
+                lambda rows: [model.model_validate(row) for row in rows],
+                lambda rows: [validate_raw(schema, row) for row in rows],
+            ),
+            (
+                "bulk",
+                lambda rows: validate_many(model, rows),
+                lambda rows: validate_raw_many(schema, rows),
+            ),
+        ):
+            built = throughput(pydantic, rows)
+            checked = throughput(raw, rows)
+
+            print(
+                f"{model.__name__ if step == 'single' else '':<28}{step:<8}"
+                f"{built:>18,.0f}{checked:>14,.0f}{checked / built:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
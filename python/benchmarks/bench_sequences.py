@@ -0,0 +1,138 @@
+"""Memory benchmark of packed biocatalyst sequences
+
+Builds `BiocatalystSelfProduced` variants of one parent enzyme, each with
+a few point mutations and a 5 kb plasmid, and reports the traced bytes per
+instance, once holding the sequences as strings through `model_construct`
+and once packed by validation. Also times packing, decoding, the first
+hash of a packed sequence and the attribute read of a sequence field,
+each of which decodes the whole sequence.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_sequences.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import random
+import time
+
+from bench_memory import bytes_per_instance
+
+from strendabiocat.biocatalyst import BiocatalystSelfProduced
+from strendabiocat.sequences import PackedDNA, PackedProtein
+
+RESIDUES = "ACDEFGHIKLMNPQRSTVWY"
+CODONS = {residue: "GC" + "ACGT"[i % 4] for i, residue in enumerate(RESIDUES)}
+
+
+def parent(length: int = 400, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "M" + "".join(rng.choice(RESIDUES) for _ in range(length - 1))
+
+
+def variant(sequence: str, mutations: int, rng: random.Random) -> str:
+    residues = list(sequence)
+
+    for position in rng.sample(range(1, len(residues)), mutations):
+        residues[position] = rng.choice(RESIDUES)
+
+    return "".join(residues)
+
+
+def self_produced(i: int, sequence: str | None = None) -> dict:
+    rng = random.Random(i)
+    sequence = sequence or variant(parent(), 3, rng)
+    dna = "".join(CODONS[residue] for residue in sequence)
+
+    return {
+        "name": f"variant {i}",
+        "ec_number": "1.1.1.1",
+        "molecular_weight": 44.0,
+        "molecular_weight_unit": "kDa",
+        "catalyzed_reaction": "ethanol + NAD+ = acetaldehyde + NADH",
+        "sequence_amino_acid": sequence,
+        "sequence_DNA": dna,
+        "sequence_plasmid": "ATGACC" * 600 + dna,
+        "plasmid_specifications": "pET-28a(+)",
+        "origin_organism": "Saccharomyces cerevisiae",
+        "production_organism": "Escherichia coli BL21(DE3)",
+        "posttranslational_modification": "none",
+        "purity": 95.0,
+        "purity_specification": "SDS-PAGE",
+        "purification_method": "Ni-NTA",
+        "formulation": "lyophilised",
+        "special_treatment": "none",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    def plain(count: int) -> list[BiocatalystSelfProduced]:
+        # The trusted path packs sequences like validation, so the strings
+        # are set without any conversion
+        return [
+            BiocatalystSelfProduced.model_construct(**self_produced(i))
+            for i in range(count)
+        ]
+
+    def packed(count: int) -> list[BiocatalystSelfProduced]:
+        return [BiocatalystSelfProduced(**self_produced(i)) for i in range(count)]
+
+    # Warm up validators outside of the traced region
+    plain(10), packed(10)
+
+    strings = bytes_per_instance(plain, args.count)
+    bits = bytes_per_instance(packed, args.count)
+
+    print(f"{'strings':<16}{strings:>10.0f} bytes/instance")
+    print(f"{'packed':<16}{bits:>10.0f} bytes/instance")
+
+    rows = [self_produced(i) for i in range(args.count)]
+
+    for packed_type, name in (
+        (PackedDNA, "sequence_plasmid"),
+        (PackedProtein, "sequence_amino_acid"),
+    ):
+        texts = [row[name] for row in rows]
+
+        start = time.perf_counter()
+        sequences = [packed_type(text) for text in texts]
+        pack = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = [str(sequence) for sequence in sequences]
+        decode = time.perf_counter() - start
+
+        assert decoded == texts, "Packed sequences do not round-trip"
+
+        # The hash is computed from the text on first use, then cached
+        start = time.perf_counter()
+        for sequence in sequences:
+            hash(sequence)
+        first_hash = time.perf_counter() - start
+
+        print(
+            f"{packed_type.__name__:<16}{pack / args.count * 1e6:>10.1f} us pack"
+            f"{decode / args.count * 1e6:>10.1f} us decode"
+            f"{first_hash / args.count * 1e6:>10.1f} us first hash"
+        )
+
+    # Attributes of sequence fields return the text, so packed instances
+    # decode on every read, while instances holding strings return them
+    for label, items in (
+        ("strings", plain(args.count)),
+        ("packed", packed(args.count)),
+    ):
+        start = time.perf_counter()
+        for item in items:
+            item.sequence_plasmid
+        read = time.perf_counter() - start
+
+        print(f"{label:<16}{read / args.count * 1e6:>10.1f} us attribute read")
+
+
+if __name__ == "__main__":
+    main()
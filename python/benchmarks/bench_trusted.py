@@ -0,0 +1,97 @@
+"""Throughput benchmark of trusted against validated loading
+
+Loads dumped `KineticParameters` and `MechanicallyImpelledMixing` records
+once through pydantic validation and once through the trusted
+construction path that skips validation.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_trusted.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import time
+
+from strendabiocat.results import KineticParameters
+from strendabiocat.vessels_and_mixing import MechanicallyImpelledMixing
+
+
+def kinetic_parameters(i: int) -> KineticParameters:
+    return KineticParameters(
+        michaelis_constant=0.1 + i % 50 / 10,
+        michaelis_constant_unit="mM",
+        maximum_reaction_rate=12.5,
+        maximum_reaction_rate_unit="U/mg",
+        turnover_number=31.0,
+        turnover_number_unit="1/s",
+        catalytic_efficiency=310.0,
+        catalytic_efficiency_unit="1/(mM*s)",
+        dissociation_constant=0.8,
+        dissociation_constant_unit="mM",
+        inhibition_type="competitive",
+        inhibition_constant=2.1,
+        inhibition_constant_unit="mM",
+        hill_coefficient=1.0,
+        enzyme_stability="stable for 24 h at 30 °C",
+        special_treatment="none",
+    )
+
+
+def mechanically_impelled_mixing(i: int) -> MechanicallyImpelledMixing:
+    return MechanicallyImpelledMixing(
+        stirring_type="overhead",
+        stirrer_material="stainless steel",
+        supplier="IKA",
+        number_of_stirrers=2,
+        distance_between_stirrers=40.0,
+        distance_between_stirrers_unit="mm",
+        stirrer_blade_pitch_angle=45.0,
+        number_of_stirrer_blades=4,
+        stirrer_blade_size=30.0,
+        stirrer_blade_size_unit="mm",
+        stirrer_geometry="pitched blade",
+        stirrer_speed=200.0 + i % 100,
+        speed_unit="rpm",
+        height_of_stirrer_above_vessel_base=15.0,
+        height_of_stirrer_above_vessel_base_unit="mm",
+        power_per_volume=0.5,
+        power_per_volume_unit="W/L",
+        stir_bar_size=0.0,
+        stir_bar_size_unit=0.0,
+        stir_bar_shape="none",
+        special_treatment="none",
+    )
+
+
+def throughput(load, rows: list[dict]) -> float:
+    start = time.perf_counter()
+    load(rows)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'model':<30}{'validated [rec/s]':>20}{'trusted [rec/s]':>18}{'speedup':>10}")
+
+    for model, build in (
+        (KineticParameters, kinetic_parameters),
+        (MechanicallyImpelledMixing, mechanically_impelled_mixing),
+    ):
+        rows = [build(i).model_dump(by_alias=True) for i in range(args.count)]
+
+        validated = throughput(
+            lambda rows: [model.model_validate(row) for row in rows], rows
+        )
+        trusted = throughput(model.from_trusted_many, rows)
+
+        print(
+            f"{model.__name__:<30}{validated:>20,.0f}{trusted:>18,.0f}"
+            f"{trusted / validated:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Throughput benchmark of batch unit conversion
+
+Converts the temperatures of `StorageConditions` records given in °C, K
+and °F to kelvin, once per record through `convert` and once for the whole
+collection through `convert_models`, which groups the records by unit, and
+once out of a `ColumnarCollection`. All must produce the same values.
+
+Usage, from the python directory unless the package is installed:
+    PYTHONPATH=. python benchmarks/bench_units.py [--count N]
+"""
+
+from __future__ import annotations
+import argparse
+import time
+
+import numpy as np
+
+from strendabiocat.columnar import ColumnarCollection, convert_models
+from strendabiocat.components import StorageConditions
+from strendabiocat.units import convert
+
+UNITS = ("°C", "K", "°F", "degC")
+
+
+def storage_conditions(i: int) -> StorageConditions:
+    return StorageConditions(
+        temperature=4.0 + i % 40,
+        temperature_unit=UNITS[i % len(UNITS)],
+        storage_start="2024-01-01",
+        additives="none",
+        special_treatment="none",
+    )
+
+
+def timed(function, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    items = [storage_conditions(i) for i in range(args.count)]
+
+    single, expected = timed(
+        lambda: [
+            convert(item.temperature, item.temperature_unit, "K") for item in items
+        ]
+    )
+    batch, converted = timed(convert_models, items, "temperature", "K")
+
+    assert np.allclose(converted, expected), "Batch conversion differs"
+
+    columns = ColumnarCollection.from_models(items, StorageConditions)
+    columnar, converted = timed(columns.convert, "temperature", "K")
+
+    assert np.allclose(converted, expected), "Columnar conversion differs"
+
+    print(f"{'path':<12}{'[rec/s]':>16}")
+    print(f"{'per record':<12}{args.count / single:>16,.0f}")
+    print(f"{'batch':<12}{args.count / batch:>16,.0f}")
+    print(f"{'columnar':<12}{args.count / columnar:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Python library that handles STRENDA Biocatalysis types
+
+Every model is available from the package root, e.g.
+
+    >> from strendabiocat import KineticParameters
+
+Submodules are only imported, and their models only built, on first
+access of one of their attributes (PEP 562). A service that only uses
+`results` therefore never pays for building the other categories.
+
+`StorageConditions` is defined in both `biocatalyst` and `components`
+with different fields. The package root exposes them as
+`BiocatalystStorageConditions` and `ComponentsStorageConditions`.
+"""
+
+from __future__ import annotations
+from importlib import import_module
+from typing import Any
+
+_SUBMODULES = (
+    "arrow",
+    "base",
+    "biocatalyst",
+    "columnar",
+    "compounds",
+    "components",
+    "ec_numbers",
+    "helpers",
+    "kmers",
+    "molecular_weight",
+    "ndjson",
+    "operation_mode",
+    "query",
+    "reaction_conditions",
+    "results",
+    "sampling",
+    "schemas",
+    "sequences",
+    "serialization",
+    "units",
+    "validation",
+    "vessels_and_mixing",
+    "xml",
+)
+
+# Models exported from the package root, by the module that defines them.
+# Models defined in several modules, such as StorageConditions, are only
+# exported under the aliases below.
+_MODELS: dict[str, tuple[str, ...]] = {
+    "biocatalyst": (
+        "BiocatalystPurchased",
+        "BiocatalystSelfProduced",
+        "PurifiedBiocatalyst",
+        "CrudeCellExtract",
+        "WholeCellBiocatalyst",
+        "SecretedEnzyme",
+        "CellFreeProduction",
+        "Immobilised",
+    ),
+    "components": ("Components",),
+    "operation_mode": (
+        "Batch",
+        "FedBatch",
+        "Continuous",
+        "CombinatorialMode",
+    ),
+    "reaction_conditions": (
+        "MonoliquidSystemDescription_WMRS",
+        "MultiphasicSystemDescription_WMRS",
+        "LiquidPhase_WMRS",
+        "SolidPhase_WMRS",
+        "GasPhase_WMRS",
+        "TemperatureConstant_WMRS",
+        "EventBasedTemperatureShift_WMRS",
+        "pHConstant_WMRS",
+        "EventBasedpHShift_WMRS",
+        "MonoliquidSystemDescription_TFCR",
+        "MultiphasicSystemDescription_TFCR",
+        "LiquidPhase_TFCR",
+        "SolidPhase_TFCR",
+        "GasPhase_TFCR",
+        "TemperatureConstant_TFCR",
+        "DynamicTemperature_TFCR",
+        "pHConstant_TFCR",
+        "DynamicpH_TFCR",
+    ),
+    "results": (
+        "KineticParameters",
+        "YieldAndConversion",
+        "ActivityAndInitialReactionRate",
+        "SelectivityAndSpecificity",
+        "ThermodynamicParameters",
+    ),
+    "sampling": (
+        "SamplingDescription",
+        "SamplingFromHeterogeneousReactionSolutions",
+        "SamplePreprocessing",
+    ),
+    "vessels_and_mixing": (
+        "Vial",
+        "Plate",
+        "StirredTankReactor",
+        "TubularFlowContinuousReactor",
+        "Shaking",
+        "MechanicallyImpelledMixing",
+        "LiquidOrGasImpelledMixing",
+    ),
+}
+
+# Modules whose models are exported
+_MODEL_MODULES = tuple(_MODELS)
+
+# Modules that require an optional dependency on import
+_OPTIONAL_MODULES = frozenset({"arrow", "columnar", "molecular_weight"})
+
+# Maps every lazily exported name to the submodule and attribute it refers to
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    **{name: (module, name) for module, names in _MODELS.items() for name in names},
+    "BiocatalystStorageConditions": ("biocatalyst", "StorageConditions"),
+    "ComponentsStorageConditions": ("components", "StorageConditions"),
+    "StrendaBaseModel": ("base", "StrendaBaseModel"),
+    "FilterWrapper": ("helpers", "FilterWrapper"),
+    "id_strategy": ("helpers", "id_strategy"),
+    "set_id_strategy": ("helpers", "set_id_strategy"),
+    "reset_id_strategy": ("helpers", "reset_id_strategy"),
+    "IndexedCollection": ("query", "IndexedCollection"),
+    "LazyFilter": ("query", "LazyFilter"),
+    "ColumnarCollection": ("columnar", "ColumnarCollection"),
+    "KineticParametersColumns": ("columnar", "KineticParametersColumns"),
+    "YieldAndConversionColumns": ("columnar", "YieldAndConversionColumns"),
+    "ActivityAndInitialReactionRateColumns": (
+        "columnar",
+        "ActivityAndInitialReactionRateColumns",
+    ),
+    "convert_array": ("columnar", "convert_array"),
+    "convert_models": ("columnar", "convert_models"),
+    "ComponentRegistry": ("compounds", "ComponentRegistry"),
+    "SmilesCanonicalizer": ("compounds", "SmilesCanonicalizer"),
+    "StructureIndex": ("compounds", "StructureIndex"),
+    "component_key": ("compounds", "component_key"),
+    "arrow_schema": ("arrow", "arrow_schema"),
+    "read_parquet": ("arrow", "read_parquet"),
+    "write_parquet": ("arrow", "write_parquet"),
+    "LineError": ("ndjson", "LineError"),
+    "read_ndjson": ("ndjson", "read_ndjson"),
+    "write_ndjson": ("ndjson", "write_ndjson"),
+    "validate_raw": ("schemas", "validate_raw"),
+    "validate_raw_many": ("schemas", "validate_raw_many"),
+    "dumps": ("serialization", "dumps"),
+    "loads": ("serialization", "loads"),
+    "read_xml": ("xml", "read_xml"),
+    "write_xml": ("xml", "write_xml"),
+    "ECIndex": ("ec_numbers", "ECIndex"),
+    "parse_ec": ("ec_numbers", "parse_ec"),
+    "KmerIndex": ("kmers", "KmerIndex"),
+    "check_molecular_weights": ("molecular_weight", "check_molecular_weights"),
+    "derived_molecular_weights": (
+        "molecular_weight",
+        "derived_molecular_weights",
+    ),
+    "PackedDNA": ("sequences", "PackedDNA"),
+    "PackedProtein": ("sequences", "PackedProtein"),
+    "UnitError": ("units", "UnitError"),
+    "UnitRegistry": ("units", "UnitRegistry"),
+    "parse_unit": ("units", "parse_unit"),
+    "BatchResult": ("validation", "BatchResult"),
+    "validate_many": ("validation", "validate_many"),
+}
+
+# Star imports leave out the names that need optional dependencies
+__all__ = sorted(
+    name
+    for name, (module, _) in _LAZY_ATTRIBUTES.items()
+    if module not in _OPTIONAL_MODULES
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module, attr = _LAZY_ATTRIBUTES[name]
+        value = getattr(import_module(f".{module}", __name__), attr)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name == "StorageConditions":
+        raise AttributeError(
+            "StorageConditions is ambiguous, use BiocatalystStorageConditions "
+            "or ComponentsStorageConditions"
+        )
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the resolved attribute so that later lookups bypass __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_SUBMODULES})
@@ -0,0 +1,346 @@
+from __future__ import annotations
+import json
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from os import PathLike
+from typing import Any, Iterable, Iterator, TypeVar
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Arrow and Parquet support requires pyarrow. "
+        "Install it via 'pip install strendabiocat[arrow]'"
+    ) from exc
+
+from .base import StrendaBaseModel
+from .helpers import materialize_id, shared_context, shared_types
+from .sequences import sequence_fields
+from .validation import list_adapter
+
+# Conversion of model instances to and from Arrow record batches
+Model = TypeVar("Model", bound=StrendaBaseModel)
+
+MODEL_METADATA_KEY = b"strendabiocat.model"
+
+# The JSON-LD context may hold nested term definitions, so it is stored as JSON
+_JSON_FIELDS = frozenset({"ld_context"})
+
+_ARROW_TYPES = {
+    float: pa.float64(),
+    str: pa.string(),
+    date: pa.date32(),
+    list[str]: pa.list_(pa.string()),
+}
+
+
+@lru_cache(maxsize=None)
+def arrow_schema(model: type[Model]) -> pa.Schema:
+    """Derives the Arrow schema of a model
+
+    Float fields become float64, string fields strings, dates date32 and
+    the JSON-LD types a list of strings. The JSON-LD context is stored as a
+    JSON string. Required fields are not nullable. The schema metadata
+    records the model, so that files can be checked on reading.
+
+    Args:
+        model (type[Model]): The model
+
+    Returns:
+        pa.Schema: The Arrow schema
+
+    Raises:
+        TypeError: If a field has a type without Arrow counterpart
+    """
+
+    fields = []
+
+    for name, field in model.model_fields.items():
+        if name in _JSON_FIELDS:
+            arrow_type = pa.string()
+        else:
+            try:
+                arrow_type = _ARROW_TYPES[field.annotation]
+            except (KeyError, TypeError):
+                raise TypeError(
+                    f"Field {name} of {model.__name__} has type {field.annotation}, "
+                    "which has no Arrow counterpart"
+                )
+
+        fields.append(pa.field(name, arrow_type, nullable=not field.is_required()))
+
+    return pa.schema(fields, metadata={MODEL_METADATA_KEY: _model_name(model).encode()})
+
+
+def to_record_batch(model: type[Model], items: Iterable[Model]) -> pa.RecordBatch:
+    """Converts model instances into one Arrow record batch
+
+    Args:
+        model (type[Model]): The model of the instances
+        items (Iterable[Model]): The instances
+
+    Returns:
+        pa.RecordBatch: The record batch
+    """
+
+    schema = arrow_schema(model)
+    rows = []
+
+    for item in items:
+        materialize_id(item)
+        rows.append(item.__dict__)
+
+    arrays = []
+    sequences = sequence_fields(model)
+
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+
+        if field.name in _JSON_FIELDS:
+            values = [json.dumps(value) for value in values]
+        elif field.name in sequences:
+            # Packed sequences are stored as their text
+            values = [value if value is None else str(value) for value in values]
+
+        arrays.append(pa.array(values, type=field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_record_batches(
+    model: type[Model], items: Iterable[Model], batch_size: int = 65_536
+) -> Iterator[pa.RecordBatch]:
+    """Streams model instances as Arrow record batches of bounded size
+
+    Args:
+        model (type[Model]): The model of the instances
+        items (Iterable[Model]): The instances
+        batch_size (int, optional): Rows per batch. Defaults to 65536.
+
+    Yields:
+        pa.RecordBatch: The record batches
+    """
+
+    items = iter(items)
+
+    while batch := list(islice(items, batch_size)):
+        yield to_record_batch(model, batch)
+
+
+def from_record_batch(
+    model: type[Model],
+    batch: pa.RecordBatch | pa.Table,
+    validate: bool | None = None,
+) -> list[Model]:
+    """Converts an Arrow record batch back into model instances
+
+    Batches written by this module for the same model hold validated
+    records, which are trusted and built without validating them again.
+    Any other batch is validated.
+
+    Args:
+        model (type[Model]): The model of the records
+        batch (pa.RecordBatch | pa.Table): The record batch
+        validate (bool, optional): Whether to validate the records. Defaults
+            to None, which validates unless the schema metadata names the
+            model and the columns cover all of its required fields.
+
+    Returns:
+        list[Model]: The instances
+
+    Raises:
+        ValidationError: If validate is set and a record is invalid
+    """
+
+    if validate is None:
+        validate = not _is_trusted(batch.schema, model)
+
+    rows = batch.to_pylist()
+    names = batch.schema.names
+
+    # Records of a campaign share a few JSON-LD contexts and types, which are
+    # decoded once and shared copy-on-write like the defaults of new instances
+    if "ld_context" in names:
+        contexts: dict[str, Any] = {}
+        for row in rows:
+            if (context := row["ld_context"]) is not None:
+                if (decoded := contexts.get(context)) is None:
+                    decoded = contexts[context] = shared_context(json.loads(context))
+                row["ld_context"] = decoded
+
+    if "ld_type" in names:
+        for row in rows:
+            if (types := row["ld_type"]) is not None:
+                row["ld_type"] = shared_types(*types)
+
+    if validate:
+        return list_adapter(model).validate_python(rows)
+
+    return model.from_trusted_many(rows)
+
+
+def write_parquet(
+    path: str | PathLike,
+    model: type[Model],
+    items: Iterable[Model],
+    batch_size: int = 65_536,
+    compression: str = "zstd",
+) -> int:
+    """Streams model instances into a Parquet file
+
+    Instances are converted and written one batch at a time, so memory use
+    is bounded by the batch size rather than the number of instances.
+
+    Example:
+        >> write_parquet("kinetics.parquet", KineticParameters, records)
+
+    Args:
+        path (str | PathLike): The file to write
+        model (type[Model]): The model of the instances
+        items (Iterable[Model]): The instances
+        batch_size (int, optional): Rows per batch. Defaults to 65536.
+        compression (str, optional): Parquet compression codec. Defaults to zstd.
+
+    Returns:
+        int: The number of written rows
+    """
+
+    rows = 0
+
+    with pq.ParquetWriter(path, arrow_schema(model), compression=compression) as writer:
+        for batch in iter_record_batches(model, items, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+
+    return rows
+
+
+def read_parquet(
+    path: str | PathLike,
+    model: type[Model],
+    batch_size: int = 65_536,
+    validate: bool | None = None,
+    memory_map: bool = True,
+) -> Iterator[Model]:
+    """Streams model instances out of a Parquet file
+
+    Example:
+        >> for parameters in read_parquet("kinetics.parquet", KineticParameters):
+        >>     ...
+
+    Args:
+        path (str | PathLike): The file to read
+        model (type[Model]): The model of the records
+        batch_size (int, optional): Rows per batch. Defaults to 65536.
+        validate (bool, optional): Whether to validate the records. Defaults
+            to None, which trusts files written by `write_parquet` for the
+            model and validates any other file.
+        memory_map (bool, optional): Memory-map the file. Defaults to True.
+
+    Yields:
+        Model: The instances
+
+    Raises:
+        ValueError: If the file was written for another model
+    """
+
+    parquet = pq.ParquetFile(path, memory_map=memory_map)
+    _check_model(parquet.schema_arrow, model)
+
+    if validate is None:
+        validate = not _is_trusted(parquet.schema_arrow, model)
+
+    for batch in parquet.iter_batches(batch_size=batch_size):
+        yield from from_record_batch(model, batch, validate)
+
+
+def write_ipc(
+    path: str | PathLike,
+    model: type[Model],
+    items: Iterable[Model],
+    batch_size: int = 65_536,
+) -> int:
+    """Streams model instances into an Arrow IPC (Feather v2) file
+
+    Unlike Parquet, IPC files can be memory-mapped and read without
+    decoding, which suits repeated local analysis of the same campaign.
+
+    Args:
+        path (str | PathLike): The file to write
+        model (type[Model]): The model of the instances
+        items (Iterable[Model]): The instances
+        batch_size (int, optional): Rows per batch. Defaults to 65536.
+
+    Returns:
+        int: The number of written rows
+    """
+
+    rows = 0
+
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, arrow_schema(model)) as writer:
+            for batch in iter_record_batches(model, items, batch_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+
+    return rows
+
+
+def read_ipc(
+    path: str | PathLike, model: type[Model], validate: bool | None = None
+) -> Iterator[Model]:
+    """Streams model instances out of a memory-mapped Arrow IPC file
+
+    Args:
+        path (str | PathLike): The file to read
+        model (type[Model]): The model of the records
+        validate (bool, optional): Whether to validate the records. Defaults
+            to None, which trusts files written by `write_ipc` for the model
+            and validates any other file.
+
+    Yields:
+        Model: The instances
+
+    Raises:
+        ValueError: If the file was written for another model
+    """
+
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        _check_model(reader.schema, model)
+
+        if validate is None:
+            validate = not _is_trusted(reader.schema, model)
+
+        for position in range(reader.num_record_batches):
+            yield from from_record_batch(model, reader.get_batch(position), validate)
+
+
+def _model_name(model: type) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def _check_model(schema: pa.Schema, model: type):
+    written = (schema.metadata or {}).get(MODEL_METADATA_KEY)
+
+    if written is not None and written.decode() != _model_name(model):
+        raise ValueError(
+            f"File holds {written.decode()} records, not {_model_name(model)}"
+        )
+
+
+def _is_trusted(schema: pa.Schema, model: type) -> bool:
+    # Only files written for the model hold validated records. Files without
+    # a required field would build incomplete instances.
+    written = (schema.metadata or {}).get(MODEL_METADATA_KEY)
+    required = {
+        name for name, field in model.model_fields.items() if field.is_required()
+    }
+
+    return (
+        written is not None
+        and written.decode() == _model_name(model)
+        and required <= set(schema.names)
+    )
@@ -0,0 +1,359 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Mapping, TypeVar
+from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic.fields import FieldInfo
+from pydantic_core import ErrorDetails, InitErrorDetails
+
+from .helpers import (
+    LazyIdDescriptor,
+    add_namespace,
+    materialize_id,
+    own_ld_context,
+    own_ld_type,
+    paused_gc,
+    validate_prefix,
+)
+from .sequences import SequenceDescriptor, pack_sequence, sequence_fields
+from .units import quantity_in, unit_accessor, unit_fields
+
+Model = TypeVar("Model", bound="StrendaBaseModel")
+
+# Original values of the fields changed within `bulk_edit`, keyed by instance id
+_BULK_EDITS: dict[int, dict[str, Any]] = {}
+
+
+class StrendaBaseModel(BaseModel):
+    """Common base of all STRENDA Biocatalysis models
+
+    Holds the model configuration and the JSON-LD helpers that are shared
+    by every model, so that the model modules only declare fields.
+    """
+
+    model_config: ConfigDict = ConfigDict(  # type: ignore
+        validate_assignment=True,
+    )  # type: ignore
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Resolves identifiers of the lazy ID strategy on first read
+        if "ld_id" in cls.model_fields:
+            type.__setattr__(cls, "ld_id", LazyIdDescriptor())
+
+        # Sequence fields are stored packed but read as text
+        for name in sequence_fields(cls):
+            type.__setattr__(cls, name, SequenceDescriptor(name))
+
+        # Unit-aware accessors such as `michaelis_constant_in("mM")`
+        for name in unit_fields(cls):
+            type.__setattr__(cls, f"{name}_in", unit_accessor(name))
+
+    def __setattr__(self, name: str, value: Any):
+        if _BULK_EDITS:
+            edits = _BULK_EDITS.get(id(self))
+
+            if edits is not None and name in self.__pydantic_fields__:
+                values = self.__dict__
+                if name not in edits:
+                    edits[name] = values[name]
+                values[name] = value
+                return
+
+        super().__setattr__(name, value)
+
+    @contextmanager
+    def bulk_edit(self) -> Iterator[None]:
+        """Defers assignment validation until the end of the block
+
+        Assignments within the block are stored without validation. On exit,
+        only the fields that changed are validated. If any of them is
+        invalid, or the block raises, all changes are rolled back.
+
+        Example:
+            >> with parameters.bulk_edit():
+            >>     parameters.michaelis_constant = 0.42
+            >>     parameters.michaelis_constant_unit = "mM"
+
+        Raises:
+            ValidationError: If a changed field holds an invalid value
+        """
+
+        key = id(self)
+
+        if key in _BULK_EDITS:
+            # Nested blocks are validated by the outermost one
+            yield
+            return
+
+        edits = _BULK_EDITS[key] = {}
+
+        try:
+            yield
+        except BaseException:
+            self.__dict__.update(edits)
+            raise
+        finally:
+            del _BULK_EDITS[key]
+
+        self._validate_edits(edits)
+
+    def _validate_edits(self, edits: dict[str, Any]):
+        changed = {name: self.__dict__[name] for name in edits}
+        fields_set = set(self.__pydantic_fields_set__)
+        errors = []
+
+        for name, value in changed.items():
+            try:
+                self.__pydantic_validator__.validate_assignment(self, name, value)
+            except ValidationError as exc:
+                errors.extend(exc.errors())
+
+        if errors:
+            self.__dict__.update(edits)
+            object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__, [_init_error(error) for error in errors]
+            )
+
+    @classmethod
+    def from_trusted(cls: type[Model], data: Mapping[str, Any]) -> Model:
+        """Builds an instance from already validated data without validating again
+
+        Meant for reloading records that were validated before, e.g. by the
+        own pipeline. Accepts field names as well as the JSON-LD aliases
+        `@id`, `@type` and `@context`, ignores unknown keys and fills in
+        the defaults of missing JSON-LD fields. Values are taken as they are,
+        so passing unvalidated data results in inconsistent instances.
+
+        Example:
+            >> KineticParameters.from_trusted(json.loads(line))
+
+        Args:
+            data (Mapping[str, Any]): The field values of the instance
+
+        Returns:
+            Model: The instance
+        """
+
+        return _trusted_builder(cls)(data)
+
+    @classmethod
+    def from_trusted_many(
+        cls: type[Model], rows: Iterable[Mapping[str, Any]]
+    ) -> list[Model]:
+        """Builds instances from already validated data, see `from_trusted`
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): The field values of each instance
+
+        Returns:
+            list[Model]: The instances
+        """
+
+        build = _trusted_builder(cls)
+
+        with paused_gc():
+            return [build(data) for data in rows]
+
+    # Pending identifiers of the lazy ID strategy are generated before
+    # comparing, copying or pickling, since the copies would otherwise
+    # generate an identifier of their own and compare equal until read
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, StrendaBaseModel):
+            materialize_id(self)
+            materialize_id(other)
+        return super().__eq__(other)
+
+    def __copy__(self: Model) -> Model:
+        materialize_id(self)
+        return super().__copy__()
+
+    def __deepcopy__(self: Model, memo: dict[int, Any] | None = None) -> Model:
+        materialize_id(self)
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        materialize_id(self)
+        return super().__getstate__()
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        materialize_id(self)
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        materialize_id(self)
+        return super().model_dump_json(*args, **kwargs)
+
+    def quantity_in(self, name: str, unit: str) -> float | None:
+        """Returns a float field converted to a unit
+
+        Every float field with a unit field also has an accessor of its own,
+        e.g. `KineticParameters.michaelis_constant_in`.
+
+        Example:
+            >> parameters.quantity_in("michaelis_constant", "uM")
+            >> parameters.michaelis_constant_in("uM")
+
+        Args:
+            name (str): The float field
+            unit (str): The unit to convert to
+
+        Returns:
+            float | None: The converted value, None if the field is not set
+
+        Raises:
+            AttributeError: If the field has no unit field
+            UnitError: If the units cannot be converted
+        """
+
+        return quantity_in(self, name, unit)
+
+    def set_attr_term(
+        self,
+        attr: str,
+        term: str | dict,
+        prefix: str | None = None,
+        iri: str | None = None,
+    ):
+        """Sets the term for a given attribute in the JSON-LD object
+
+        Example:
+            # Using an IRI term
+            >> obj.set_attr_term("name", "http://schema.org/givenName")
+
+            # Using a prefix and term
+            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
+
+            # Usinng a dictionary term
+            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
+
+        Args:
+            attr (str): The attribute to set the term for
+            term (str | dict): The term to set for the attribute
+
+        Raises:
+            AssertionError: If the attribute is not found in the model
+        """
+
+        assert attr in self.__class__.model_fields, (
+            f"Attribute {attr} not found in {self.__class__.__name__}"
+        )
+
+        if prefix:
+            validate_prefix(term, prefix)
+
+        add_namespace(self, prefix, iri)
+        own_ld_context(self)[attr] = term
+
+    def add_type_term(
+        self, term: str, prefix: str | None = None, iri: str | None = None
+    ):
+        """Adds a term to the @type field of the JSON-LD object
+
+        Example:
+            # Using a term
+            >> obj.add_type_term("https://schema.org/Person")
+
+            # Using a prefixed term
+            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
+
+        Args:
+            term (str): The term to add to the @type field
+            prefix (str, optional): The prefix to use for the term. Defaults to None.
+            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
+
+        Raises:
+            ValueError: If prefix is provided but iri is not
+            ValueError: If iri is provided but prefix is not
+        """
+
+        if prefix:
+            validate_prefix(term, prefix)
+
+        add_namespace(self, prefix, iri)
+        own_ld_type(self).append(term)
+
+
+def _init_error(error: ErrorDetails) -> InitErrorDetails:
+    details = InitErrorDetails(
+        type=error["type"], loc=error["loc"], input=error["input"]
+    )
+
+    if "ctx" in error:
+        details["ctx"] = error["ctx"]
+
+    return details
+
+
+_TRUSTED_BUILDERS: dict[type, Any] = {}
+
+
+def _trusted_builder(cls: type[Model]):
+    builder = _TRUSTED_BUILDERS.get(cls)
+
+    if builder is None:
+        builder = _TRUSTED_BUILDERS[cls] = _make_trusted_builder(cls)
+
+    return builder
+
+
+def _make_trusted_builder(cls: type[Model]):
+    fields: dict[str, FieldInfo] = cls.model_fields
+    names = frozenset(fields)
+    aliases = {
+        alias: name
+        for name, field in fields.items()
+        for alias in (field.alias, field.serialization_alias)
+        if alias and alias != name
+    }
+    defaults = [
+        (name, field) for name, field in fields.items() if not field.is_required()
+    ]
+    sequences = tuple(sequence_fields(cls).items())
+
+    def field_values(data: Mapping[str, Any]) -> dict[str, Any]:
+        values = dict(data)
+
+        for alias, name in aliases.items():
+            if alias in values:
+                values[name] = values.pop(alias)
+
+        if not values.keys() <= names:
+            values = {name: value for name, value in values.items() if name in names}
+
+        # Validation packs the sequences, the trusted path has to do it here
+        for name, packed in sequences:
+            if name in values:
+                values[name] = pack_sequence(values[name], packed)
+
+        return values
+
+    if cls.__private_attributes__ or cls.__pydantic_post_init__:
+        # Leave private attributes and post-init hooks to pydantic
+        return lambda data: cls.model_construct(**field_values(data))
+
+    new = cls.__new__
+    setattr_ = object.__setattr__
+
+    def build(data: Mapping[str, Any]) -> Model:
+        values = field_values(data)
+        fields_set = set(values)
+
+        for name, field in defaults:
+            if name not in values:
+                values[name] = field.get_default(
+                    call_default_factory=True, validated_data=values
+                )
+
+        obj = new(cls)
+        setattr_(obj, "__dict__", values)
+        setattr_(obj, "__pydantic_fields_set__", fields_set)
+        setattr_(obj, "__pydantic_extra__", None)
+        setattr_(obj, "__pydantic_private__", None)
+
+        return obj
+
+    return build
@@ -0,0 +1,551 @@
+from __future__ import annotations
+from datetime import date
+from typing import Any, Generic, Iterable, Iterator, Mapping, TypeVar
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Columnar collections require numpy. "
+        "Install it via 'pip install strendabiocat[numpy]'"
+    ) from exc
+
+from .base import StrendaBaseModel
+from .helpers import materialize_id
+from .results import (
+    ActivityAndInitialReactionRate,
+    KineticParameters,
+    YieldAndConversion,
+)
+from .sequences import PackedSequence
+from .units import UnitError, UnitRegistry, registry, unit_fields
+
+# Columnar (struct-of-arrays) storage of model instances
+Model = TypeVar("Model", bound=StrendaBaseModel)
+
+
+class CategoricalColumn:
+    """String column stored as integer codes into a list of distinct values
+
+    Unit and free-text fields repeat a handful of values across millions of
+    records, so each record only costs one 32-bit code.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.categories: list[str] = []
+        self._lookup: dict[str, int] = {}
+        self.codes: np.ndarray = np.fromiter(
+            (self._code(value) for value in values), dtype=np.int32
+        )
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, categories: list[str]) -> CategoricalColumn:
+        """Builds a column from existing codes and categories without copying
+
+        Args:
+            codes (np.ndarray): Integer code of each row
+            categories (list[str]): The distinct values the codes refer to
+
+        Returns:
+            CategoricalColumn: The column
+        """
+
+        column = cls()
+        column.codes = codes
+        column.categories = categories
+        column._lookup = {value: code for code, value in enumerate(categories)}
+
+        return column
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, position: int) -> str:
+        return self.categories[self.codes[position]]
+
+    def __iter__(self) -> Iterator[str]:
+        categories = self.categories
+        return (categories[code] for code in self.codes.tolist())
+
+    def take(self, selection: np.ndarray) -> CategoricalColumn:
+        """Returns the rows selected by an index array or boolean mask
+
+        Args:
+            selection (np.ndarray): Positions or boolean mask of the rows
+
+        Returns:
+            CategoricalColumn: Column sharing the categories of this one
+        """
+
+        return CategoricalColumn.from_codes(self.codes[selection], self.categories)
+
+    def mask(self, value: str) -> np.ndarray:
+        """Returns a boolean mask of the rows holding a value
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            np.ndarray: True for every row holding the value
+        """
+
+        code = self._lookup.get(value)
+
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+
+        return self.codes == code
+
+    def _code(self, value: str) -> int:
+        code = self._lookup.get(value)
+
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+
+        return code
+
+
+class RecordView:
+    """Read-only view of one row of a columnar collection
+
+    Attribute access reads straight from the columns without building a
+    model instance. Use `to_model` to materialise the row as an instance.
+    """
+
+    __slots__ = ("_collection", "_position")
+
+    def __init__(self, collection: ColumnarCollection, position: int):
+        self._collection = collection
+        self._position = position
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._collection.columns[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._collection.model.__name__} does not have attribute {name}"
+            )
+
+        return _cell(column, self._position)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the values of the row by field name"""
+        return {
+            name: _cell(column, self._position)
+            for name, column in self._collection.columns.items()
+        }
+
+    def to_model(self) -> Model:
+        """Materialises the row as a model instance
+
+        The values were validated when the collection was built, so the
+        instance is built through the trusted construction path.
+
+        Returns:
+            Model: The instance
+        """
+
+        return self._collection.model.from_trusted(self.to_dict())
+
+
+class ColumnarCollection(Generic[Model]):
+    """Columnar collection of model instances
+
+    Stores every float field in a float64 NumPy array, every string field
+    in a `CategoricalColumn`, date fields as datetime64 and everything else,
+    such as the JSON-LD types and context, as object arrays. Aggregates
+    over a field are single vectorised NumPy calls.
+
+    Example:
+        >> columns = ColumnarCollection.from_models(records, KineticParameters)
+        >> columns.mean("michaelis_constant")
+        >> columns.percentile("turnover_number", 95)
+        >> columns[0].michaelis_constant
+
+    Types bound to a model, such as `KineticParametersColumns`, do not need
+    the model argument, see `for_model`.
+    """
+
+    model: type[Model] | None = None
+
+    def __init__(self, columns: Mapping[str, Any], model: type[Model] | None = None):
+        self.model = _resolve_model(self, model)
+        self.columns: dict[str, Any] = dict(columns)
+
+    @classmethod
+    def for_model(cls, model: type[Model]) -> type[ColumnarCollection[Model]]:
+        """Returns the columnar collection type bound to a model
+
+        Example:
+            >> ComponentsColumns = ColumnarCollection.for_model(Components)
+            >> ComponentsColumns.from_models(components)
+
+        Args:
+            model (type[Model]): The model of the records
+
+        Returns:
+            type[ColumnarCollection[Model]]: The bound collection type
+        """
+
+        bound = _BOUND_TYPES.get(model)
+
+        if bound is None:
+            bound = _BOUND_TYPES[model] = type(
+                f"{model.__name__}Columns", (cls,), {"model": model}
+            )
+
+        return bound
+
+    @classmethod
+    def from_models(
+        cls, items: Iterable[Model], model: type[Model] | None = None
+    ) -> ColumnarCollection[Model]:
+        """Builds a columnar collection from model instances
+
+        Args:
+            items (Iterable[Model]): The instances
+            model (type[Model], optional): The model of the instances. Only
+                needed if the collection type is not bound to a model.
+
+        Returns:
+            ColumnarCollection[Model]: The collection
+        """
+
+        return cls.from_rows(_rows(items), model)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Mapping[str, Any]], model: type[Model] | None = None
+    ) -> ColumnarCollection[Model]:
+        """Builds a columnar collection from validated field values
+
+        Args:
+            rows (Iterable[Mapping[str, Any]]): Field values of each record
+            model (type[Model], optional): The model of the records. Only
+                needed if the collection type is not bound to a model.
+
+        Returns:
+            ColumnarCollection[Model]: The collection
+        """
+
+        model = _resolve_model(cls, model)
+        names = list(model.model_fields)
+        values: dict[str, list[Any]] = {name: [] for name in names}
+        appenders = [(name, values[name].append) for name in names]
+
+        for row in rows:
+            for name, append in appenders:
+                append(row.get(name))
+
+        columns = {
+            name: _column(model.model_fields[name].annotation, values.pop(name))
+            for name in names
+        }
+
+        return cls(columns, model)
+
+    def __len__(self) -> int:
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, position: int) -> RecordView:
+        length = len(self)
+
+        if position < 0:
+            position += length
+        if not 0 <= position < length:
+            raise IndexError("Columnar collection index out of range")
+
+        return RecordView(self, position)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        return (RecordView(self, position) for position in range(len(self)))
+
+    def column(self, name: str) -> Any:
+        """Returns the column of a field
+
+        Float columns are NumPy arrays and can be used directly in
+        vectorised expressions, string columns are `CategoricalColumn`s.
+
+        Args:
+            name (str): The field name
+
+        Returns:
+            np.ndarray | CategoricalColumn: The column
+
+        Raises:
+            KeyError: If the model does not have the field
+        """
+
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(f"{self.model.__name__} does not have field {name}")
+
+    def take(self, selection: np.ndarray) -> ColumnarCollection[Model]:
+        """Returns the rows selected by an index array or boolean mask
+
+        Example:
+            >> fast = columns.take(columns.column("turnover_number") > 100)
+
+        Args:
+            selection (np.ndarray): Positions or boolean mask of the rows
+
+        Returns:
+            ColumnarCollection[Model]: The selected rows
+        """
+
+        columns = {
+            name: column.take(selection)
+            if isinstance(column, CategoricalColumn)
+            else column[selection]
+            for name, column in self.columns.items()
+        }
+
+        return self.__class__(columns, self.model)
+
+    def to_models(self) -> list[Model]:
+        """Materialises all rows as model instances
+
+        Returns:
+            list[Model]: The instances
+        """
+
+        return [view.to_model() for view in self]
+
+    def convert(self, name: str, unit: str, errors: str = "raise") -> np.ndarray:
+        """Returns a float field converted to one unit, see `convert_array`
+
+        Example:
+            >> columns.convert("michaelis_constant", "mM")
+
+        Args:
+            name (str): The float field
+            unit (str): The unit to convert to
+            errors (str, optional): "raise" or "nan" for values whose unit
+                cannot be converted. Defaults to "raise".
+
+        Returns:
+            np.ndarray: The converted values, aligned with the rows
+
+        Raises:
+            KeyError: If the field has no unit field
+        """
+
+        unit_field = unit_fields(self.model).get(name)
+
+        if unit_field is None:
+            raise KeyError(f"{self.model.__name__}.{name} has no unit field")
+
+        return convert_array(
+            self._floats(name), self.column(unit_field), unit, errors=errors
+        )
+
+    def min(self, name: str) -> float:
+        """Returns the smallest value of a float field, ignoring NaN"""
+        return float(np.nanmin(self._floats(name)))
+
+    def max(self, name: str) -> float:
+        """Returns the largest value of a float field, ignoring NaN"""
+        return float(np.nanmax(self._floats(name)))
+
+    def mean(self, name: str) -> float:
+        """Returns the mean of a float field, ignoring NaN"""
+        return float(np.nanmean(self._floats(name)))
+
+    def percentile(self, name: str, q: float | Iterable[float]) -> Any:
+        """Returns percentiles of a float field, ignoring NaN
+
+        Args:
+            name (str): The field name
+            q (float | Iterable[float]): Percentile or percentiles in [0, 100]
+
+        Returns:
+            float | np.ndarray: The percentile or an array of percentiles
+        """
+
+        result = np.nanpercentile(self._floats(name), q)
+        return float(result) if np.ndim(result) == 0 else result
+
+    def _floats(self, name: str) -> np.ndarray:
+        column = self.column(name)
+
+        if not (isinstance(column, np.ndarray) and column.dtype == np.float64):
+            raise TypeError(f"Field {name} of {self.model.__name__} is not a float")
+
+        return column
+
+
+def convert_array(
+    values: Iterable[float | None] | np.ndarray,
+    units: Iterable[str | None] | CategoricalColumn,
+    target: str,
+    errors: str = "raise",
+    registry: UnitRegistry = registry,
+) -> np.ndarray:
+    """Converts values given in varying units to one unit
+
+    The values are grouped by their unit string. Every distinct unit is
+    parsed and converted once, and all values are then scaled and shifted
+    in a single vectorised step. Temperatures are converted affinely.
+
+    Example:
+        >> convert_array([25.0, 300.0], ["°C", "K"], "K")
+        array([298.15, 300.  ])
+
+    Args:
+        values (Iterable[float | None] | np.ndarray): The values, None is NaN
+        units (Iterable[str | None] | CategoricalColumn): Unit of each value
+        target (str): The unit to convert to
+        errors (str, optional): "raise" or "nan" for values whose unit
+            cannot be converted, which includes missing units. Defaults to
+            "raise".
+        registry (UnitRegistry, optional): The registry parsing the units.
+            Defaults to the package registry.
+
+    Returns:
+        np.ndarray: The converted values as float64, aligned with the input
+
+    Raises:
+        UnitError: If errors is "raise" and a unit cannot be converted
+        ValueError: If values and units differ in length
+    """
+
+    if errors not in ("raise", "nan"):
+        raise ValueError(f"errors must be 'raise' or 'nan', got {errors!r}")
+
+    # None becomes NaN in the conversion to float64
+    values = np.asarray(
+        values if isinstance(values, (np.ndarray, list)) else list(values),
+        dtype=np.float64,
+    )
+    column = units if isinstance(units, CategoricalColumn) else CategoricalColumn(units)
+
+    if len(column) != len(values):
+        raise ValueError(f"Got {len(values)} values but {len(column)} units")
+
+    # One scale and shift per distinct unit, gathered by the unit codes
+    scales = np.empty(len(column.categories), dtype=np.float64)
+    shifts = np.empty(len(column.categories), dtype=np.float64)
+
+    for code, unit in enumerate(column.categories):
+        try:
+            if unit is None:
+                raise UnitError("Values without unit cannot be converted")
+            scales[code], shifts[code] = registry.conversion(unit, target)
+        except UnitError:
+            if errors == "raise" and bool(np.any(column.codes == code)):
+                raise
+            scales[code] = shifts[code] = np.nan
+
+    return values * scales[column.codes] + shifts[column.codes]
+
+
+def convert_models(
+    items: Iterable[StrendaBaseModel], name: str, unit: str, errors: str = "raise"
+) -> np.ndarray:
+    """Converts a float field of many instances to one unit
+
+    Example:
+        >> convert_models(components, "concentration", "mM")
+
+    Args:
+        items (Iterable[StrendaBaseModel]): Instances of one model
+        name (str): The float field
+        unit (str): The unit to convert to
+        errors (str, optional): "raise" or "nan" for values whose unit
+            cannot be converted. Defaults to "raise".
+
+    Returns:
+        np.ndarray: The converted values, aligned with the instances
+
+    Raises:
+        KeyError: If the field has no unit field
+    """
+
+    items = items if isinstance(items, list) else list(items)
+
+    if not items:
+        return np.empty(0, dtype=np.float64)
+
+    model = type(items[0])
+    unit_field = unit_fields(model).get(name)
+
+    if unit_field is None:
+        raise KeyError(f"{model.__name__}.{name} has no unit field")
+
+    rows = [item.__dict__ for item in items]
+
+    # Code the units within one pass instead of going through CategoricalColumn
+    lookup: dict[str | None, int] = {}
+    codes = [lookup.setdefault(row.get(unit_field), len(lookup)) for row in rows]
+    units = CategoricalColumn.from_codes(np.array(codes, dtype=np.int32), list(lookup))
+
+    return convert_array([row.get(name) for row in rows], units, unit, errors=errors)
+
+
+_BOUND_TYPES: dict[type, type] = {}
+
+
+def _rows(items: Iterable[Model]) -> Iterator[dict[str, Any]]:
+    # Pending identifiers of the lazy ID strategy are generated first, so
+    # that the column holds the identifiers the instances report
+    for item in items:
+        materialize_id(item)
+        yield item.__dict__
+
+
+def _resolve_model(target: Any, model: type[Model] | None) -> type[Model]:
+    model = model or target.model
+
+    if model is None:
+        raise TypeError(
+            "Pass the model or use a collection type bound to it, "
+            "e.g. ColumnarCollection.for_model(KineticParameters)"
+        )
+
+    return model
+
+
+def _column(annotation: Any, values: list[Any]) -> Any:
+    if annotation is float:
+        return np.array(
+            [np.nan if value is None else value for value in values], dtype=np.float64
+        )
+    elif annotation is str:
+        return CategoricalColumn(values)
+    elif annotation is date:
+        return np.array(values, dtype="datetime64[D]")
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
+
+def _cell(column: Any, position: int) -> Any:
+    value = column[position]
+
+    if isinstance(value, PackedSequence):
+        # Read as text like the attributes of the models
+        return str(value)
+    elif isinstance(column, CategoricalColumn):
+        return value
+    elif isinstance(value, np.datetime64):
+        return value.astype(date)
+    elif isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+KineticParametersColumns = ColumnarCollection.for_model(KineticParameters)
+YieldAndConversionColumns = ColumnarCollection.for_model(YieldAndConversion)
+ActivityAndInitialReactionRateColumns = ColumnarCollection.for_model(
+    ActivityAndInitialReactionRate
+)
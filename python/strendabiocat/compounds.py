@@ -0,0 +1,302 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator
+
+from .components import Components
+from .helpers import content_digest
+
+try:
+    from rdkit import Chem
+except ImportError:  # pragma: no cover
+    Chem = None
+
+# Identity and deduplication of the chemicals described by Components,
+# structure lookups through canonical SMILES if rdkit is installed
+IDENTITY_FIELDS = (
+    "smiles",
+    "persistent_identifier_PID",
+    "supplier",
+    "purity",
+    "formulation",
+)
+
+
+def component_key(component: Components) -> str:
+    """Returns a stable content hash of the chemical a component describes
+
+    Only the fields identifying the chemical are hashed, see
+    `IDENTITY_FIELDS`. Fields describing one mention of it, such as the
+    name, concentration or `@id`, are ignored, so the same batch of a
+    substrate gets the same key in every experiment and every session.
+
+    Example:
+        >> component_key(glucose) == component_key(other_glucose)
+        True
+
+    Args:
+        component (Components): The component
+
+    Returns:
+        str: The 32 character hex digest
+    """
+
+    values = component.__dict__
+
+    return content_digest(
+        (name, _normalise(values.get(name))) for name in IDENTITY_FIELDS
+    )
+
+
+class ComponentRegistry:
+    """Interns components describing the same chemical
+
+    The first component registered for a key becomes the canonical
+    instance. Every later component with the same key is resolved to it,
+    so a collection of interned components holds one instance per distinct
+    chemical however often it is mentioned, and two interned components
+    describe the same chemical exactly if they are the same object.
+
+    The canonical instance keeps the mention fields, such as the
+    concentration, of the first registration. Keep the original instances
+    where those differ per experiment.
+
+    Example:
+        >> registry = ComponentRegistry()
+        >> components = registry.intern_many(components)
+        >> len(registry), registry.mentions(components[0])
+
+    Components are hashed when registered. If a canonical instance is
+    changed in place afterwards, its key in the registry is stale.
+    """
+
+    def __init__(self, components: Iterable[Components] = ()):
+        self._components: dict[str, Components] = {}
+        self._mentions: dict[str, int] = {}
+        self.intern_many(components)
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __iter__(self) -> Iterator[Components]:
+        return iter(self._components.values())
+
+    def __contains__(self, component: Any) -> bool:
+        if isinstance(component, Components):
+            component = component_key(component)
+
+        return component in self._components
+
+    def __getitem__(self, key: str) -> Components:
+        return self._components[key]
+
+    def get(self, key: str, default: Any = None) -> Components | Any:
+        """Returns the canonical component of a key
+
+        Args:
+            key (str): The key, see `component_key`
+            default (Any, optional): Returned for unknown keys. Defaults to
+                None.
+
+        Returns:
+            Components | Any: The canonical component or the default
+        """
+
+        return self._components.get(key, default)
+
+    def intern(self, component: Components) -> Components:
+        """Registers a component and returns the canonical instance
+
+        Args:
+            component (Components): The component
+
+        Returns:
+            Components: The first registered component with the same key
+        """
+
+        key = component_key(component)
+        self._mentions[key] = self._mentions.get(key, 0) + 1
+
+        return self._components.setdefault(key, component)
+
+    def intern_many(self, components: Iterable[Components]) -> list[Components]:
+        """Registers many components, see `intern`
+
+        Args:
+            components (Iterable[Components]): The components
+
+        Returns:
+            list[Components]: The canonical instance of each component
+        """
+
+        return [self.intern(component) for component in components]
+
+    def mentions(self, component: Components | str) -> int:
+        """Returns how often a chemical was registered
+
+        Args:
+            component (Components | str): A component or its key
+
+        Returns:
+            int: The number of registrations, 0 for unknown chemicals
+        """
+
+        if isinstance(component, Components):
+            component = component_key(component)
+
+        return self._mentions.get(component, 0)
+
+
+class SmilesCanonicalizer:
+    """Memoised canonicalisation of SMILES strings
+
+    Canonicalising means parsing the molecule, which costs far more than a
+    lookup, and compound libraries repeat the same spellings many times.
+    Results are therefore kept in an LRU cache of bounded size.
+
+    The canonical form is computed by rdkit unless another function is
+    passed, such as the canonicaliser of a different toolkit.
+
+    Example:
+        >> canonicalizer = SmilesCanonicalizer()
+        >> canonicalizer("C(O)C") == canonicalizer("CCO")
+        True
+
+    Args:
+        function (Callable[[str], str], optional): Returns the canonical
+            SMILES of a SMILES string and raises ValueError for invalid
+            ones. Defaults to rdkit's canonical SMILES.
+        maxsize (int, optional): Number of cached spellings. Defaults to
+            65536.
+
+    Raises:
+        ImportError: If no function is passed and rdkit is not installed
+    """
+
+    def __init__(
+        self, function: Callable[[str], str] | None = None, maxsize: int = 65536
+    ):
+        if function is None:
+            if Chem is None:
+                raise ImportError(
+                    "Canonical SMILES require rdkit. "
+                    "Install it via 'pip install strendabiocat[rdkit]'"
+                )
+            function = _rdkit_canonical
+
+        self.function = function
+        self._cached = lru_cache(maxsize=maxsize)(function)
+
+    def __call__(self, smiles: str) -> str:
+        return self._cached(smiles)
+
+    def cache_info(self):
+        """Returns the hits, misses and size of the cache"""
+
+        return self._cached.cache_info()
+
+    def cache_clear(self):
+        """Empties the cache"""
+
+        self._cached.cache_clear()
+
+
+class StructureIndex:
+    """Hash index from canonical SMILES to the components of that structure
+
+    Every component is canonicalised once when added, so an exact-structure
+    lookup canonicalises the query, which is usually a cache hit, and is
+    answered by one dictionary access. Components whose SMILES cannot be
+    parsed are kept in `rejected` instead.
+
+    Example:
+        >> index = StructureIndex(components)
+        >> index.lookup("OCC")
+        [Components(name='ethanol', smiles='CCO', ...)]
+
+    Args:
+        components (Iterable[Components], optional): The initial components
+        canonicalizer (SmilesCanonicalizer, optional): Canonicalises the
+            SMILES. Defaults to a new rdkit canonicaliser.
+    """
+
+    def __init__(
+        self,
+        components: Iterable[Components] = (),
+        canonicalizer: SmilesCanonicalizer | None = None,
+    ):
+        self.canonicalizer = canonicalizer or SmilesCanonicalizer()
+        self.rejected: list[Components] = []
+        self._index: dict[str, list[Components]] = {}
+        self.add_many(components)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, smiles: str) -> bool:
+        try:
+            return self.canonicalizer(smiles) in self._index
+        except ValueError:
+            return False
+
+    def add(self, component: Components) -> str | None:
+        """Adds a component to the index
+
+        Args:
+            component (Components): The component
+
+        Returns:
+            str | None: The canonical SMILES, None if it could not be parsed
+        """
+
+        try:
+            canonical = self.canonicalizer(component.smiles)
+        except ValueError:
+            self.rejected.append(component)
+            return None
+
+        self._index.setdefault(canonical, []).append(component)
+        return canonical
+
+    def add_many(self, components: Iterable[Components]):
+        """Adds many components to the index, see `add`
+
+        Args:
+            components (Iterable[Components]): The components
+        """
+
+        for component in components:
+            self.add(component)
+
+    def lookup(self, smiles: str) -> list[Components]:
+        """Returns the components of the same structure as a SMILES string
+
+        Args:
+            smiles (str): The structure in any valid spelling
+
+        Returns:
+            list[Components]: The components in the order they were added
+
+        Raises:
+            ValueError: If the SMILES cannot be parsed
+        """
+
+        return list(self._index.get(self.canonicalizer(smiles), ()))
+
+    def structures(self) -> list[str]:
+        """Returns the distinct canonical SMILES of the index"""
+
+        return list(self._index)
+
+
+def _rdkit_canonical(smiles: str) -> str:
+    molecule = Chem.MolFromSmiles(smiles)
+
+    if molecule is None:
+        raise ValueError(f"Invalid SMILES {smiles!r}")
+
+    return Chem.MolToSmiles(molecule)
+
+
+def _normalise(value: Any) -> Any:
+    # Integral purities are hashed like the floats that validation produces
+    return float(value) if type(value) is int else value
@@ -0,0 +1,268 @@
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+# Hierarchical index of the EC numbers of biocatalysts
+Cls = TypeVar("Cls")
+
+_PREFIX = re.compile(r"^\s*EC[\s:]*", re.IGNORECASE)
+_LEVEL = re.compile(r"\d+|n\d+")
+
+WILDCARDS = frozenset({"*", "-"})
+
+
+@lru_cache(maxsize=65536)
+def parse_ec(text: str) -> tuple[str, ...]:
+    """Splits an EC number into its levels
+
+    Collections repeat a limited set of EC numbers, so results are cached.
+    An `EC` prefix is ignored. Levels given as `-` are unspecified, and
+    only the levels before them are returned. Preliminary serial numbers
+    such as `n1` are allowed on the last level.
+
+    Example:
+        >> parse_ec("EC 3.1.1.3")
+        ('3', '1', '1', '3')
+        >> parse_ec("1.14.-.-")
+        ('1', '14')
+
+    Args:
+        text (str): The EC number
+
+    Returns:
+        tuple[str, ...]: The specified levels, at most four
+
+    Raises:
+        ValueError: If the text is not an EC number
+    """
+
+    levels = _PREFIX.sub("", text).strip().split(".")
+
+    while levels and levels[-1] == "-":
+        levels.pop()
+
+    if (
+        not levels
+        or len(levels) > 4
+        or not all(_LEVEL.fullmatch(level) for level in levels)
+        or any(level.startswith("n") for level in levels[:3])
+    ):
+        raise ValueError(f"Invalid EC number {text!r}")
+
+    # Leading zeros would split one class into several nodes
+    return tuple(level if level[0] == "n" else str(int(level)) for level in levels)
+
+
+class ECIndex(Generic[Cls]):
+    """Trie of items by the levels of their EC number
+
+    Every node stands for an EC class, e.g. `3.1` for the esterases, and
+    counts the items in its subtree, so counts per class are read off the
+    trie without visiting the items. Queries walk down the levels of a
+    pattern, where `*` or `-` matches any class of a level and the
+    subclasses below the last level are included.
+
+    Example:
+        >> index = ECIndex(biocatalysts)
+        >> index.query("1.*")
+        >> index.query("EC 3.1.1.*")
+        >> index.counts("3.1")
+        {'3.1.1': 12, '3.1.3': 4}
+
+    Items whose EC number cannot be parsed are kept in `unparsed` and are
+    never found by a query. If the EC number of an item is changed in place
+    afterwards, the index is stale for that item.
+
+    Args:
+        items (Iterable[Cls], optional): The initial items
+        attribute (str, optional): The EC number attribute. Defaults to
+            `ec_number`.
+    """
+
+    def __init__(self, items: Iterable[Cls] = (), attribute: str = "ec_number"):
+        self.attribute = attribute
+        self.unparsed: list[Cls] = []
+        self._items: list[Cls] = []
+        self._root = _Node()
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Cls]:
+        return iter(self._items)
+
+    def __getitem__(self, position: int) -> Cls:
+        return self._items[position]
+
+    def append(self, item: Cls):
+        """Adds an item to the index
+
+        Args:
+            item (Cls): The item to add
+        """
+
+        position = len(self._items)
+        self._items.append(item)
+
+        try:
+            levels = parse_ec(getattr(item, self.attribute))
+        except (TypeError, ValueError):
+            self.unparsed.append(item)
+            return
+
+        node = self._root
+        node.count += 1
+
+        for level in levels:
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+            node.count += 1
+
+        node.positions.append(position)
+
+    def extend(self, items: Iterable[Cls]):
+        """Adds several items to the index
+
+        Args:
+            items (Iterable[Cls]): The items to add
+        """
+
+        for item in items:
+            self.append(item)
+
+    def query(self, pattern: str) -> list[Cls]:
+        """Returns the items of the EC classes matching a pattern
+
+        Example:
+            >> index.query("3.1.1.*")
+            >> index.query("1.*.1.1")
+
+        Args:
+            pattern (str): EC number whose levels may be `*` or `-`. Items
+                of subclasses below the last level are included.
+
+        Returns:
+            list[Cls]: The matching items in insertion order
+
+        Raises:
+            ValueError: If the pattern is not an EC number
+        """
+
+        positions: list[int] = []
+
+        for node in self._match(pattern):
+            node.collect(positions)
+
+        items = self._items
+        return [items[position] for position in sorted(positions)]
+
+    def count(self, pattern: str) -> int:
+        """Returns the number of items of the EC classes matching a pattern
+
+        Args:
+            pattern (str): The pattern, see `query`
+
+        Returns:
+            int: The number of matching items
+        """
+
+        return sum(node.count for node in self._match(pattern))
+
+    def counts(self, pattern: str | None = None) -> dict[str, int]:
+        """Returns the number of items per class one level below a pattern
+
+        Items classified only down to the level of the pattern, such as
+        `3.1.-.-` for the pattern `3.1`, belong to none of the subclasses.
+
+        Example:
+            >> index.counts()
+            {'1': 120, '2': 35, '3': 88}
+            >> index.counts("3.1")
+            {'3.1.1': 12, '3.1.3': 4}
+
+        Args:
+            pattern (str, optional): The pattern, see `query`. Defaults to
+                the top level classes.
+
+        Returns:
+            dict[str, int]: The item count of each subclass, by EC prefix
+        """
+
+        if pattern is None:
+            matches = [((), self._root)]
+        else:
+            matches = self._match_prefixes(pattern)
+
+        counts: dict[str, int] = {}
+
+        for prefix, node in matches:
+            for level, child in sorted(node.children.items(), key=_level_order):
+                key = ".".join((*prefix, level))
+                counts[key] = counts.get(key, 0) + child.count
+
+        return counts
+
+    def _match(self, pattern: str) -> list[_Node]:
+        return [node for _, node in self._match_prefixes(pattern)]
+
+    def _match_prefixes(self, pattern: str) -> list[tuple[tuple[str, ...], _Node]]:
+        matches = [((), self._root)]
+
+        for level in _parse_pattern(pattern):
+            if level in WILDCARDS:
+                matches = [
+                    ((*prefix, key), child)
+                    for prefix, node in matches
+                    for key, child in node.children.items()
+                ]
+            else:
+                matches = [
+                    ((*prefix, level), node.children[level])
+                    for prefix, node in matches
+                    if level in node.children
+                ]
+
+        return matches
+
+
+class _Node:
+    __slots__ = ("children", "positions", "count")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.positions: list[int] = []
+        self.count = 0
+
+    def collect(self, positions: list[int]):
+        positions.extend(self.positions)
+
+        for child in self.children.values():
+            child.collect(positions)
+
+
+def _parse_pattern(pattern: str) -> tuple[str, ...]:
+    levels = _PREFIX.sub("", pattern).strip().split(".")
+
+    # Trailing wildcards only say that all subclasses are included
+    while levels and levels[-1] in WILDCARDS:
+        levels.pop()
+
+    if len(levels) > 4 or not all(
+        level in WILDCARDS or _LEVEL.fullmatch(level) for level in levels
+    ):
+        raise ValueError(f"Invalid EC number pattern {pattern!r}")
+
+    return tuple(
+        level if level in WILDCARDS or level[0] == "n" else str(int(level))
+        for level in levels
+    )
+
+
+def _level_order(entry: tuple[str, Any]) -> tuple[int, int]:
+    # Numeric order, with preliminary serial numbers such as n1 last
+    level = entry[0]
+    return (1, int(level[1:])) if level[0] == "n" else (0, int(level))
@@ -0,0 +1,445 @@
+from __future__ import annotations
+import gc
+import gzip
+import io
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from copy import deepcopy
+from hashlib import blake2b
+from itertools import count
+from os import PathLike, fspath
+from typing import IO, Any, Callable, Generic, Iterable, Iterator, TypeVar
+from uuid import uuid4
+
+from .sequences import PackedSequence
+
+# Filter Wrapper definition used to filter a list of objects
+# based on their attributes
+Cls = TypeVar("Cls")
+
+
+class FilterWrapper(Generic[Cls]):
+    """Wrapper class to filter a list of objects based on their attributes"""
+
+    def __init__(self, collection: list[Cls], **kwargs):
+        self.collection = collection
+        self.kwargs = kwargs
+
+    def filter(self) -> list[Cls]:
+        # All keywords are checked in a single pass over the collection. Values
+        # are compared literally, so keys such as `purity__ge` and callable
+        # values are no lookups here, see `LazyFilter` for those.
+        conditions = tuple(self.kwargs.items())
+        fetch = self._fetch_attr
+
+        self.collection = [
+            item
+            for item in self.collection
+            if all(fetch(key, item) == value for key, value in conditions)
+        ]
+        return self.collection
+
+    def _fetch_attr(self, name: str, item: Cls):
+        try:
+            return getattr(item, name)
+        except AttributeError:
+            raise AttributeError(f"{item} does not have attribute {name}")
+
+
+# JSON-LD Helper Functions
+def add_namespace(obj, prefix: str | None, iri: str | None):
+    """Adds a namespace to the JSON-LD context
+
+    Args:
+        prefix (str): The prefix to add
+        iri (str): The IRI to add
+    """
+    if prefix is None and iri is None:
+        return
+    elif prefix and iri is None:
+        raise ValueError("If prefix is provided, iri must also be provided")
+    elif iri and prefix is None:
+        raise ValueError("If iri is provided, prefix must also be provided")
+
+    own_ld_context(obj)[prefix] = iri  # type: ignore
+
+
+def validate_prefix(term: str | dict, prefix: str):
+    """Validates that a term is prefixed with a given prefix
+
+    Args:
+        term (str): The term to validate
+        prefix (str): The prefix to validate against
+
+    Returns:
+        bool: True if the term is prefixed with the prefix, False otherwise
+    """
+
+    if isinstance(term, dict) and not term["@id"].startswith(prefix + ":"):
+        raise ValueError(f"Term {term} is not prefixed with {prefix}")
+    elif isinstance(term, str) and not term.startswith(prefix + ":"):
+        raise ValueError(f"Term {term} is not prefixed with {prefix}")
+
+
+# Shared JSON-LD defaults
+class SharedDict(dict):
+    """Read-only dict shared by all instances that use the same JSON-LD context
+
+    Instances hold the shared object until their context is changed through
+    `set_attr_term` or `add_namespace`, which replace it by a private copy.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Shared JSON-LD contexts are read-only, "
+            "use set_attr_term or add_namespace to change them"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (shared_context, (dict(self),))
+
+
+class SharedList(list):
+    """Read-only list shared by all instances that use the same JSON-LD types
+
+    Instances hold the shared object until a type is added through
+    `add_type_term`, which replaces it by a private copy.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "Shared JSON-LD types are read-only, use add_type_term to change them"
+        )
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return (shared_types, tuple(self))
+
+
+_SHARED_CONTEXTS: dict[tuple, SharedDict] = {}
+_SHARED_TYPES: dict[tuple, SharedList] = {}
+
+
+def shared_context(context: dict[str, Any]) -> SharedDict:
+    """Returns the interned read-only copy of a JSON-LD context
+
+    Args:
+        context (dict): The context to intern
+
+    Returns:
+        SharedDict: The shared context
+    """
+
+    key = tuple((name, repr(term)) for name, term in context.items())
+    shared = _SHARED_CONTEXTS.get(key)
+
+    if shared is None:
+        shared = _SHARED_CONTEXTS[key] = SharedDict(deepcopy(context))
+
+    return shared
+
+
+def shared_types(*types: str) -> SharedList:
+    """Returns the interned read-only list of JSON-LD types
+
+    Args:
+        *types (str): The types to intern
+
+    Returns:
+        SharedList: The shared types
+    """
+
+    shared = _SHARED_TYPES.get(types)
+
+    if shared is None:
+        shared = _SHARED_TYPES[types] = SharedList(types)
+
+    return shared
+
+
+def shared_default(default: SharedDict | SharedList) -> Callable[[], Any]:
+    """Wraps a shared JSON-LD default into a field default factory
+
+    Example:
+        >> ld_type: list[str] = Field(
+        >>     default_factory=shared_default(shared_types("stbc:Vial")),
+        >> )
+
+    Args:
+        default (SharedDict | SharedList): The shared default
+
+    Returns:
+        Callable[[], Any]: A factory returning the shared default itself
+    """
+
+    return lambda: default
+
+
+def own_ld_context(obj) -> dict:
+    """Returns the JSON-LD context of an object, detaching it from the shared one
+
+    Args:
+        obj: The model instance
+
+    Returns:
+        dict: The private, mutable context of the instance
+    """
+
+    context = obj.ld_context
+
+    if isinstance(context, SharedDict):
+        context = obj.__dict__["ld_context"] = dict(context)
+
+    return context
+
+
+def own_ld_type(obj) -> list:
+    """Returns the JSON-LD types of an object, detaching them from the shared ones
+
+    Args:
+        obj: The model instance
+
+    Returns:
+        list: The private, mutable types of the instance
+    """
+
+    types = obj.ld_type
+
+    if isinstance(types, SharedList):
+        types = obj.__dict__["ld_type"] = list(types)
+
+    return types
+
+
+@contextmanager
+def paused_gc():
+    """Pauses the cyclic garbage collector while building many instances
+
+    Model instances hold no reference cycles. Without pausing, every few
+    hundred allocations trigger a collection that traverses the whole,
+    growing batch.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@contextmanager
+def open_binary(source: Any, mode: str) -> Iterator[IO[bytes]]:
+    """Opens a path as binary stream, or passes an open binary stream through
+
+    Paths ending in `.gz` are (de)compressed. Streams passed in are not
+    closed on exit.
+
+    Args:
+        source (str | PathLike | IO[bytes]): The path or binary stream
+        mode (str): "rb" or "wb"
+
+    Raises:
+        TypeError: If a text stream is passed
+    """
+
+    if isinstance(source, io.TextIOBase):
+        raise TypeError("Streams must be opened in binary mode")
+
+    if not isinstance(source, (str, PathLike)):
+        yield source
+        return
+
+    path = fspath(source)
+    opener = gzip.open if path.endswith(".gz") else open
+
+    with opener(path, mode) as stream:
+        yield stream
+
+
+# JSON-LD identifier strategies
+ID_STRATEGIES = ("uuid4", "lazy", "counter", "content")
+
+_ID_STRATEGY: ContextVar[str] = ContextVar("strendabiocat_id_strategy", default="uuid4")
+_ID_COUNTERS: defaultdict[str, Iterator[int]] = defaultdict(lambda: count(1))
+
+
+class _PendingId(str):
+    """Prefix of an identifier that is only generated on first access"""
+
+
+class LazyIdDescriptor:
+    """Generates pending `@id` values of the lazy ID strategy on first read
+
+    Installed as `ld_id` on every model class. Being a data descriptor, it
+    takes precedence over the instance `__dict__`, while assignments are
+    still handled by pydantic.
+    """
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return materialize_id(obj)
+
+    def __set__(self, obj, value: str):
+        obj.__dict__["ld_id"] = value
+
+
+def set_id_strategy(name: str) -> Token:
+    """Sets the strategy used to generate the `@id` of new instances
+
+    Strategies:
+        uuid4: A random UUID per instance (default)
+        lazy: A random UUID that is only generated when the ID is first read
+            or the instance is serialized
+        counter: A monotonic counter per class, e.g. `stbc:Vial/42`
+        content: A hash of the field values, so equal records get equal IDs
+
+    The strategy is held in a context variable. It applies to the current
+    thread or asyncio task only: new threads, e.g. the workers of a thread
+    pool, start from the default and silently use uuid4. Set the strategy
+    within the worker, or run the worker through `contextvars.copy_context`.
+
+    Args:
+        name (str): The name of the strategy
+
+    Returns:
+        Token: Token that restores the previous strategy via `reset_id_strategy`
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+
+    if name not in ID_STRATEGIES:
+        raise ValueError(
+            f"Unknown ID strategy '{name}'. Expected one of {', '.join(ID_STRATEGIES)}"
+        )
+
+    return _ID_STRATEGY.set(name)
+
+
+def reset_id_strategy(token: Token):
+    """Restores the ID strategy that was active before `set_id_strategy`
+
+    Args:
+        token (Token): The token returned by `set_id_strategy`
+    """
+
+    _ID_STRATEGY.reset(token)
+
+
+@contextmanager
+def id_strategy(name: str):
+    """Uses an ID strategy for all instances created within the block
+
+    Example:
+        >> with id_strategy("content"):
+        >>     components = [Components(**record) for record in records]
+
+    Args:
+        name (str): The name of the strategy, see `set_id_strategy`
+    """
+
+    token = set_id_strategy(name)
+
+    try:
+        yield
+    finally:
+        reset_id_strategy(token)
+
+
+def id_factory(prefix: str) -> Callable[[dict[str, Any]], str]:
+    """Returns the `@id` default factory of a model
+
+    Args:
+        prefix (str): The prefixed class term, e.g. `stbc:Components`
+
+    Returns:
+        Callable[[dict], str]: Factory receiving the validated field values
+    """
+
+    pending = _PendingId(prefix)
+
+    def factory(data: dict[str, Any]) -> str:
+        strategy = _ID_STRATEGY.get()
+
+        if strategy == "uuid4":
+            return f"{prefix}/{uuid4()}"
+        elif strategy == "lazy":
+            return pending
+        elif strategy == "counter":
+            return f"{prefix}/{next(_ID_COUNTERS[prefix])}"
+
+        return f"{prefix}/{content_digest(_identity_values(data))}"
+
+    return factory
+
+
+def content_digest(values: Iterable[Any]) -> str:
+    """Returns a stable hex digest of a sequence of field values
+
+    Args:
+        values (Iterable[Any]): The values to hash, in a fixed order
+
+    Returns:
+        str: The 32 character hex digest
+    """
+
+    return blake2b(repr(tuple(values)).encode(), digest_size=16).hexdigest()
+
+
+def materialize_id(obj) -> str:
+    """Generates the `@id` of an instance created with the lazy ID strategy
+
+    Args:
+        obj: The model instance
+
+    Returns:
+        str: The identifier of the instance
+    """
+
+    ld_id = obj.__dict__["ld_id"]
+
+    if type(ld_id) is _PendingId:
+        ld_id = obj.__dict__["ld_id"] = f"{ld_id}/{uuid4()}"
+
+    return ld_id
+
+
+def _identity_values(data: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    # Integral floats are hashed like the floats that validation produces,
+    # and packed sequences as their text, so that constructed and validated
+    # records get the same identifier
+    return (
+        (name, _identity_value(value))
+        for name, value in sorted(data.items())
+        if not name.startswith("ld_")
+    )
+
+
+def _identity_value(value: Any) -> Any:
+    if type(value) is int:
+        return float(value)
+    elif isinstance(value, PackedSequence):
+        return str(value)
+    return value
@@ -0,0 +1,218 @@
+from __future__ import annotations
+from math import ceil
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+# Minimizer index to find near-identical sequences, such as the variants
+# of a directed-evolution campaign, without comparing all pairs
+Cls = TypeVar("Cls")
+
+
+def minimizers(sequence: Any, k: int = 5, window: int = 10) -> frozenset[str]:
+    """Returns the minimizers of a sequence
+
+    Of every `window` consecutive k-mers, the lexicographically smallest is
+    kept. Similar sequences share most of their minimizers, while a
+    sequence has far fewer minimizers than k-mers. Sequences shorter than
+    `k` are taken as a single k-mer.
+
+    Args:
+        sequence (Any): The sequence, a string or a packed sequence
+        k (int, optional): Length of the k-mers. Defaults to 5.
+        window (int, optional): Number of k-mers per window. Defaults to 10.
+
+    Returns:
+        frozenset[str]: The minimizers
+    """
+
+    sequence = str(sequence)
+    kmers = [sequence[i : i + k] for i in range(max(len(sequence) - k, 0) + 1)]
+
+    if len(kmers) <= window:
+        return frozenset((min(kmers),))
+
+    # Slide the window, rescanning it only when its minimum drops out
+    best = min(kmers[:window])
+    position = kmers.index(best, 0, window)
+    found = [best]
+
+    for end in range(window, len(kmers)):
+        kmer = kmers[end]
+
+        if position <= end - window:
+            start = end - window + 1
+            best = min(kmers[start : end + 1])
+            position = kmers.index(best, start, end + 1)
+        elif kmer < best:
+            best, position = kmer, end
+        else:
+            continue
+
+        found.append(best)
+
+    return frozenset(found)
+
+
+class KmerIndex(Generic[Cls]):
+    """Index of items by the minimizers of a sequence attribute
+
+    Every minimizer maps to the positions of the items containing it.
+    Similarity is the Jaccard index of the minimizer sets, which estimates
+    the share of k-mers two sequences have in common.
+
+    A query only looks at items sharing one of the rarest minimizers of the
+    query sequence. An item reaching the threshold must share enough of
+    the query's minimizers to include one of those. The exact similarity
+    is then computed for these candidates only.
+
+    Example:
+        >> index = KmerIndex(variants)
+        >> index.query(parent.sequence_amino_acid, threshold=0.8)
+        [(BiocatalystSelfProduced(name='variant 12', ...), 0.95), ...]
+
+    Minimizers are computed when an item is added. If the sequence of an
+    item is changed in place afterwards, the index is stale for that item.
+
+    Args:
+        items (Iterable[Cls], optional): The initial items
+        attribute (str, optional): The sequence attribute. Defaults to
+            `sequence_amino_acid`.
+        k (int, optional): Length of the k-mers. Defaults to 5.
+        window (int, optional): Number of k-mers per minimizer window.
+            Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Cls] = (),
+        attribute: str = "sequence_amino_acid",
+        k: int = 5,
+        window: int = 10,
+    ):
+        if k < 1 or window < 1:
+            raise ValueError(f"k and window must be positive, got {k}, {window}")
+
+        self.attribute = attribute
+        self.k = k
+        self.window = window
+        self._items: list[Cls] = []
+        self._minimizers: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Cls]:
+        return iter(self._items)
+
+    def __getitem__(self, position: int) -> Cls:
+        return self._items[position]
+
+    def append(self, item: Cls):
+        """Adds an item to the index
+
+        Items without a sequence are kept, but are never found by a query.
+
+        Args:
+            item (Cls): The item to add
+        """
+
+        position = len(self._items)
+        sequence = getattr(item, self.attribute)
+        found = minimizers(sequence, self.k, self.window) if sequence else frozenset()
+
+        self._items.append(item)
+        self._minimizers.append(found)
+
+        postings = self._postings
+        for minimizer in found:
+            if (positions := postings.get(minimizer)) is None:
+                postings[minimizer] = [position]
+            else:
+                positions.append(position)
+
+    def extend(self, items: Iterable[Cls]):
+        """Adds several items to the index
+
+        Args:
+            items (Iterable[Cls]): The items to add
+        """
+
+        for item in items:
+            self.append(item)
+
+    def query(self, sequence: Any, threshold: float = 0.8) -> list[tuple[Cls, float]]:
+        """Returns the items with a sequence similar to the given one
+
+        Args:
+            sequence (Any): The query sequence, a string or packed sequence
+            threshold (float, optional): Minimum Jaccard similarity of the
+                minimizer sets, in (0, 1]. Defaults to 0.8.
+
+        Returns:
+            list[tuple[Cls, float]]: The items with their similarity, most
+                similar first
+
+        Raises:
+            ValueError: If the threshold is not in (0, 1]
+        """
+
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Threshold must be in (0, 1], got {threshold}")
+
+        query = minimizers(sequence, self.k, self.window) if sequence else frozenset()
+        matches = []
+
+        for position in self._candidates(query, threshold):
+            found = self._minimizers[position]
+            shared = len(query & found)
+            similarity = shared / (len(query) + len(found) - shared)
+
+            if similarity >= threshold:
+                matches.append((position, similarity))
+
+        matches.sort(key=lambda match: (-match[1], match[0]))
+
+        items = self._items
+
+        return [(items[position], similarity) for position, similarity in matches]
+
+    def similar(self, item: Cls, threshold: float = 0.8) -> list[tuple[Cls, float]]:
+        """Returns the items similar to an item, apart from the item itself
+
+        Example:
+            >> index.similar(parent, threshold=0.9)
+
+        Args:
+            item (Cls): The item, which does not need to be in the index
+            threshold (float, optional): See `query`. Defaults to 0.8.
+
+        Returns:
+            list[tuple[Cls, float]]: The items with their similarity, most
+                similar first
+        """
+
+        return [
+            match
+            for match in self.query(getattr(item, self.attribute), threshold)
+            if match[0] is not item
+        ]
+
+    def _candidates(self, query: frozenset[str], threshold: float) -> set[int]:
+        # A Jaccard index of at least t needs at least t * |query| shared
+        # minimizers, so any |query| - ceil(t * |query|) + 1 of them contain
+        # one of the shared ones. The rarest are taken to keep the set small.
+        postings = self._postings
+        present = sorted(
+            (postings[minimizer] for minimizer in query if minimizer in postings),
+            key=len,
+        )
+        # The tolerance keeps rounding, e.g. 0.7 * 10 = 7.000000000000001,
+        # from shortening the prefix
+        prefix = len(query) - ceil(threshold * len(query) - 1e-9) + 1
+        candidates: set[int] = set()
+
+        for positions in present[:prefix]:
+            candidates.update(positions)
+
+        return candidates
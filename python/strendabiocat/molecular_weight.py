@@ -0,0 +1,258 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Molecular weight calculation requires numpy. "
+        "Install it via 'pip install strendabiocat[numpy]'"
+    ) from exc
+
+from .columnar import convert_array
+from .sequences import PackedProtein, stored_sequence
+from .units import registry
+
+# Molecular weights of proteins derived from their amino acid sequence
+WATER_MASS = 18.01528
+
+# Average masses of the residues in a peptide chain in Da, i.e. of the amino
+# acids minus one water. The ambiguity codes B, Z and J take the mean of
+# their alternatives. Stop and gap symbols have no mass.
+RESIDUE_MASSES = {
+    "A": 71.0788,
+    "R": 156.1875,
+    "N": 114.1038,
+    "D": 115.0886,
+    "C": 103.1388,
+    "E": 129.1155,
+    "Q": 128.1307,
+    "G": 57.0519,
+    "H": 137.1411,
+    "I": 113.1594,
+    "L": 113.1594,
+    "K": 128.1741,
+    "M": 131.1926,
+    "F": 147.1766,
+    "P": 97.1167,
+    "S": 87.0782,
+    "T": 101.1051,
+    "W": 186.2132,
+    "Y": 163.1760,
+    "V": 99.1326,
+    "U": 150.0388,
+    "O": 237.3018,
+    "B": 114.5962,
+    "Z": 128.6231,
+    "J": 113.1594,
+    "*": 0.0,
+    "-": 0.0,
+}
+
+
+@dataclass
+class WeightMismatch:
+    """A record whose stated molecular weight differs from the derived one
+
+    Attributes:
+        position (int): Position of the record in the checked collection
+        stated (float): The stated molecular weight in Da
+        derived (float): The molecular weight derived from the sequence in Da
+    """
+
+    position: int
+    stated: float
+    derived: float
+
+    @property
+    def deviation(self) -> float:
+        """Relative deviation of the stated from the derived weight"""
+
+        return (self.stated - self.derived) / self.derived
+
+    def __str__(self) -> str:
+        return (
+            f"record {self.position}: stated {self.stated:.1f} Da, derived "
+            f"{self.derived:.1f} Da ({self.deviation:+.1%})"
+        )
+
+
+def _mass_table() -> np.ndarray:
+    # Unknown letters, such as X or three-letter codes, make the weight NaN
+    table = np.full(256, np.nan)
+
+    for residue, mass in RESIDUE_MASSES.items():
+        table[ord(residue)] = mass
+
+    # Line breaks and spaces of pasted sequences are skipped
+    for character in " \t\r\n":
+        table[ord(character)] = 0.0
+
+    return table
+
+
+# Masses by ASCII code and by the codes of packed protein sequences
+_MASSES = _mass_table()
+_PACKED_MASSES = np.full(2**PackedProtein.BITS, np.nan)
+_PACKED_MASSES[: len(PackedProtein.ALPHABET)] = _MASSES[
+    np.frombuffer(PackedProtein.ALPHABET.encode(), dtype=np.uint8)
+]
+
+
+def molecular_weights(sequences: Iterable[Any], unit: str = "Da") -> np.ndarray:
+    """Derives the molecular weights of proteins from their sequences
+
+    All sequences are concatenated into one buffer of residue codes, whose
+    masses are looked up and summed per sequence in a single pass. Packed
+    sequences are read from their codes without decoding them. Each chain
+    adds one water for its termini.
+
+    Example:
+        >> molecular_weights(["MSKGEELFTG", "GG"], "kDa")
+        array([1.0982..., 0.1321...])
+
+    Args:
+        sequences (Iterable[Any]): Sequences in one-letter code, as strings
+            or packed sequences. None is allowed.
+        unit (str, optional): The unit of the weights. Defaults to "Da".
+
+    Returns:
+        np.ndarray: The weights, NaN for missing sequences and sequences
+            with letters of unknown mass
+    """
+
+    sequences = sequences if isinstance(sequences, list) else list(sequences)
+    packed = np.array([type(sequence) is PackedProtein for sequence in sequences])
+
+    if not packed.any():
+        weights = _text_weights(sequences)
+    else:
+        # Packed sequences are summed from their codes without decoding them
+        weights = np.empty(len(sequences))
+        weights[packed] = _packed_weights(
+            [sequences[position] for position in np.flatnonzero(packed).tolist()]
+        )
+        weights[~packed] = _text_weights(
+            [sequences[position] for position in np.flatnonzero(~packed).tolist()]
+        )
+
+    scale, shift = registry.conversion("Da", unit)
+    return weights * scale + shift
+
+
+def derived_molecular_weights(
+    items: Iterable[Any], unit: str = "kDa", attribute: str = "sequence_amino_acid"
+) -> np.ndarray:
+    """Derives the molecular weights of biocatalysts from their sequence
+
+    Example:
+        >> derived_molecular_weights(variants, "kDa")
+
+    Args:
+        items (Iterable[Any]): Instances with an amino acid sequence, such
+            as `BiocatalystSelfProduced`
+        unit (str, optional): The unit of the weights. Defaults to "kDa".
+        attribute (str, optional): The sequence attribute. Defaults to
+            `sequence_amino_acid`.
+
+    Returns:
+        np.ndarray: The weights, aligned with the items, see
+            `molecular_weights`
+    """
+
+    return molecular_weights((stored_sequence(item, attribute) for item in items), unit)
+
+
+def check_molecular_weights(
+    items: Iterable[Any], tolerance: float = 0.05
+) -> list[WeightMismatch]:
+    """Flags records whose stated molecular weight contradicts their sequence
+
+    The stated `molecular_weight` is converted from its
+    `molecular_weight_unit` and compared with the weight derived from
+    `sequence_amino_acid`. Records are skipped if either weight is
+    unknown, e.g. for an unconvertible unit or a sequence in three-letter
+    code. Tags, modifications and oligomers stated as a whole also cause
+    deviations, which the tolerance has to cover.
+
+    Example:
+        >> for mismatch in check_molecular_weights(variants, tolerance=0.1):
+        >>     print(mismatch)
+        record 12: stated 88.1 Da, derived 44.0 Da (+100.2%)
+
+    Args:
+        items (Iterable[Any]): Instances of `BiocatalystPurchased` or
+            `BiocatalystSelfProduced`
+        tolerance (float, optional): Largest accepted deviation relative to
+            the derived weight. Defaults to 0.05.
+
+    Returns:
+        list[WeightMismatch]: The records deviating beyond the tolerance
+    """
+
+    items = items if isinstance(items, list) else list(items)
+    derived = derived_molecular_weights(items, "Da")
+    stated = convert_array(
+        [item.molecular_weight for item in items],
+        [item.molecular_weight_unit for item in items],
+        "Da",
+        errors="nan",
+    )
+
+    with np.errstate(invalid="ignore"):
+        flagged = np.abs(stated - derived) > tolerance * derived
+
+    return [
+        WeightMismatch(position, float(stated[position]), float(derived[position]))
+        for position in np.flatnonzero(flagged).tolist()
+    ]
+
+
+def _text_weights(sequences: list[Any]) -> np.ndarray:
+    texts = ["" if sequence is None else str(sequence) for sequence in sequences]
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+
+    # Characters beyond ASCII become "?", which keeps the offsets and is unknown
+    codes = np.frombuffer("".join(texts).encode("ascii", "replace"), dtype=np.uint8)
+
+    return _sum_masses(_MASSES[codes], lengths)
+
+
+def _packed_weights(sequences: list[PackedProtein]) -> np.ndarray:
+    # Every 8 codes of 5 bits fill 5 bytes. Each sequence is re-encoded to
+    # a whole number of such groups, which prepends codes 0, i.e. alanines,
+    # so that the codes are read with a few shifts of 40-bit integers.
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    groups = -(-lengths // 8)
+    data = b"".join(
+        int.from_bytes(sequence.packed, "big").to_bytes(size, "big")
+        for sequence, size in zip(sequences, (groups * 5).tolist())
+    )
+
+    chunks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 5).astype(np.uint64)
+    values = chunks @ (np.uint64(1) << np.arange(32, -1, -8, dtype=np.uint64))
+    codes = (values[:, None] >> np.arange(35, -1, -5, dtype=np.uint64)) & np.uint64(31)
+
+    weights = _sum_masses(_PACKED_MASSES[codes.ravel()], groups * 8)
+
+    return weights - (groups * 8 - lengths) * _PACKED_MASSES[0]
+
+
+def _sum_masses(masses: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    # Sum per sequence as differences of the running total, which handles
+    # empty sequences unlike np.add.reduceat. Unknown masses are counted
+    # separately, since NaN would spread into all later totals.
+    unknown = np.isnan(masses)
+    totals = np.concatenate(([0.0], np.cumsum(np.where(unknown, 0.0, masses))))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    weights = totals[ends] - totals[starts] + WATER_MASS
+
+    if unknown.any():
+        counts = np.concatenate(([0], np.cumsum(unknown)))
+        weights[counts[ends] > counts[starts]] = np.nan
+
+    weights[lengths == 0] = np.nan
+
+    return weights
@@ -0,0 +1,218 @@
+from __future__ import annotations
+import warnings
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
+
+from pydantic_core import ErrorDetails
+
+from .base import StrendaBaseModel
+from .helpers import open_binary
+from .serialization import dumps, field_aliases, loads, rename_aliases
+from .validation import validate_many
+
+# Streaming newline-delimited JSON (NDJSON) input and output
+Model = TypeVar("Model", bound=StrendaBaseModel)
+
+Source = str | PathLike | IO[bytes]
+
+
+@dataclass
+class LineError:
+    """A line of an NDJSON stream that could not be turned into an instance
+
+    Attributes:
+        line (int): Line number, starting at 1
+        offset (int): Byte offset of the start of the line in the stream
+        message (str): Why the line was rejected
+        errors (list[ErrorDetails]): Validation errors of the record, empty
+            if the line is not valid JSON
+    """
+
+    line: int
+    offset: int
+    message: str
+    errors: list[ErrorDetails] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"line {self.line} (byte {self.offset}): {self.message}"
+
+
+class MalformedLineWarning(UserWarning):
+    """Issued for rejected lines if no error handler is passed"""
+
+
+def read_ndjson(
+    source: Source,
+    model: type[Model],
+    batch_size: int = 1000,
+    on_error: Callable[[LineError], Any] | None = None,
+    validate: bool = True,
+) -> Iterator[Model]:
+    """Streams model instances out of an NDJSON file
+
+    See `iter_ndjson_batches` for the handling of batches and errors.
+
+    Example:
+        >> for sample in read_ndjson("samples.ndjson", SamplingDescription):
+        >>     ...
+
+    Args:
+        source (Source): Path or binary file to read. Paths ending in `.gz`
+            are decompressed.
+        model (type[Model]): The model of the records
+        batch_size (int, optional): Records per batch. Defaults to 1000.
+        on_error (Callable[[LineError], Any], optional): Called for every
+            rejected line. Defaults to issuing a `MalformedLineWarning`.
+        validate (bool, optional): Validate the records instead of trusting
+            them. Defaults to True.
+
+    Yields:
+        Model: The instances built from the valid lines
+    """
+
+    for batch in iter_ndjson_batches(source, model, batch_size, on_error, validate):
+        yield from batch
+
+
+def iter_ndjson_batches(
+    source: Source,
+    model: type[Model],
+    batch_size: int = 1000,
+    on_error: Callable[[LineError], Any] | None = None,
+    validate: bool = True,
+) -> Iterator[list[Model]]:
+    """Streams batches of model instances out of an NDJSON file
+
+    Lines are read and validated one batch at a time through
+    `validate_many`. The next batch is only read once the consumer asks for
+    it, so memory use is bounded by the batch size and a slow consumer
+    slows down reading instead of buffering the file.
+
+    Lines that are not valid JSON or hold invalid records do not abort the
+    stream. They are passed to `on_error` as a `LineError` with their line
+    number and byte offset, so that they can be located in the file. Empty
+    lines are skipped.
+
+    Args:
+        source (Source): Path or binary file to read. Paths ending in `.gz`
+            are decompressed, offsets then refer to the decompressed stream.
+        model (type[Model]): The model of the records
+        batch_size (int, optional): Records per batch. Defaults to 1000.
+        on_error (Callable[[LineError], Any], optional): Called for every
+            rejected line. Defaults to issuing a `MalformedLineWarning`.
+        validate (bool, optional): Validate the records instead of trusting
+            them. Defaults to True.
+
+    Yields:
+        list[Model]: The instances built from the valid lines of each batch
+
+    Raises:
+        ValueError: If the batch size is not positive
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+
+    report = on_error or _warn
+    aliases = field_aliases(model)
+
+    with open_binary(source, "rb") as stream:
+        offset = 0
+        rows: list[dict[str, Any]] = []
+        positions: list[tuple[int, int]] = []
+
+        for number, line in enumerate(stream, start=1):
+            start, offset = offset, offset + len(line)
+
+            if not line.strip():
+                continue
+
+            try:
+                row = loads(line)
+            except ValueError as exc:
+                report(LineError(number, start, f"Invalid JSON, {exc}"))
+                continue
+
+            if not isinstance(row, dict):
+                report(LineError(number, start, "Expected a JSON object"))
+                continue
+
+            rows.append(rename_aliases(row, aliases))
+            positions.append((number, start))
+
+            if len(rows) == batch_size:
+                yield _build(model, rows, positions, report, validate)
+                rows, positions = [], []
+
+        if rows:
+            yield _build(model, rows, positions, report, validate)
+
+
+def write_ndjson(
+    target: Source,
+    items: Iterable[Model],
+    by_alias: bool = True,
+    batch_size: int = 1000,
+) -> int:
+    """Streams model instances into an NDJSON file
+
+    Items are consumed lazily and written in batches of serialised lines,
+    so generators of any length can be written with bounded memory.
+
+    Example:
+        >> write_ndjson("samples.ndjson", samples)
+
+    Args:
+        target (Source): Path or binary file to write. Paths ending in `.gz`
+            are compressed.
+        items (Iterable[Model]): The instances
+        by_alias (bool, optional): Use the JSON-LD keys `@id`, `@type` and
+            `@context`. Defaults to True.
+        batch_size (int, optional): Lines per write. Defaults to 1000.
+
+    Returns:
+        int: The number of written lines
+    """
+
+    written = 0
+    lines: list[bytes] = []
+
+    with open_binary(target, "wb") as stream:
+        for item in items:
+            lines.append(dumps(item, by_alias))
+            lines.append(b"\n")
+
+            if len(lines) == 2 * batch_size:
+                stream.writelines(lines)
+                written += batch_size
+                lines.clear()
+
+        stream.writelines(lines)
+        written += len(lines) // 2
+
+    return written
+
+
+def _build(
+    model: type[Model],
+    rows: list[dict[str, Any]],
+    positions: list[tuple[int, int]],
+    report: Callable[[LineError], Any],
+    validate: bool,
+) -> list[Model]:
+    if not validate:
+        return model.from_trusted_many(rows)
+
+    result = validate_many(model, rows)
+
+    for position, errors in result.errors.items():
+        number, start = positions[position]
+        fields = ", ".join(".".join(map(str, error["loc"])) for error in errors)
+        report(LineError(number, start, f"Invalid {model.__name__}: {fields}", errors))
+
+    return result.valid
+
+
+def _warn(error: LineError):
+    warnings.warn(str(error), MalformedLineWarning)
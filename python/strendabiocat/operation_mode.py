@@ -1,434 +1,127 @@
-## This is a generated file. Do not modify it manually!
+## Maintained by hand after specifications/operation_mode.md, which is no longer
+## generated into Python (see gen.toml). Keep both in sync when editing.
 
 from __future__ import annotations
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, Generic, TypeVar
+from pydantic import Field
+from typing import Optional
 from enum import Enum
-from uuid import uuid4
 from datetime import date, datetime
 
-# Filter Wrapper definition used to filter a list of objects
-# based on their attributes
-Cls = TypeVar("Cls")
-
-
-class FilterWrapper(Generic[Cls]):
-    """Wrapper class to filter a list of objects based on their attributes"""
-
-    def __init__(self, collection: list[Cls], **kwargs):
-        self.collection = collection
-        self.kwargs = kwargs
-
-    def filter(self) -> list[Cls]:
-        for key, value in self.kwargs.items():
-            self.collection = [
-                item for item in self.collection if self._fetch_attr(key, item) == value
-            ]
-        return self.collection
-
-    def _fetch_attr(self, name: str, item: Cls):
-        try:
-            return getattr(item, name)
-        except AttributeError:
-            raise AttributeError(f"{item} does not have attribute {name}")
-
-
-# JSON-LD Helper Functions
-def add_namespace(obj, prefix: str | None, iri: str | None):
-    """Adds a namespace to the JSON-LD context
-
-    Args:
-        prefix (str): The prefix to add
-        iri (str): The IRI to add
-    """
-    if prefix is None and iri is None:
-        return
-    elif prefix and iri is None:
-        raise ValueError("If prefix is provided, iri must also be provided")
-    elif iri and prefix is None:
-        raise ValueError("If iri is provided, prefix must also be provided")
-
-    obj.ld_context[prefix] = iri  # type: ignore
-
-
-def validate_prefix(term: str | dict, prefix: str):
-    """Validates that a term is prefixed with a given prefix
-
-    Args:
-        term (str): The term to validate
-        prefix (str): The prefix to validate against
-
-    Returns:
-        bool: True if the term is prefixed with the prefix, False otherwise
-    """
-
-    if isinstance(term, dict) and not term["@id"].startswith(prefix + ":"):
-        raise ValueError(f"Term {term} is not prefixed with {prefix}")
-    elif isinstance(term, str) and not term.startswith(prefix + ":"):
-        raise ValueError(f"Term {term} is not prefixed with {prefix}")
+from .base import StrendaBaseModel
+from .helpers import FilterWrapper, add_namespace, validate_prefix  # noqa: F401
+from .helpers import id_factory, shared_context, shared_default, shared_types
 
 
 # Model Definitions
 
 
-class Batch(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
+class Batch(StrendaBaseModel):
     reactor_type: str
 
     # JSON-LD fields
     ld_id: str = Field(
-        serialization_alias="@id", default_factory=lambda: "stbc:Batch/" + str(uuid4())
+        serialization_alias="@id",
+        default_factory=id_factory("stbc:Batch"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:Batch",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:Batch",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class FedBatch(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class FedBatch(StrendaBaseModel):
     reactor_type: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:FedBatch/" + str(uuid4()),
+        default_factory=id_factory("stbc:FedBatch"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:FedBatch",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:FedBatch",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class Continuous(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class Continuous(StrendaBaseModel):
     reactor_type: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:Continuous/" + str(uuid4()),
+        default_factory=id_factory("stbc:Continuous"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:Continuous",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:Continuous",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class CombinatorialMode(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class CombinatorialMode(StrendaBaseModel):
     reactor_type: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:CombinatorialMode/" + str(uuid4()),
+        default_factory=id_factory("stbc:CombinatorialMode"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:CombinatorialMode",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:CombinatorialMode",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
-
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
@@ -0,0 +1,548 @@
+from __future__ import annotations
+import math
+import operator
+from bisect import bisect_left, bisect_right
+from numbers import Real
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+# Indexed collection used to query a list of objects based on
+# their attributes without rescanning the list for every keyword
+Cls = TypeVar("Cls")
+
+
+class IndexedCollection(Generic[Cls]):
+    """Collection of objects with lazily built per-attribute hash indexes
+
+    Every attribute that is queried for the first time gets a hash index
+    mapping each value to the positions of the items carrying it. Later
+    equality lookups on that attribute are dictionary hits and composite
+    filters intersect the postings of all queried attributes instead of
+    rescanning the collection once per keyword.
+
+    Numeric attributes queried with a comparison operator additionally get
+    a sorted index, so that range queries are answered by binary search.
+
+    Example:
+        >> collection = IndexedCollection(components)
+        >> collection.filter(supplier="Sigma", formulation="powder")
+        >> collection.filter(concentration__between=(0.5, 2.0))
+
+    Indexes reflect the attribute values at the time they were built. If
+    items are mutated in place, call `invalidate` to drop the stale indexes.
+    """
+
+    def __init__(self, items: Iterable[Cls] = ()):
+        self._items: list[Cls] = list(items)
+        self._indexes: dict[str, dict[Any, set[int]]] = {}
+        self._sorted_indexes: dict[str, _SortedIndex | None] = {}
+
+    @classmethod
+    def from_trusted(cls, model: Any, rows: Iterable[Any]) -> IndexedCollection:
+        """Builds a collection of model instances from already validated data
+
+        Uses the trusted construction path of the model, which skips
+        validation, see `StrendaBaseModel.from_trusted`.
+
+        Example:
+            >> IndexedCollection.from_trusted(KineticParameters, rows)
+
+        Args:
+            model (type[StrendaBaseModel]): The model of the instances
+            rows (Iterable[Mapping]): The field values of each instance
+
+        Returns:
+            IndexedCollection: The collection of instances
+        """
+
+        return cls(model.from_trusted_many(rows))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Cls]:
+        return iter(self._items)
+
+    def __getitem__(self, position: int) -> Cls:
+        return self._items[position]
+
+    def append(self, item: Cls):
+        """Adds an item and updates all indexes that have already been built
+
+        Args:
+            item (Cls): The item to add
+        """
+
+        position = len(self._items)
+        self._items.append(item)
+
+        for name, index in self._indexes.items():
+            _add_posting(index, _fetch_attr(name, item), position)
+
+        for name, sorted_index in list(self._sorted_indexes.items()):
+            if sorted_index is None:
+                continue
+
+            value = _fetch_attr(name, item)
+            if _is_number(value):
+                sorted_index.insert(value, position)
+            else:
+                # The attribute is no longer purely numeric
+                self._sorted_indexes[name] = None
+
+    def extend(self, items: Iterable[Cls]):
+        """Adds several items and updates all indexes that have already been built
+
+        Args:
+            items (Iterable[Cls]): The items to add
+        """
+
+        for item in items:
+            self.append(item)
+
+    def filter(self, *predicates: Callable[[Cls], bool], **kwargs) -> list[Cls]:
+        """Returns all items matching the given lookups and predicates
+
+        Keyword arguments are attribute lookups of the form `attr=value` or
+        `attr__operator=value`. Supported operators are `eq`, `ne`, `lt`,
+        `le`, `gt`, `ge`, `in` and `between`, where `between` takes an
+        inclusive `(low, high)` pair. If the value of a lookup is callable,
+        it is used as a predicate on the attribute value. Positional
+        arguments are predicates that receive the whole item.
+
+        Example:
+            >> collection.filter(michaelis_constant_unit="mM")
+            >> collection.filter(michaelis_constant__lt=0.5)
+            >> collection.filter(temperature__between=(25, 37))
+            >> collection.filter(supplier__in={"Sigma", "Merck"})
+            >> collection.filter(purity=lambda purity: purity > 95)
+            >> collection.filter(lambda item: item.c_yield > item.conversion)
+
+        Returns:
+            list[Cls]: The matching items in insertion order
+
+        Raises:
+            AttributeError: If an item does not have a queried attribute
+            ValueError: If a lookup uses an unknown operator
+        """
+
+        if not predicates and not kwargs:
+            return list(self._items)
+
+        positions = self._match(predicates, kwargs)
+
+        return [self._items[position] for position in sorted(positions)]
+
+    def lazy(self, *predicates: Callable[[Cls], bool], **kwargs) -> LazyFilter[Cls]:
+        """Returns a lazy filter over the items of this collection
+
+        Accepts the same lookups and predicates as `filter`, but evaluates
+        them item by item on iteration instead of using the indexes.
+
+        Returns:
+            LazyFilter[Cls]: The lazy filter
+        """
+
+        return LazyFilter(self._items, *predicates, **kwargs)
+
+    def index(self, name: str) -> dict[Any, set[int]]:
+        """Returns the hash index of an attribute, building it on first use
+
+        Args:
+            name (str): The attribute to index
+
+        Returns:
+            dict[Any, set[int]]: Mapping of attribute values to item positions
+
+        Raises:
+            AttributeError: If an item does not have the attribute
+        """
+
+        index = self._indexes.get(name)
+
+        if index is None:
+            index = {}
+            for position, item in enumerate(self._items):
+                _add_posting(index, _fetch_attr(name, item), position)
+            self._indexes[name] = index
+
+        return index
+
+    def sorted_index(self, name: str) -> _SortedIndex | None:
+        """Returns the sorted index of a numeric attribute, building it on first use
+
+        Args:
+            name (str): The attribute to index
+
+        Returns:
+            _SortedIndex | None: The sorted index or None if the attribute
+                holds values that are not real numbers
+
+        Raises:
+            AttributeError: If an item does not have the attribute
+        """
+
+        if name in self._sorted_indexes:
+            return self._sorted_indexes[name]
+
+        values = [_fetch_attr(name, item) for item in self._items]
+
+        if all(_is_number(value) for value in values):
+            sorted_index = _SortedIndex(values)
+        else:
+            sorted_index = None
+
+        self._sorted_indexes[name] = sorted_index
+
+        return sorted_index
+
+    def invalidate(self, name: str | None = None):
+        """Drops built indexes so that they are rebuilt on the next query
+
+        Args:
+            name (str, optional): The attribute whose index to drop. Drops all
+                indexes if omitted.
+        """
+
+        if name is None:
+            self._indexes.clear()
+            self._sorted_indexes.clear()
+        else:
+            self._indexes.pop(name, None)
+            self._sorted_indexes.pop(name, None)
+
+    def _match(
+        self,
+        predicates: tuple[Callable[[Cls], bool], ...],
+        kwargs: dict[str, Any],
+    ) -> set[int]:
+        postings = []
+        checks = []
+
+        for key, value in kwargs.items():
+            name, op = parse_lookup(key, value)
+
+            if op == "pred":
+                checks.append(_attr_predicate(name, value))
+                continue
+
+            posting = self._resolve(name, op, value)
+
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        if postings:
+            # Intersecting the smallest posting first keeps every step
+            # bounded by the size of the running result
+            postings.sort(key=len)
+            positions = postings[0]
+
+            for posting in postings[1:]:
+                positions = positions & posting
+                if not positions:
+                    return set()
+        else:
+            positions = range(len(self._items))
+
+        checks.extend(predicates)
+
+        if checks:
+            positions = {
+                position
+                for position in positions
+                if all(check(self._items[position]) for check in checks)
+            }
+
+        return positions
+
+    def _resolve(self, name: str, op: str, value: Any) -> set[int]:
+        if op == "eq":
+            if _is_hashable(value) and not _is_nan(value):
+                return self.index(name).get(value, _EMPTY)
+
+            # Unhashable values such as JSON-LD types are never indexed, and
+            # NaN is scanned since it equals no attribute value
+            return self._scan(name, op, value)
+
+        if op == "in":
+            values = list(value)
+            if all(_is_hashable(entry) for entry in values):
+                index = self.index(name)
+                return set().union(*(index.get(entry, _EMPTY) for entry in values))
+            return self._scan(name, op, value)
+
+        if op == "ne":
+            if _is_hashable(value) and not _is_nan(value):
+                excluded = self.index(name).get(value, _EMPTY)
+                return set(range(len(self._items))) - excluded
+            return self._scan(name, op, value)
+
+        sorted_index = self.sorted_index(name)
+
+        if sorted_index is not None and _is_range_bound(op, value):
+            return sorted_index.range(op, value)
+
+        return self._scan(name, op, value)
+
+    def _scan(self, name: str, op: str, value: Any) -> set[int]:
+        compare = OPERATORS[op]
+        return {
+            position
+            for position, item in enumerate(self._items)
+            if compare(_fetch_attr(name, item), value)
+        }
+
+
+class LazyFilter(Generic[Cls]):
+    """Lazy, single-pass filter over an iterable of objects
+
+    All lookups and predicates are composed into one check that is applied
+    item by item while iterating, so no intermediate lists are built and
+    the source is never modified. `first`, `take` and `count` stop pulling
+    items from the source as soon as their result is known.
+
+    Example:
+        >> records = LazyFilter(read_records(path), conversion__ge=90)
+        >> records.first()
+        >> records.filter(conversion_unit="%").take(10)
+
+    The source is iterated anew on every evaluation. Lists and other
+    collections can therefore be filtered repeatedly, while generators
+    are consumed by the first evaluation.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Cls],
+        *predicates: Callable[[Cls], bool],
+        **kwargs,
+    ):
+        self.source = source
+        self._checks: tuple[Callable[[Cls], bool], ...] = (
+            *(compile_lookup(key, value) for key, value in kwargs.items()),
+            *predicates,
+        )
+
+    def __iter__(self) -> Iterator[Cls]:
+        checks = self._checks
+
+        if not checks:
+            return iter(self.source)
+        elif len(checks) == 1:
+            return filter(checks[0], self.source)
+
+        return (item for item in self.source if all(check(item) for check in checks))
+
+    def filter(self, *predicates: Callable[[Cls], bool], **kwargs) -> LazyFilter[Cls]:
+        """Returns a new lazy filter that additionally applies the given lookups
+
+        Returns:
+            LazyFilter[Cls]: The combined lazy filter
+        """
+
+        combined = LazyFilter(self.source, *predicates, **kwargs)
+        combined._checks = self._checks + combined._checks
+
+        return combined
+
+    def first(self, default: Cls | None = None) -> Cls | None:
+        """Returns the first matching item
+
+        Args:
+            default (Cls, optional): Returned if nothing matches. Defaults to None.
+
+        Returns:
+            Cls | None: The first matching item or the default
+        """
+
+        return next(iter(self), default)
+
+    def take(self, n: int) -> list[Cls]:
+        """Returns at most the first n matching items
+
+        Args:
+            n (int): The maximum number of items to return
+
+        Returns:
+            list[Cls]: The matching items
+        """
+
+        return list(islice(self, n))
+
+    def count(self, limit: int | None = None) -> int:
+        """Counts the matching items
+
+        Args:
+            limit (int, optional): Stop counting once this many matches have
+                been found. Defaults to None.
+
+        Returns:
+            int: The number of matching items, capped at the limit
+        """
+
+        return sum(1 for _ in islice(self, limit))
+
+
+class _SortedIndex:
+    """Sorted array of numeric attribute values and their item positions"""
+
+    def __init__(self, values: list[Any]):
+        pairs = sorted(
+            (value, position)
+            for position, value in enumerate(values)
+            if not math.isnan(value)
+        )
+        self.keys: list[Any] = [value for value, _ in pairs]
+        self.positions: list[int] = [position for _, position in pairs]
+
+    def insert(self, value: Any, position: int):
+        if math.isnan(value):
+            return
+
+        at = bisect_right(self.keys, value)
+        self.keys.insert(at, value)
+        self.positions.insert(at, position)
+
+    def range(self, op: str, value: Any) -> set[int]:
+        keys = self.keys
+
+        if op == "lt":
+            return set(self.positions[: bisect_left(keys, value)])
+        elif op == "le":
+            return set(self.positions[: bisect_right(keys, value)])
+        elif op == "gt":
+            return set(self.positions[bisect_right(keys, value) :])
+        elif op == "ge":
+            return set(self.positions[bisect_left(keys, value) :])
+
+        low, high = value
+        return set(self.positions[bisect_left(keys, low) : bisect_right(keys, high)])
+
+
+# Lookup operators shared by the indexed and the scanning query paths
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda attr, values: attr in values,
+    "between": lambda attr, bounds: bounds[0] <= attr <= bounds[1],
+}
+
+
+def parse_lookup(key: str, value: Any) -> tuple[str, str]:
+    """Splits a lookup keyword into the attribute name and its operator
+
+    Args:
+        key (str): The lookup keyword, e.g. `conversion__ge`
+        value (Any): The value of the lookup
+
+    Returns:
+        tuple[str, str]: The attribute name and the operator. Callable values
+            yield the `pred` operator.
+
+    Raises:
+        ValueError: If the lookup uses an unknown operator
+    """
+
+    name, separator, op = key.rpartition("__")
+
+    if not separator:
+        name, op = key, "eq"
+    elif op not in OPERATORS:
+        raise ValueError(
+            f"Unknown lookup operator '{op}' in '{key}'. "
+            f"Expected one of {', '.join(OPERATORS)}"
+        )
+
+    if callable(value):
+        if op != "eq":
+            raise ValueError(
+                f"Lookup '{key}' can not combine an operator and a predicate"
+            )
+        op = "pred"
+    elif op == "between" and len(value) != 2:
+        raise ValueError(f"Lookup '{key}' expects a (low, high) pair")
+
+    return name, op
+
+
+def compile_lookup(key: str, value: Any) -> Callable[[Any], bool]:
+    """Compiles a lookup keyword into a predicate on a single item
+
+    Example:
+        >> is_fast = compile_lookup("turnover_number__gt", 100.0)
+        >> is_fast(parameters)
+
+    Args:
+        key (str): The lookup keyword, e.g. `conversion__ge`
+        value (Any): The value of the lookup
+
+    Returns:
+        Callable[[Any], bool]: The predicate
+
+    Raises:
+        ValueError: If the lookup uses an unknown operator
+    """
+
+    name, op = parse_lookup(key, value)
+
+    if op == "pred":
+        return _attr_predicate(name, value)
+
+    compare = OPERATORS[op]
+
+    return lambda item: compare(_fetch_attr(name, item), value)
+
+
+def _attr_predicate(name: str, predicate: Callable[[Any], bool]):
+    return lambda item: predicate(_fetch_attr(name, item))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_range_bound(op: str, value: Any) -> bool:
+    if op == "between":
+        return all(_is_number(bound) and not math.isnan(bound) for bound in value)
+    return _is_number(value) and not math.isnan(value)
+
+
+def _is_nan(value: Any) -> bool:
+    # NaN equals nothing, but dict lookups match the very same NaN object
+    return _is_number(value) and math.isnan(value)
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _add_posting(index: dict[Any, set[int]], value: Any, position: int):
+    if not _is_hashable(value):
+        # Unhashable attribute values are left out of the hash index
+        return
+
+    posting = index.get(value)
+
+    if posting is None:
+        index[value] = {position}
+    else:
+        posting.add(position)
+
+
+def _fetch_attr(name: str, item: Any):
+    try:
+        return getattr(item, name)
+    except AttributeError:
+        raise AttributeError(f"{item} does not have attribute {name}")
+
+
+_EMPTY: frozenset[int] = frozenset()
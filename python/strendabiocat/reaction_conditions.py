@@ -1,83 +1,23 @@
-## This is a generated file. Do not modify it manually!
+## Maintained by hand after specifications/reaction_conditions.md, which is no longer
+## generated into Python (see gen.toml). Keep both in sync when editing.
 
 from __future__ import annotations
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, Generic, TypeVar
+from pydantic import Field
+from typing import Optional
 from enum import Enum
-from uuid import uuid4
 from datetime import date, datetime
 
-# Filter Wrapper definition used to filter a list of objects
-# based on their attributes
-Cls = TypeVar("Cls")
-
-
-class FilterWrapper(Generic[Cls]):
-    """Wrapper class to filter a list of objects based on their attributes"""
-
-    def __init__(self, collection: list[Cls], **kwargs):
-        self.collection = collection
-        self.kwargs = kwargs
-
-    def filter(self) -> list[Cls]:
-        for key, value in self.kwargs.items():
-            self.collection = [
-                item for item in self.collection if self._fetch_attr(key, item) == value
-            ]
-        return self.collection
-
-    def _fetch_attr(self, name: str, item: Cls):
-        try:
-            return getattr(item, name)
-        except AttributeError:
-            raise AttributeError(f"{item} does not have attribute {name}")
-
-
-# JSON-LD Helper Functions
-def add_namespace(obj, prefix: str | None, iri: str | None):
-    """Adds a namespace to the JSON-LD context
-
-    Args:
-        prefix (str): The prefix to add
-        iri (str): The IRI to add
-    """
-    if prefix is None and iri is None:
-        return
-    elif prefix and iri is None:
-        raise ValueError("If prefix is provided, iri must also be provided")
-    elif iri and prefix is None:
-        raise ValueError("If iri is provided, prefix must also be provided")
-
-    obj.ld_context[prefix] = iri  # type: ignore
-
-
-def validate_prefix(term: str | dict, prefix: str):
-    """Validates that a term is prefixed with a given prefix
-
-    Args:
-        term (str): The term to validate
-        prefix (str): The prefix to validate against
-
-    Returns:
-        bool: True if the term is prefixed with the prefix, False otherwise
-    """
-
-    if isinstance(term, dict) and not term["@id"].startswith(prefix + ":"):
-        raise ValueError(f"Term {term} is not prefixed with {prefix}")
-    elif isinstance(term, str) and not term.startswith(prefix + ":"):
-        raise ValueError(f"Term {term} is not prefixed with {prefix}")
+from .base import StrendaBaseModel
+from .helpers import FilterWrapper, add_namespace, validate_prefix  # noqa: F401
+from .helpers import id_factory, shared_context, shared_default, shared_types
 
 
 # Model Definitions
 
 
-class MonoliquidSystemDescription_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
+class MonoliquidSystemDescription_WMRS(StrendaBaseModel):
     solvent_description: str
-    ionic_strength: float
+    ionic_strength: float = Field(ge=0.0)
     ionic_strength_unit: str
     further_additives: str
     special_treatment: str
@@ -85,659 +25,217 @@ class MonoliquidSystemDescription_WMRS(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:MonoliquidSystemDescription_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:MonoliquidSystemDescription_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:MonoliquidSystemDescription_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:MonoliquidSystemDescription_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
 
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class MultiphasicSystemDescription_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    phases_number: float
+class MultiphasicSystemDescription_WMRS(StrendaBaseModel):
+    phases_number: float = Field(ge=0.0)
     special_treatment: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:MultiphasicSystemDescription_WMRS/"
-        + str(uuid4()),
+        default_factory=id_factory("stbc:MultiphasicSystemDescription_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:MultiphasicSystemDescription_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:MultiphasicSystemDescription_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class LiquidPhase_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class LiquidPhase_WMRS(StrendaBaseModel):
     liquid_type: str
-    liquid_amount: float
+    liquid_amount: float = Field(ge=0.0)
     liquid_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:LiquidPhase_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:LiquidPhase_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:LiquidPhase_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:LiquidPhase_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class SolidPhase_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class SolidPhase_WMRS(StrendaBaseModel):
     solid_type: str
-    solid_amount: float
+    solid_amount: float = Field(ge=0.0)
     solid_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:SolidPhase_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:SolidPhase_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:SolidPhase_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:SolidPhase_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class GasPhase_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class GasPhase_WMRS(StrendaBaseModel):
     gas_type: str
-    gas_amount: float
+    gas_amount: float = Field(ge=0.0)
     gas_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:GasPhase_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:GasPhase_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:GasPhase_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:GasPhase_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class TemperatureConstant_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
-    temperature: float
+class TemperatureConstant_WMRS(StrendaBaseModel):
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     special_treatment: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:TemperatureConstant_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:TemperatureConstant_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:TemperatureConstant_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:TemperatureConstant_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class EventBasedTemperatureShift_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class EventBasedTemperatureShift_WMRS(StrendaBaseModel):
     temperature_unit: str
-    temperature_beginning: float
-    temperature_after_event: float
+    temperature_beginning: float = Field(ge=0.0)
+    temperature_after_event: float = Field(ge=0.0)
     event_description: str
-    temperature_at_XY: float
-    time_at_XY: float
+    temperature_at_XY: float = Field(ge=0.0)
+    time_at_XY: float = Field(ge=0.0)
     time_unit: str
     special_treatment: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:EventBasedTemperatureShift_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:EventBasedTemperatureShift_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:EventBasedTemperatureShift_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:EventBasedTemperatureShift_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
 
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class pHConstant_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    pH_value: float
+class pHConstant_WMRS(StrendaBaseModel):
+    pH_value: float = Field(ge=0.0, le=14.0)
     detected_when: str
     detected_how: str
-    temperature: float
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     calibration_pH_electrode: str
     special_treatment: str
@@ -745,101 +243,38 @@ class pHConstant_WMRS(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:pHConstant_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:pHConstant_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:pHConstant_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:pHConstant_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
 
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class EventBasedpHShift_WMRS(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    pH_beginning: float
-    pH_after_event: float
+class EventBasedpHShift_WMRS(StrendaBaseModel):
+    pH_beginning: float = Field(ge=0.0, le=14.0)
+    pH_after_event: float = Field(ge=0.0, le=14.0)
     event_description: str
-    pH_at_XY: float
-    time_at_XY: float
+    pH_at_XY: float = Field(ge=0.0, le=14.0)
+    time_at_XY: float = Field(ge=0.0)
     time_unit: str
     detected_when: str
     detected_how: str
-    temperature: float
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     calibration_pH_electrode: str
     special_treatment: str
@@ -847,94 +282,31 @@ class EventBasedpHShift_WMRS(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:EventBasedpHShift_WMRS/" + str(uuid4()),
+        default_factory=id_factory("stbc:EventBasedpHShift_WMRS"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:EventBasedpHShift_WMRS",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:EventBasedpHShift_WMRS",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class MonoliquidSystemDescription_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class MonoliquidSystemDescription_TFCR(StrendaBaseModel):
     solvent_description: str
-    ionic_strength: float
+    ionic_strength: float = Field(ge=0.0)
     ionic_strength_unit: str
     further_additives: str
     Flow_rate: float
@@ -944,93 +316,30 @@ class MonoliquidSystemDescription_TFCR(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:MonoliquidSystemDescription_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:MonoliquidSystemDescription_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:MonoliquidSystemDescription_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:MonoliquidSystemDescription_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
 
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class MultiphasicSystemDescription_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    phases_number: float
+class MultiphasicSystemDescription_TFCR(StrendaBaseModel):
+    phases_number: float = Field(ge=0.0)
     Flow_rate: float
     Flow_rate_unit: str
     special_treatment: str
@@ -1038,475 +347,159 @@ class MultiphasicSystemDescription_TFCR(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:MultiphasicSystemDescription_TFCR/"
-        + str(uuid4()),
+        default_factory=id_factory("stbc:MultiphasicSystemDescription_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:MultiphasicSystemDescription_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:MultiphasicSystemDescription_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class LiquidPhase_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class LiquidPhase_TFCR(StrendaBaseModel):
     liquid_type: str
-    liquid_amount: float
+    liquid_amount: float = Field(ge=0.0)
     liquid_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:LiquidPhase_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:LiquidPhase_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:LiquidPhase_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:LiquidPhase_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class SolidPhase_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class SolidPhase_TFCR(StrendaBaseModel):
     solid_type: str
-    solid_amount: float
+    solid_amount: float = Field(ge=0.0)
     solid_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:SolidPhase_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:SolidPhase_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:SolidPhase_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:SolidPhase_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class GasPhase_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
 
+class GasPhase_TFCR(StrendaBaseModel):
     gas_type: str
-    gas_amount: float
+    gas_amount: float = Field(ge=0.0)
     gas_unit: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:GasPhase_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:GasPhase_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:GasPhase_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:GasPhase_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
 
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class TemperatureConstant_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    temperature: float
+class TemperatureConstant_TFCR(StrendaBaseModel):
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     special_treatment: str
 
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:TemperatureConstant_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:TemperatureConstant_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:TemperatureConstant_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:TemperatureConstant_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
 
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class DynamicTemperature_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    temperature_beginning: float
-    temperature_after_event: float
+class DynamicTemperature_TFCR(StrendaBaseModel):
+    temperature_beginning: float = Field(ge=0.0)
+    temperature_after_event: float = Field(ge=0.0)
     event_description: str
-    temperature_at_XY: float
-    time_at_XY: float
+    temperature_at_XY: float = Field(ge=0.0)
+    time_at_XY: float = Field(ge=0.0)
     time_unit: str
     temperature_unit: str
-    temperature_gradient_beginning: float
-    temperature_gradient_end: float
-    gradient_length: float
+    temperature_gradient_beginning: float = Field(ge=0.0)
+    temperature_gradient_end: float = Field(ge=0.0)
+    gradient_length: float = Field(ge=0.0)
     gradient_length_unit: str
     measurement_points: str
     special_treatment: str
@@ -1514,96 +507,33 @@ class DynamicTemperature_TFCR(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:DynamicTemperature_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:DynamicTemperature_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:DynamicTemperature_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:DynamicTemperature_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
 
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class pHConstant_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    pH_value: float
+class pHConstant_TFCR(StrendaBaseModel):
+    pH_value: float = Field(ge=0.0, le=14.0)
     detected_when: str
     detected_how: str
-    temperature: float
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     calibration_pH_electrode: str
     special_treatment: str
@@ -1611,106 +541,43 @@ class pHConstant_TFCR(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:pHConstant_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:pHConstant_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:pHConstant_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:pHConstant_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
 
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
 
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
-
-
-class DynamicpH_TFCR(BaseModel):
-    model_config: ConfigDict = ConfigDict(  # type: ignore
-        validate_assigment=True,
-    )  # type: ignore
-
-    pH_beginning: float
-    pH_after_event: float
+class DynamicpH_TFCR(StrendaBaseModel):
+    pH_beginning: float = Field(ge=0.0, le=14.0)
+    pH_after_event: float = Field(ge=0.0, le=14.0)
     event_description: str
-    pH_at_XY: float
-    time_at_XY: float
+    pH_at_XY: float = Field(ge=0.0, le=14.0)
+    time_at_XY: float = Field(ge=0.0)
     time_unit: str
     detected_when: str
     detected_how: str
-    temperature: float
+    temperature: float = Field(ge=0.0)
     temperature_unit: str
     calibration_pH_electrode: str
-    pH_gradient_beginning: float
-    pH_gradient_end: float
-    gradient_length: float
+    pH_gradient_beginning: float = Field(ge=0.0, le=14.0)
+    pH_gradient_end: float = Field(ge=0.0, le=14.0)
+    gradient_length: float = Field(ge=0.0)
     gradient_length_unit: str
     measurement_points: str
     special_treatment: str
@@ -1718,82 +585,23 @@ class DynamicpH_TFCR(BaseModel):
     # JSON-LD fields
     ld_id: str = Field(
         serialization_alias="@id",
-        default_factory=lambda: "stbc:DynamicpH_TFCR/" + str(uuid4()),
+        default_factory=id_factory("stbc:DynamicpH_TFCR"),
     )
     ld_type: list[str] = Field(
         serialization_alias="@type",
-        default_factory=lambda: [
-            "stbc:DynamicpH_TFCR",
-        ],
+        default_factory=shared_default(
+            shared_types(
+                "stbc:DynamicpH_TFCR",
+            )
+        ),
     )
     ld_context: dict[str, str | dict] = Field(
         serialization_alias="@context",
-        default_factory=lambda: {
-            "stbc": "https://www.github.com/my/repo/",
-        },
+        default_factory=shared_default(
+            shared_context(
+                {
+                    "stbc": "https://www.github.com/my/repo/",
+                }
+            )
+        ),
     )
-
-    def set_attr_term(
-        self,
-        attr: str,
-        term: str | dict,
-        prefix: str | None = None,
-        iri: str | None = None,
-    ):
-        """Sets the term for a given attribute in the JSON-LD object
-
-        Example:
-            # Using an IRI term
-            >> obj.set_attr_term("name", "http://schema.org/givenName")
-
-            # Using a prefix and term
-            >> obj.set_attr_term("name", "schema:givenName", "schema", "http://schema.org")
-
-            # Usinng a dictionary term
-            >> obj.set_attr_term("name", {"@id": "http://schema.org/givenName", "@type": "@id"})
-
-        Args:
-            attr (str): The attribute to set the term for
-            term (str | dict): The term to set for the attribute
-
-        Raises:
-            AssertionError: If the attribute is not found in the model
-        """
-
-        assert (
-            attr in self.model_fields
-        ), f"Attribute {attr} not found in {self.__class__.__name__}"
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_context[attr] = term
-
-    def add_type_term(
-        self, term: str, prefix: str | None = None, iri: str | None = None
-    ):
-        """Adds a term to the @type field of the JSON-LD object
-
-        Example:
-            # Using a term
-            >> obj.add_type_term("https://schema.org/Person")
-
-            # Using a prefixed term
-            >> obj.add_type_term("schema:Person", "schema", "https://schema.org/Person")
-
-        Args:
-            term (str): The term to add to the @type field
-            prefix (str, optional): The prefix to use for the term. Defaults to None.
-            iri (str, optional): The IRI to use for the term prefix. Defaults to None.
-
-        Raises:
-            ValueError: If prefix is provided but iri is not
-            ValueError: If iri is provided but prefix is not
-        """
-
-        if prefix:
-            validate_prefix(term, prefix)
-
-        add_namespace(self, prefix, iri)
-        self.ld_type.append(term)
@@ -0,0 +1,407 @@
+from __future__ import annotations
+import json
+from functools import lru_cache
+from importlib.resources import files
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+# Validation of raw documents against the JSON Schemas of schemes/json,
+# compiled once into generated Python check functions. The schemas are
+# shipped as package data, copied from schemes/json by the gen workflow.
+SCHEMA_DIR = files(__package__) / "schemes" / "json"
+
+# Keywords that only annotate a schema and are not checked
+_ANNOTATIONS = frozenset(
+    {"$schema", "$id", "$comment", "title", "description", "default", "examples"}
+)
+
+# Validation keywords this compiler does not implement. Schemas using them
+# are rejected rather than validated partially.
+_UNSUPPORTED = frozenset(
+    {
+        "$ref",
+        "allOf",
+        "anyOf",
+        "oneOf",
+        "not",
+        "if",
+        "const",
+        "format",
+        "pattern",
+        "minLength",
+        "maxLength",
+        "items",
+        "minItems",
+        "maxItems",
+        "uniqueItems",
+        "multipleOf",
+        "patternProperties",
+        "dependencies",
+        "propertyNames",
+        "minProperties",
+        "maxProperties",
+    }
+)
+
+_TYPE_CHECKS = {
+    "number": "type({v}) in _NUMBER",
+    "integer": "(type({v}) is int or type({v}) is float and {v}.is_integer())",
+    "string": "type({v}) is str",
+    "boolean": "type({v}) is bool",
+    "null": "{v} is None",
+    "object": "type({v}) is dict",
+    "array": "type({v}) is list",
+}
+
+_BOUNDS = {
+    "minimum": ">=",
+    "maximum": "<=",
+    "exclusiveMinimum": ">",
+    "exclusiveMaximum": "<",
+}
+
+
+class RawValidator:
+    """Validator of raw documents compiled from one JSON Schema
+
+    The schema is translated once into the source of three Python functions,
+    which check the documents without walking the schema on every call:
+
+    - `is_valid(obj)` short-circuits on the first violation
+    - `invalid_positions(objs)` checks a whole list within one loop
+    - `errors(obj)` lists every violation, and is only needed for rejects
+
+    Attributes:
+        name (str): The schema name, e.g. `results/KineticParameters`
+        schema (dict): The JSON Schema
+        source (str): The generated source of the check functions
+    """
+
+    def __init__(self, name: str, schema: dict[str, Any]):
+        self.name = name
+        self.schema = schema
+        self.source = _generate(schema)
+
+        namespace = {"_MISSING": _MISSING, "_NUMBER": frozenset({int, float})}
+        exec(compile(self.source, f"<schema {name}>", "exec"), namespace)
+
+        self.is_valid: Callable[[Any], bool] = namespace["is_valid"]
+        self.invalid_positions: Callable[[Sequence[Any]], list[int]] = namespace[
+            "invalid_positions"
+        ]
+        self.errors: Callable[[Any], list[str]] = namespace["errors"]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+def schema_names(directory: str | Path | None = None) -> list[str]:
+    """Returns the names of all schemas, e.g. `results/KineticParameters`
+
+    Args:
+        directory (str | Path, optional): The schema directory. Defaults to
+            the schemas shipped with the package.
+
+    Returns:
+        list[str]: The schema names
+    """
+
+    return sorted(_schema_paths(_directory(directory)))
+
+
+def raw_validator(name: str, directory: str | Path | None = None) -> RawValidator:
+    """Returns the compiled validator of a schema
+
+    Validators are compiled on first use and cached. Schemas are named by
+    their path below the schema directory without suffix, such as
+    `results/KineticParameters`. Unambiguous file names such as
+    `KineticParameters` work as well.
+
+    Args:
+        name (str): The schema name
+        directory (str | Path, optional): The schema directory. Defaults to
+            the schemas shipped with the package.
+
+    Returns:
+        RawValidator: The validator
+
+    Raises:
+        KeyError: If there is no schema of that name, or the name is ambiguous
+        NotImplementedError: If the schema uses unsupported keywords
+    """
+
+    return _compiled(name, _directory(directory))
+
+
+def is_valid_raw(schema_name: str, obj: Any) -> bool:
+    """Checks whether a raw document is valid against a schema
+
+    Example:
+        >> is_valid_raw("results/KineticParameters", json.loads(body))
+        True
+
+    Args:
+        schema_name (str): The schema name, see `raw_validator`
+        obj (Any): The decoded document
+
+    Returns:
+        bool: Whether the document is valid
+    """
+
+    return raw_validator(schema_name).is_valid(obj)
+
+
+def validate_raw(schema_name: str, obj: Any) -> list[str]:
+    """Validates a raw document against a schema without building a model
+
+    Example:
+        >> validate_raw("components/Components", {"purity": 120.0})
+        ['purity: must be <= 100.0']
+
+    Args:
+        schema_name (str): The schema name, see `raw_validator`
+        obj (Any): The decoded document
+
+    Returns:
+        list[str]: The violations, empty if the document is valid
+    """
+
+    validator = raw_validator(schema_name)
+
+    if validator.is_valid(obj):
+        return []
+
+    return validator.errors(obj)
+
+
+def validate_raw_many(schema_name: str, objs: Iterable[Any]) -> dict[int, list[str]]:
+    """Validates many raw documents against a schema
+
+    All documents are checked within one generated loop, and
+    violations are only collected for the rejected ones.
+
+    Args:
+        schema_name (str): The schema name, see `raw_validator`
+        objs (Iterable[Any]): The decoded documents
+
+    Returns:
+        dict[int, list[str]]: The violations per position of the rejected
+            documents, empty if all are valid
+    """
+
+    validator = raw_validator(schema_name)
+    objs = objs if isinstance(objs, (list, tuple)) else list(objs)
+
+    return {
+        position: validator.errors(objs[position])
+        for position in validator.invalid_positions(objs)
+    }
+
+
+def valid_mask(schema_name: str, objs: Iterable[Any]) -> list[bool]:
+    """Checks many raw documents against a schema
+
+    Args:
+        schema_name (str): The schema name, see `raw_validator`
+        objs (Iterable[Any]): The decoded documents
+
+    Returns:
+        list[bool]: Whether each document is valid
+    """
+
+    objs = objs if isinstance(objs, (list, tuple)) else list(objs)
+    mask = [True] * len(objs)
+
+    for position in raw_validator(schema_name).invalid_positions(objs):
+        mask[position] = False
+
+    return mask
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _directory(directory: str | Path | None) -> Traversable:
+    return SCHEMA_DIR if directory is None else Path(directory).resolve()
+
+
+@lru_cache(maxsize=None)
+def _schema_paths(directory: Traversable) -> dict[str, Traversable]:
+    return dict(_walk(directory, ""))
+
+
+def _walk(directory: Traversable, prefix: str) -> Iterator[tuple[str, Traversable]]:
+    # Traversables of installed packages have no glob, unlike paths
+    for entry in directory.iterdir():
+        if entry.is_dir():
+            yield from _walk(entry, f"{prefix}{entry.name}/")
+        elif entry.name.endswith(".json"):
+            yield f"{prefix}{entry.name[:-5]}", entry
+
+
+@lru_cache(maxsize=None)
+def _compiled(name: str, directory: Traversable) -> RawValidator:
+    paths = _schema_paths(directory)
+    path = paths.get(name)
+
+    if path is None:
+        matches = [key for key in paths if key.rpartition("/")[2] == name]
+
+        if len(matches) > 1:
+            raise KeyError(f"Schema name {name} is ambiguous, use one of {matches}")
+        elif not matches:
+            raise KeyError(f"No schema {name} in {directory}")
+
+        name, path = matches[0], paths[matches[0]]
+
+    return RawValidator(name, json.loads(path.read_text(encoding="utf-8")))
+
+
+def _generate(schema: dict[str, Any]) -> str:
+    _check_keywords(schema, {"type", "properties", "required", "additionalProperties"})
+
+    if schema.get("type", "object") != "object":
+        raise NotImplementedError("Only schemas of objects are supported")
+
+    properties: dict[str, dict] = schema.get("properties", {})
+    required: list[str] = schema.get("required", [])
+    closed = schema.get("additionalProperties", True) is False
+
+    conditions = ["type(obj) is dict"]
+    checks = [
+        "    if type(obj) is not dict:",
+        "        return ['(root): expected object']",
+    ]
+
+    for name in required:
+        conditions.append(f"{name!r} in obj")
+        checks += [
+            f"    if {name!r} not in obj:",
+            f"        errors.append({name + ': is required'!r})",
+        ]
+
+    if closed:
+        allowed = f"frozenset({sorted(properties)!r})"
+        conditions.append(f"obj.keys() <= {allowed}")
+        checks += [
+            f"    for key in obj.keys() - {allowed}:",
+            "        errors.append(f'{key}: is not allowed')",
+        ]
+
+    for name, definition in properties.items():
+        value_checks = _value_checks(name, definition)
+
+        if not value_checks:
+            continue
+
+        expression = " and ".join(check for check, _ in value_checks)
+        conditions.append(
+            f"((v := obj.get({name!r}, _MISSING)) is _MISSING or {expression})"
+        )
+
+        checks += [
+            f"    v = obj.get({name!r}, _MISSING)",
+            "    if v is not _MISSING:",
+        ]
+
+        keyword = "if"
+        for check, message in value_checks:
+            checks += [
+                f"        {keyword} not ({check}):",
+                f"            errors.append({name + ': ' + message!r})",
+            ]
+            keyword = "elif"
+
+    condition = "\n        and ".join(conditions)
+
+    return "\n".join(
+        [
+            "def is_valid(obj):",
+            f"    return (\n        {condition}\n    )",
+            "",
+            "def invalid_positions(objs):",
+            "    invalid = []",
+            "    for position, obj in enumerate(objs):",
+            f"        if not (\n        {condition}\n        ):",
+            "            invalid.append(position)",
+            "    return invalid",
+            "",
+            "def errors(obj):",
+            "    errors = []",
+            *checks,
+            "    return errors",
+            "",
+        ]
+    )
+
+
+def _value_checks(name: str, definition: dict[str, Any]) -> list[tuple[str, str]]:
+    _check_keywords(definition, {"type", "enum", *_BOUNDS}, name)
+    checks = []
+    types = definition.get("type", [])
+    types = [types] if isinstance(types, str) else types
+
+    # Bounds only apply to numbers, which the type check may already ensure
+    numeric = bool(types) and set(types) <= {"number", "integer"}
+
+    if types:
+        try:
+            alternatives = [_TYPE_CHECKS[kind].format(v="v") for kind in types]
+        except KeyError as exc:
+            raise NotImplementedError(f"{name}: unsupported type {exc}")
+
+        checks.append((" or ".join(alternatives), f"expected {' or '.join(types)}"))
+
+    if "enum" in definition:
+        enum = definition["enum"]
+        checks.append((f"v in {tuple(enum)!r}", f"must be one of {enum}"))
+
+    for keyword, operator in _BOUNDS.items():
+        if keyword in definition:
+            bound = float(definition[keyword])
+            check = f"v {operator} {bound!r}"
+
+            if not numeric:
+                check = f"(type(v) not in _NUMBER or {check})"
+
+            checks.append((check, f"must be {operator} {bound!r}"))
+
+    return checks
+
+
+def _check_keywords(schema: dict[str, Any], supported: set[str], name: str = ""):
+    for keyword in schema:
+        if keyword in _UNSUPPORTED or (
+            keyword not in supported
+            and keyword not in _ANNOTATIONS
+            and keyword in _VALIDATION_KEYWORDS
+        ):
+            location = f"{name}: " if name else ""
+            raise NotImplementedError(f"{location}unsupported keyword {keyword}")
+
+
+# Draft-07 validation keywords. Other keys, such as misspelled annotations,
+# are ignored like any unknown keyword of JSON Schema.
+_VALIDATION_KEYWORDS = frozenset(
+    {
+        "type",
+        "enum",
+        "properties",
+        "required",
+        "additionalProperties",
+        "contains",
+        "else",
+        "then",
+        "definitions",
+        *_BOUNDS,
+        *_UNSUPPORTED,
+    }
+)
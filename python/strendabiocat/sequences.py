@@ -0,0 +1,331 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Annotated, Any, ClassVar, Iterator
+
+from pydantic import PlainSerializer, WrapValidator
+from pydantic_core.core_schema import ValidatorFunctionWrapHandler
+
+# Bit-packed storage of the DNA and amino acid sequences of biocatalysts
+_DIGITS = "0123456789abcdefghijklmnopqrstuv"
+
+
+class PackedSequence:
+    """Sequence stored with a fixed number of bits per letter
+
+    The letters are packed into a single bytes object, which is decoded
+    only when the text is needed, e.g. by `str()`, indexing, concatenation
+    or any `str` method called on the sequence. Length and equality work
+    on the packed bytes.
+
+    A packed sequence equals and hashes like the string it was packed
+    from, so both can be mixed as keys of one dict or set. The hash is
+    computed from the decoded text once and then cached.
+
+    Models hold packed sequences in their `__dict__` only. Their sequence
+    attributes return plain strings, see `SequenceDescriptor`.
+
+    Subclasses define the alphabet, whose letters are coded by their
+    position in it.
+    """
+
+    __slots__ = ("_data", "_length", "_hash")
+
+    ALPHABET: ClassVar[str]
+    BITS: ClassVar[int]
+
+    # Set per subclass in __init_subclass__
+    _PATTERN: ClassVar[re.Pattern]
+    _ENCODE: ClassVar[dict[int, int]]
+    _CHUNK: ClassVar[int]
+    _DECODE: ClassVar[list[str] | dict[str, str]]
+    _SPLIT: ClassVar[re.Pattern]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+
+        # Letters are translated into the digits of base 2 ** BITS, so that
+        # int() packs a whole sequence in one call
+        cls._PATTERN = re.compile(f"[{re.escape(cls.ALPHABET)}]*")
+        cls._ENCODE = str.maketrans(cls.ALPHABET, _DIGITS[: len(cls.ALPHABET)])
+
+        # Decoding looks up the letters of one byte at a time if the codes
+        # align with bytes, else of two codes taken from the bit string
+        cls._CHUNK = 8 // cls.BITS if 8 % cls.BITS == 0 else 2
+        letters = cls.ALPHABET.ljust(2**cls.BITS, cls.ALPHABET[0])
+        chunks = ["".join(chunk) for chunk in product(letters, repeat=cls._CHUNK)]
+        if cls.BITS * cls._CHUNK == 8:
+            cls._DECODE = chunks
+        else:
+            width = cls.BITS * cls._CHUNK
+            cls._DECODE = {
+                format(code, f"0{width}b"): chunk for code, chunk in enumerate(chunks)
+            }
+            cls._SPLIT = re.compile(f".{{{width}}}")
+
+    def __init__(self, sequence: str):
+        if not self._PATTERN.fullmatch(sequence):
+            raise ValueError(
+                f"{self.__class__.__name__} only holds the letters {self.ALPHABET}"
+            )
+
+        self._hash: int | None = None
+        self._length = len(sequence)
+        self._data = (
+            int(sequence.translate(self._ENCODE), 2**self.BITS).to_bytes(
+                (self._length * self.BITS + 7) // 8, "big"
+            )
+            if sequence
+            else b""
+        )
+
+    @classmethod
+    def fits(cls, sequence: str) -> bool:
+        """Checks whether a string only holds letters of the alphabet
+
+        Args:
+            sequence (str): The sequence
+
+        Returns:
+            bool: Whether the sequence can be packed
+        """
+
+        return cls._PATTERN.fullmatch(sequence) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed letters in bytes"""
+
+        return len(self._data)
+
+    @property
+    def packed(self) -> bytes:
+        """The packed letters
+
+        The codes, i.e. the positions of the letters in the alphabet, are
+        stored big-endian with `BITS` bits each, preceded by zero bits up
+        to a whole number of bytes.
+        """
+
+        return self._data
+
+    def __str__(self) -> str:
+        if not self._length:
+            return ""
+
+        decode = self._DECODE
+
+        if type(decode) is list:
+            text = "".join(map(decode.__getitem__, self._data))
+        else:
+            width = self.BITS * self._CHUNK * -(-self._length // self._CHUNK)
+            bits = format(int.from_bytes(self._data, "big"), f"0{width}b")
+            text = "".join(map(decode.__getitem__, self._SPLIT.findall(bits)))
+
+        # The first chunk is padded with leading zero codes
+        return text[len(text) - self._length :]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __contains__(self, letters: str) -> bool:
+        return letters in str(self)
+
+    def __getitem__(self, key: int | slice) -> str:
+        return str(self)[key]
+
+    def __add__(self, other: Any) -> str:
+        if isinstance(other, (str, PackedSequence)):
+            return str(self) + str(other)
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> str:
+        if isinstance(other, str):
+            return other + str(self)
+        return NotImplemented
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is type(self):
+            return self._length == other._length and self._data == other._data
+        elif isinstance(other, str):
+            return self._length == len(other) and (
+                self.fits(other) and self._data == type(self)(other)._data
+            )
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal strings must hash alike, so the hash is the one of the text
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
+
+    def __getattr__(self, name: str) -> Any:
+        # Any other str method works on the decoded text
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(str(self), name)
+
+    def __reduce__(self):
+        return self.__class__, (str(self),)
+
+
+class PackedDNA(PackedSequence):
+    """DNA sequence of the four unambiguous nucleotides, 2 bits each
+
+    Example:
+        >> sequence = PackedDNA("ATGGCTAGC")
+        >> len(sequence), sequence.nbytes, str(sequence)
+        (9, 3, 'ATGGCTAGC')
+    """
+
+    __slots__ = ()
+
+    ALPHABET = "ACGT"
+    BITS = 2
+
+
+class PackedProtein(PackedSequence):
+    """Amino acid sequence in one-letter code, 5 bits each
+
+    Holds the 20 standard residues, selenocysteine (U), pyrrolysine (O),
+    the ambiguity codes B, J, Z and X, stop (*) and gap (-).
+
+    Example:
+        >> sequence = PackedProtein("MSKGEELFTG")
+        >> len(sequence), sequence.nbytes
+        (10, 7)
+    """
+
+    __slots__ = ()
+
+    ALPHABET = "ACDEFGHIKLMNPQRSTVWYUOBJZX*-"
+    BITS = 5
+
+
+def pack_sequence(sequence: Any, packed: type[PackedSequence]) -> Any:
+    """Packs a string if all its letters fit the alphabet
+
+    Sequences in other notations, such as lowercase letters, three-letter
+    codes or database IDs, are returned unchanged, so that they round-trip
+    exactly.
+
+    Args:
+        sequence (Any): The sequence
+        packed (type[PackedSequence]): The packed sequence type
+
+    Returns:
+        Any: The packed sequence, or the sequence if it does not fit
+    """
+
+    if type(sequence) is str and packed.fits(sequence):
+        return packed(sequence)
+
+    return sequence
+
+
+def stored_sequence(item: Any, name: str) -> Any:
+    """Returns a sequence field as stored by the instance
+
+    Unlike the attribute, which always returns the text, this returns the
+    packed sequence if the value was packed, so that batch computations
+    can read the codes without decoding them.
+
+    Args:
+        item (Any): The instance
+        name (str): The sequence field
+
+    Returns:
+        Any: The packed sequence, or the value if it was not packed
+    """
+
+    try:
+        return item.__dict__[name]
+    except (AttributeError, KeyError):
+        return getattr(item, name)
+
+
+class SequenceDescriptor:
+    """Returns the text of packed sequence fields on read
+
+    Installed on every sequence field of a model class. The instance
+    `__dict__` keeps the packed sequence, while the attribute returns a
+    plain `str`, so that string operations, regular expressions and hash
+    indexes work as for any other text field. Being a data descriptor, it
+    takes precedence over the instance `__dict__`, while assignments are
+    still handled by pydantic.
+
+    Every read decodes the sequence anew, trading time for the memory that
+    caching the text would cost. Loops that read a sequence repeatedly
+    should keep the returned string, see `bench_sequences.py` for the cost.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+        return value if value is None or type(value) is str else str(value)
+
+    def __set__(self, obj, value: Any):
+        obj.__dict__[self.name] = value
+
+
+@lru_cache(maxsize=None)
+def sequence_fields(model: type) -> dict[str, type[PackedSequence]]:
+    """Returns the fields of a model that hold packed sequences
+
+    Args:
+        model (type): The model
+
+    Returns:
+        dict[str, type[PackedSequence]]: The packed sequence type per field
+    """
+
+    return {
+        name: meta.packed
+        for name, field in model.model_fields.items()
+        for meta in field.metadata
+        if isinstance(meta, _SequenceValidator)
+    }
+
+
+@dataclass(frozen=True)
+class _SequenceValidator(WrapValidator):
+    packed: type[PackedSequence] = PackedSequence
+
+
+def _sequence_field(packed: type[PackedSequence]) -> Any:
+    def validate(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        if isinstance(value, packed):
+            return value
+        return pack_sequence(handler(value), packed)
+
+    return Annotated[
+        str,
+        _SequenceValidator(validate, packed=packed),
+        PlainSerializer(str, return_type=str),
+    ]
+
+
+# Field types of the sequence fields, which accept and serialise strings
+DNASequence = _sequence_field(PackedDNA)
+ProteinSequence = _sequence_field(PackedProtein)
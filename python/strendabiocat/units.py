@@ -0,0 +1,548 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
+
+# Parsing of the free-text unit strings and conversion between them
+
+# Base dimensions of the SI, in the order of `Unit.dimension`
+BASE_UNITS = ("kg", "m", "s", "mol", "K", "A")
+
+Dimension = tuple[int, int, int, int, int, int]
+
+DIMENSIONLESS: Dimension = (0, 0, 0, 0, 0, 0)
+
+
+class UnitError(ValueError):
+    """Raised for unit strings that cannot be parsed or converted"""
+
+
+@dataclass(frozen=True)
+class Unit:
+    """A parsed unit
+
+    A value in this unit is converted to the canonical SI unit of its
+    dimension by `value * factor + offset`. Only plain temperatures, such
+    as °C, have an offset. Within compound units like K/min they are
+    differences and convert without one.
+
+    Attributes:
+        symbol (str): The normalised unit string
+        factor (float): Scale to the canonical SI unit
+        dimension (Dimension): Exponents of the base units in `BASE_UNITS`
+        offset (float): Shift to the canonical SI unit
+    """
+
+    symbol: str
+    factor: float
+    dimension: Dimension
+    offset: float = 0.0
+
+    @property
+    def si(self) -> str:
+        """The canonical SI unit of the dimension, e.g. `mol/m^3`"""
+        return _format_dimension(self.dimension)
+
+    def __str__(self) -> str:
+        return self.symbol
+
+
+# Prefixes that can precede every unit marked as prefixable below
+PREFIXES = {
+    "f": 1e-15,
+    "p": 1e-12,
+    "n": 1e-9,
+    "u": 1e-6,
+    "m": 1e-3,
+    "c": 1e-2,
+    "d": 1e-1,
+    "h": 1e2,
+    "k": 1e3,
+}
+
+
+def _dim(kg=0, m=0, s=0, mol=0, K=0, A=0) -> Dimension:
+    return (kg, m, s, mol, K, A)
+
+
+# symbol: (factor to SI, dimension, offset, prefixable)
+_DEFINITIONS: dict[str, tuple[float, Dimension, float, bool]] = {
+    # Mass
+    "g": (1e-3, _dim(kg=1), 0.0, True),
+    "Da": (1e-3, _dim(kg=1, mol=-1), 0.0, True),
+    # Length and volume
+    "m": (1.0, _dim(m=1), 0.0, True),
+    "in": (0.0254, _dim(m=1), 0.0, False),
+    "ft": (0.3048, _dim(m=1), 0.0, False),
+    "L": (1e-3, _dim(m=3), 0.0, True),
+    "l": (1e-3, _dim(m=3), 0.0, True),
+    # Time and frequency
+    "s": (1.0, _dim(s=1), 0.0, True),
+    "sec": (1.0, _dim(s=1), 0.0, False),
+    "min": (60.0, _dim(s=1), 0.0, False),
+    "h": (3600.0, _dim(s=1), 0.0, False),
+    "hr": (3600.0, _dim(s=1), 0.0, False),
+    "d": (86400.0, _dim(s=1), 0.0, False),
+    "day": (86400.0, _dim(s=1), 0.0, False),
+    "Hz": (1.0, _dim(s=-1), 0.0, True),
+    "rpm": (1 / 60, _dim(s=-1), 0.0, False),
+    # Amount, concentration and enzyme activity
+    "mol": (1.0, _dim(mol=1), 0.0, True),
+    "M": (1e3, _dim(m=-3, mol=1), 0.0, True),
+    "U": (1e-6 / 60, _dim(s=-1, mol=1), 0.0, True),
+    "kat": (1.0, _dim(s=-1, mol=1), 0.0, True),
+    # Temperature
+    "K": (1.0, _dim(K=1), 0.0, False),
+    "°C": (1.0, _dim(K=1), 273.15, False),
+    "degC": (1.0, _dim(K=1), 273.15, False),
+    "°F": (5 / 9, _dim(K=1), 459.67 * 5 / 9, False),
+    "degF": (5 / 9, _dim(K=1), 459.67 * 5 / 9, False),
+    # Pressure, energy, power and current
+    "Pa": (1.0, _dim(kg=1, m=-1, s=-2), 0.0, True),
+    "bar": (1e5, _dim(kg=1, m=-1, s=-2), 0.0, True),
+    "atm": (101325.0, _dim(kg=1, m=-1, s=-2), 0.0, False),
+    "J": (1.0, _dim(kg=1, m=2, s=-2), 0.0, True),
+    "cal": (4.184, _dim(kg=1, m=2, s=-2), 0.0, True),
+    "W": (1.0, _dim(kg=1, m=2, s=-3), 0.0, True),
+    "A": (1.0, _dim(A=1), 0.0, True),
+    # Counts and ratios
+    "%": (1e-2, DIMENSIONLESS, 0.0, False),
+    "ppm": (1e-6, DIMENSIONLESS, 0.0, False),
+    "cells": (1.0, DIMENSIONLESS, 0.0, False),
+    "cell": (1.0, DIMENSIONLESS, 0.0, False),
+    "eq": (1.0, DIMENSIONLESS, 0.0, False),
+    "equiv": (1.0, DIMENSIONLESS, 0.0, False),
+}
+
+_REPLACEMENTS = (
+    ("µ", "u"),
+    ("μ", "u"),
+    ("·", "*"),
+    ("⋅", "*"),
+    ("×", "*"),
+    ("℃", "°C"),
+    ("²", "^2"),
+    ("³", "^3"),
+    ("⁻¹", "^-1"),
+    ("⁻²", "^-2"),
+    ("⁻³", "^-3"),
+    (" per ", "/"),
+)
+
+# Qualifiers of ratios, such as % (v/v), which do not change the unit
+_QUALIFIER = re.compile(r"\(\s*(?:w|v|mol|wt)\s*/\s*(?:w|v|mol|wt)\s*\)")
+
+_POWER = re.compile(r"\^?([-+]?\d+)")
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<open>\()|(?P<close>\))|(?P<mul>\*)|(?P<div>/)"
+    r"|(?P<number>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?![A-Za-z°%])"
+    r"|(?P<atom>[A-Za-z°%]+)(?:\^?(?P<power>[-+]?\d+))?)"
+)
+
+
+class UnitRegistry:
+    """Parses unit strings and caches conversion factors
+
+    Every distinct unit string is parsed once. Equal units, such as `mM`
+    and ` mM `, are interned to the same `Unit`, and the scale and shift
+    between two units are cached per pair.
+
+    Example:
+        >> registry = UnitRegistry()
+        >> registry.convert(2.5, "mM", "uM")
+        2500.0
+        >> registry.parse("U/mg").si
+        'mol/kg/s'
+    """
+
+    def __init__(self):
+        self._definitions = dict(_DEFINITIONS)
+        self._units: dict[str, Unit] = {}
+        self._interned: dict[str, Unit] = {}
+        self._conversions: dict[tuple[str, str], tuple[float, float]] = {}
+
+    def define(
+        self,
+        symbol: str,
+        factor: float,
+        dimension: Dimension,
+        offset: float = 0.0,
+        prefixable: bool = False,
+    ):
+        """Adds a unit to the registry
+
+        Args:
+            symbol (str): The unit symbol
+            factor (float): Scale to the canonical SI unit
+            dimension (Dimension): Exponents of the base units
+            offset (float, optional): Shift to the canonical SI unit.
+                Defaults to 0.
+            prefixable (bool, optional): Whether SI prefixes may precede the
+                symbol. Defaults to False.
+        """
+
+        self._definitions[symbol] = (factor, tuple(dimension), offset, prefixable)
+        self._units.clear()
+        self._interned.clear()
+        self._conversions.clear()
+
+    def parse(self, text: str) -> Unit:
+        """Parses a unit string
+
+        Accepts products and quotients with parentheses, powers written as
+        `m^2`, `m2`, `m²` or `s-1`, SI prefixes and the µ/μ signs.
+
+        Args:
+            text (str): The unit string, e.g. `mmol/(L*min)` or `M-1s-1`
+
+        Returns:
+            Unit: The interned unit
+
+        Raises:
+            UnitError: If the string cannot be parsed
+        """
+
+        unit = self._units.get(text)
+
+        if unit is None:
+            unit = _parse(text, self._definitions)
+            unit = self._interned.setdefault(unit.symbol, unit)
+            self._units[text] = unit
+
+        return unit
+
+    def conversion(self, source: str, target: str) -> tuple[float, float]:
+        """Returns the scale and shift converting values between two units
+
+        A value `x` in the source unit is `x * scale + shift` in the target.
+
+        Args:
+            source (str): The unit of the values
+            target (str): The unit to convert to
+
+        Returns:
+            tuple[float, float]: The scale and shift
+
+        Raises:
+            UnitError: If either unit cannot be parsed, or the dimensions
+                differ
+        """
+
+        key = (source, target)
+        conversion = self._conversions.get(key)
+
+        if conversion is None:
+            conversion = self._conversions[key] = _conversion(
+                self.parse(source), self.parse(target)
+            )
+
+        return conversion
+
+    def convert(self, value: float | None, source: str, target: str) -> float | None:
+        """Converts a value between two units
+
+        Args:
+            value (float | None): The value, None is passed through
+            source (str): The unit of the value
+            target (str): The unit to convert to
+
+        Returns:
+            float | None: The converted value
+
+        Raises:
+            UnitError: If either unit cannot be parsed, or the dimensions
+                differ
+        """
+
+        if value is None:
+            return None
+
+        scale, shift = self.conversion(source, target)
+
+        return value * scale + shift
+
+    def to_si(self, value: float | None, source: str) -> float | None:
+        """Converts a value to the canonical SI unit of its dimension
+
+        Args:
+            value (float | None): The value, None is passed through
+            source (str): The unit of the value
+
+        Returns:
+            float | None: The value in the SI unit
+        """
+
+        if value is None:
+            return None
+
+        unit = self.parse(source)
+
+        return value * unit.factor + unit.offset
+
+
+# The registry used by the module functions and the model accessors
+registry = UnitRegistry()
+
+
+def parse_unit(text: str) -> Unit:
+    """Parses a unit string with the default registry, see `UnitRegistry.parse`"""
+    return registry.parse(text)
+
+
+def convert(value: float | None, source: str, target: str) -> float | None:
+    """Converts a value with the default registry, see `UnitRegistry.convert`
+
+    Example:
+        >> convert(37.0, "°C", "K")
+        310.15
+    """
+    return registry.convert(value, source, target)
+
+
+@lru_cache(maxsize=None)
+def unit_fields(model: type) -> dict[str, str]:
+    """Pairs the float fields of a model with the field holding their unit
+
+    Fields are paired with `<field>_unit`, or else with the unit field
+    whose stem starts or ends the field name, so that `temperature_at_XY`
+    uses `temperature_unit` and `c_yield` uses `yield_unit`.
+
+    Args:
+        model (type): The model
+
+    Returns:
+        dict[str, str]: The unit field of every float field that has one
+    """
+
+    fields = model.model_fields
+    stems = {
+        name[: -len("_unit")]: name
+        for name, field in fields.items()
+        if name.endswith("_unit") and _is_str(field.annotation)
+    }
+    pairs = {}
+
+    for name, field in fields.items():
+        if name in stems.values() or not _is_float(field.annotation):
+            continue
+
+        unit = stems.get(name) or _UNIT_FIELD_OVERRIDES.get(name)
+
+        if unit is None or unit not in fields:
+            matches = [
+                stem
+                for stem in stems
+                if name.startswith(f"{stem}_") or name.endswith(f"_{stem}")
+            ]
+            unit = stems[max(matches, key=len)] if matches else None
+
+        if unit is not None:
+            pairs[name] = unit
+
+    return pairs
+
+
+def quantity_in(obj, name: str, unit: str) -> float | None:
+    """Returns a float field of an instance converted to a unit
+
+    Args:
+        obj: The model instance
+        name (str): The float field, e.g. `michaelis_constant`
+        unit (str): The unit to convert to, e.g. `mM`
+
+    Returns:
+        float | None: The converted value, None if the field is not set
+
+    Raises:
+        AttributeError: If the field has no unit field
+        UnitError: If the units cannot be converted, or the value has no unit
+    """
+
+    unit_field = unit_fields(obj.__class__).get(name)
+
+    if unit_field is None:
+        raise AttributeError(f"{obj.__class__.__name__}.{name} has no unit field")
+
+    value = getattr(obj, name)
+    source = getattr(obj, unit_field)
+
+    if value is None:
+        return None
+    elif not source:
+        raise UnitError(f"{obj.__class__.__name__}.{unit_field} is not set")
+
+    return registry.convert(value, source, unit)
+
+
+def unit_accessor(name: str):
+    """Builds the `<field>_in(unit)` method of a float field with a unit
+
+    Args:
+        name (str): The float field
+
+    Returns:
+        Callable: The method
+    """
+
+    def accessor(self, unit: str) -> float | None:
+        return quantity_in(self, name, unit)
+
+    accessor.__name__ = accessor.__qualname__ = f"{name}_in"
+    accessor.__doc__ = f"Returns {name} converted to a unit, e.g. {name}_in(unit)"
+
+    return accessor
+
+
+# Unit fields whose name does not follow the value field
+_UNIT_FIELD_OVERRIDES = {"diastereomeric_excess": "diasteriomeric_excess_unit"}
+
+
+def _is_float(annotation) -> bool:
+    return annotation is float or annotation == float | None
+
+
+def _is_str(annotation) -> bool:
+    return annotation is str or annotation == str | None
+
+
+def _conversion(source: Unit, target: Unit) -> tuple[float, float]:
+    if source.dimension != target.dimension:
+        raise UnitError(
+            f"Cannot convert {source} ({source.si}) to {target} ({target.si})"
+        )
+
+    scale = source.factor / target.factor
+    shift = (source.offset - target.offset) / target.factor
+
+    return scale, shift
+
+
+def _normalise(text: str) -> str:
+    text = _QUALIFIER.sub("", text.strip())
+
+    for old, new in _REPLACEMENTS:
+        text = text.replace(old, new)
+
+    return text.strip()
+
+
+def _parse(text: str, definitions: dict) -> Unit:
+    normalised = _normalise(text)
+
+    if not normalised:
+        raise UnitError(f"Empty unit {text!r}")
+
+    tokens = list(_tokens(normalised, text))
+    position = 0
+
+    def product() -> tuple[float, list[int], list[tuple[str, int]]]:
+        # Factors are multiplied, a slash divides by the next factor only
+        nonlocal position
+        factor, dimension, atoms = 1.0, [0] * len(BASE_UNITS), []
+        sign = 1
+
+        while position < len(tokens):
+            kind, value, power = tokens[position]
+
+            if kind == "close":
+                break
+
+            position += 1
+
+            if kind in ("mul", "div"):
+                sign = -1 if kind == "div" else 1
+                continue
+            elif kind == "open":
+                inner_factor, inner_dimension, inner_atoms = product()
+
+                if position == len(tokens):
+                    raise UnitError(f"Unbalanced parentheses in unit {text!r}")
+
+                power = tokens[position][2]
+                position += 1
+            elif kind == "number":
+                inner_factor, inner_dimension = float(value), DIMENSIONLESS
+                inner_atoms = []
+            else:
+                inner_factor, inner_dimension = _atom(value, definitions, text)
+                inner_atoms = [(value, 1)]
+
+            exponent = sign * (int(power) if power else 1)
+            factor *= inner_factor**exponent
+            dimension = [d + e * exponent for d, e in zip(dimension, inner_dimension)]
+            atoms += [(symbol, p * exponent) for symbol, p in inner_atoms]
+            sign = 1
+
+        return factor, dimension, atoms
+
+    factor, dimension, atoms = product()
+
+    if position != len(tokens):
+        raise UnitError(f"Unbalanced parentheses in unit {text!r}")
+
+    # Only plain temperatures are absolute, within compound units they are
+    # differences, e.g. the K in K/min
+    offset = 0.0
+    if len(tokens) == 1 and tokens[0][2] is None:
+        offset = definitions.get(atoms[0][0], (0.0, DIMENSIONLESS, 0.0))[2]
+
+    return Unit(" ".join(normalised.split()), factor, tuple(dimension), offset)
+
+
+def _tokens(normalised: str, text: str) -> Iterator[tuple[str, str, str | None]]:
+    position = 0
+
+    while position < len(normalised):
+        match = _TOKEN.match(normalised, position)
+
+        if match is None or match.end() == position:
+            raise UnitError(f"Cannot parse unit {text!r}")
+
+        position = match.end()
+        kind = next(
+            name
+            for name in ("open", "close", "mul", "div", "number", "atom")
+            if match.group(name) is not None
+        )
+
+        # A power may also follow a closing parenthesis, e.g. `(m/s)^2`
+        if kind == "close":
+            power = _POWER.match(normalised, position)
+            if power is not None:
+                position = power.end()
+                yield kind, ")", power.group(1)
+                continue
+
+        yield kind, match.group(kind), match.group("power")
+
+
+def _atom(symbol: str, definitions: dict, text: str) -> tuple[float, Dimension]:
+    definition = definitions.get(symbol)
+
+    if definition is not None:
+        return definition[0], definition[1]
+
+    prefix, base = symbol[:1], symbol[1:]
+    definition = definitions.get(base)
+
+    if prefix in PREFIXES and definition is not None and definition[3]:
+        return PREFIXES[prefix] * definition[0], definition[1]
+
+    raise UnitError(f"Unknown unit {symbol!r} in {text!r}")
+
+
+def _format_dimension(dimension: Dimension) -> str:
+    numerator = [
+        base if power == 1 else f"{base}^{power}"
+        for base, power in zip(BASE_UNITS, dimension)
+        if power > 0
+    ]
+    denominator = [
+        base if power == -1 else f"{base}^{-power}"
+        for base, power in zip(BASE_UNITS, dimension)
+        if power < 0
+    ]
+
+    return "/".join(["*".join(numerator) or "1", *denominator])
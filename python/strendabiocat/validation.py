@@ -0,0 +1,122 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Annotated, Any, Generic, Iterable, Mapping, TypeVar
+
+from pydantic import TypeAdapter, ValidationError, WrapValidator
+from pydantic_core import ErrorDetails
+from pydantic_core.core_schema import ValidatorFunctionWrapHandler
+
+from .helpers import paused_gc
+
+# Batch validation of many records in a single call into pydantic-core
+Model = TypeVar("Model")
+
+
+@dataclass
+class BatchResult(Generic[Model]):
+    """Outcome of validating a batch of records
+
+    Attributes:
+        valid (list[Model]): The instances built from the valid records
+        indices (list[int]): Position of each valid instance in the input
+        errors (dict[int, list[ErrorDetails]]): Validation errors per input
+            position. Error locations are relative to the record.
+    """
+
+    valid: list[Model] = field(default_factory=list)
+    indices: list[int] = field(default_factory=list)
+    errors: dict[int, list[ErrorDetails]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every record of the batch was valid"""
+        return not self.errors
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[Model]) -> TypeAdapter[list[Model]]:
+    """Returns the cached adapter validating a list of records of a model
+
+    Args:
+        model (type[Model]): The model of the records
+
+    Returns:
+        TypeAdapter[list[Model]]: The adapter
+    """
+
+    return TypeAdapter(list[model])
+
+
+def validate_many(
+    model: type[Model], rows: Iterable[Mapping[str, Any]]
+) -> BatchResult[Model]:
+    """Validates many records with one call into pydantic-core
+
+    Invalid records do not abort the batch. They are reported per input
+    position, while all valid records are returned as instances.
+
+    Example:
+        >> result = validate_many(Components, rows)
+        >> result.valid
+        >> result.errors
+        {3: [{'type': 'float_parsing', 'loc': ('purity',), ...}]}
+
+    Args:
+        model (type[Model]): The model of the records
+        rows (Iterable[Mapping[str, Any]]): The records to validate
+
+    Returns:
+        BatchResult[Model]: The valid instances and the errors per position
+    """
+
+    rows = rows if isinstance(rows, list) else list(rows)
+    result = BatchResult()
+
+    # Every record is validated exactly once, so default factories such as
+    # the counter ID strategy only run for the records that are returned
+    with paused_gc():
+        items = _batch_adapter(model).validate_python(rows)
+
+    for position, item in enumerate(items):
+        if type(item) is _Rejected:
+            result.errors[position] = _record_errors(item.error)
+        else:
+            result.valid.append(item)
+            result.indices.append(position)
+
+    return result
+
+
+class _Rejected:
+    """Stands in for an invalid record in the output of `_batch_adapter`"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: ValidationError):
+        self.error = error
+
+
+def _reject_invalid(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except ValidationError as exc:
+        return _Rejected(exc)
+
+
+@lru_cache(maxsize=None)
+def _batch_adapter(model: type[Model]) -> TypeAdapter[list[Any]]:
+    # pydantic-core does not return the valid items of a list that failed
+    # validation, so invalid records are caught per item instead
+    return TypeAdapter(list[Annotated[model, WrapValidator(_reject_invalid)]])
+
+
+def _record_errors(exc: ValidationError) -> list[ErrorDetails]:
+    # Locations are relative to the record, since the error was caught
+    # before the list added the position
+    return [
+        error
+        for error in exc.errors()
+        # Follows from another error of the same record, e.g. for `ld_id`
+        if error["type"] != "default_factory_not_called"
+    ]
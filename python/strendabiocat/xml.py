@@ -0,0 +1,307 @@
+from __future__ import annotations
+import math
+import warnings
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from os import PathLike
+from typing import IO, Any, Callable, Iterable, Iterator, TypeVar
+from xml.etree.ElementTree import Element, iterparse
+from xml.sax.saxutils import escape
+
+from pydantic_core import ErrorDetails
+
+from .base import StrendaBaseModel
+from .helpers import open_binary
+from .validation import validate_many
+
+# Streaming XML input and output following schemes/xml/*.xsd
+Model = TypeVar("Model", bound=StrendaBaseModel)
+
+Source = str | PathLike | IO[bytes]
+
+
+@dataclass
+class ElementError:
+    """A record element of an XML stream that could not be turned into an instance
+
+    Attributes:
+        position (int): Position of the record element among all record
+            elements of the stream, starting at 1
+        tag (str): Tag of the record element
+        message (str): Why the element was rejected
+        errors (list[ErrorDetails]): Validation errors of the record
+    """
+
+    position: int
+    tag: str
+    message: str
+    errors: list[ErrorDetails] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"<{self.tag}> #{self.position}: {self.message}"
+
+
+class MalformedElementWarning(UserWarning):
+    """Issued for rejected record elements if no error handler is passed"""
+
+
+@lru_cache(maxsize=None)
+def xml_fields(model: type[Model]) -> tuple[str, ...]:
+    """Returns the child elements of a model's XML element in schema order
+
+    The XSDs are generated from the specification that the models follow,
+    so the element sequence of a type is the order of the model fields. The
+    JSON-LD fields have no XML representation.
+
+    Args:
+        model (type[Model]): The model
+
+    Returns:
+        tuple[str, ...]: The element names
+    """
+
+    return tuple(name for name in model.model_fields if not name.startswith("ld_"))
+
+
+def read_xml(
+    source: Source,
+    model: type[Model],
+    batch_size: int = 1000,
+    on_error: Callable[[ElementError], Any] | None = None,
+) -> Iterator[Model]:
+    """Streams validated model instances out of an XML file
+
+    The file is parsed incrementally. Every element named after the model,
+    e.g. `<KineticParameters>`, at any depth is read as one record and
+    discarded from the tree right after, so memory use does not grow with
+    the file. Records are validated one batch at a time through
+    `validate_many`, and the next batch is only parsed once the consumer
+    asks for it.
+
+    Invalid records do not abort the stream. They are passed to `on_error`
+    as an `ElementError`. Files that are not well-formed XML raise on the
+    first error, since parsing cannot resume after it.
+
+    Example:
+        >> for parameters in read_xml("export.xml", KineticParameters):
+        >>     ...
+
+    Args:
+        source (Source): Path or binary file to read. Paths ending in `.gz`
+            are decompressed.
+        model (type[Model]): The model of the records
+        batch_size (int, optional): Records per batch. Defaults to 1000.
+        on_error (Callable[[ElementError], Any], optional): Called for every
+            rejected record. Defaults to issuing a `MalformedElementWarning`.
+
+    Yields:
+        Model: The instances built from the valid record elements
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the file is not well-formed
+        ValueError: If the batch size is not positive
+    """
+
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+
+    report = on_error or _warn
+    tag = model.__name__
+    names = frozenset(xml_fields(model))
+    collapsed = _collapsed_fields(model)
+    rows: list[dict[str, Any]] = []
+    positions: list[int] = []
+    position = 0
+
+    with open_binary(source, "rb") as stream:
+        parents: list[Element] = []
+
+        for event, element in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(element)
+                continue
+
+            parents.pop()
+
+            if not element.tag.endswith(tag) or _local_name(element.tag) != tag:
+                continue
+
+            position += 1
+            rows.append(_record(element, names, collapsed))
+            positions.append(position)
+
+            # Drop the record from the tree, so that it does not grow
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+
+            if len(rows) == batch_size:
+                yield from _build(model, rows, positions, report)
+                rows, positions = [], []
+
+    if rows:
+        yield from _build(model, rows, positions, report)
+
+
+def write_xml(
+    target: Source,
+    items: Iterable[Model],
+    model: type[Model] | None = None,
+    root: str | None = None,
+    batch_size: int = 1000,
+) -> int:
+    """Streams model instances into an XML file
+
+    Every instance is written as an element named after its model, with
+    one child element per set field in the order of the XSD. The records
+    are wrapped in a root element, since the XSDs define single records
+    only. Items are consumed lazily and written in batches.
+
+    Example:
+        >> write_xml("export.xml", records, KineticParameters)
+
+    Args:
+        target (Source): Path or binary file to write. Paths ending in `.gz`
+            are compressed.
+        items (Iterable[Model]): The instances
+        model (type[Model], optional): The model of the instances, which
+            names the default root element. Defaults to the type of the
+            first instance.
+        root (str, optional): Tag of the root element. Defaults to the model
+            name followed by `List`, e.g. `KineticParametersList`.
+        batch_size (int, optional): Records per write. Defaults to 1000.
+
+    Returns:
+        int: The number of written records
+    """
+
+    items = iter(items)
+    written = 0
+
+    if model is None:
+        first = next(items, None)
+        model = type(first) if first is not None else StrendaBaseModel
+        items = _chain(first, items)
+
+    root = root or f"{model.__name__}List"
+    chunks: list[str] = []
+
+    with open_binary(target, "wb") as stream:
+        stream.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<{root}>\n'.encode())
+
+        for item in items:
+            chunks.append(_element(item))
+            written += 1
+
+            if len(chunks) == batch_size:
+                stream.write("".join(chunks).encode())
+                chunks.clear()
+
+        chunks.append(f"</{root}>\n")
+        stream.write("".join(chunks).encode())
+
+    return written
+
+
+def _build(
+    model: type[Model],
+    rows: list[dict[str, Any]],
+    positions: list[int],
+    report: Callable[[ElementError], Any],
+) -> list[Model]:
+    result = validate_many(model, rows)
+
+    for index, errors in result.errors.items():
+        fields = ", ".join(".".join(map(str, error["loc"])) for error in errors)
+        report(
+            ElementError(
+                positions[index], model.__name__, f"Invalid fields: {fields}", errors
+            )
+        )
+
+    return result.valid
+
+
+def _record(
+    element: Element, names: frozenset[str], collapsed: frozenset[str]
+) -> dict[str, Any]:
+    row = {}
+
+    for child in element:
+        name = child.tag
+        if name not in names:
+            name = _local_name(name)
+
+        # Empty elements are empty strings, only absent elements are missing
+        if name in names:
+            text = child.text or ""
+
+            if name in collapsed:
+                text = text.strip()
+                text = _XML_SPECIAL_FLOATS.get(text, text)
+
+            row[name] = text
+
+    return row
+
+
+@lru_cache(maxsize=None)
+def _collapsed_fields(model: type[Model]) -> frozenset[str]:
+    # xs:float and xs:date collapse whitespace, while the text of xs:string
+    # fields is kept verbatim
+    return frozenset(
+        name
+        for name in xml_fields(model)
+        if model.model_fields[name].annotation is not str
+    )
+
+
+def _element(item: StrendaBaseModel) -> str:
+    values = item.__dict__
+    tag = item.__class__.__name__
+    parts = [f"  <{tag}>\n"]
+
+    for name in xml_fields(item.__class__):
+        value = values.get(name)
+
+        if value is not None:
+            parts.append(f"    <{name}>{_text(value)}</{name}>\n")
+
+    parts.append(f"  </{tag}>\n")
+
+    return "".join(parts)
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        elif math.isinf(value):
+            return "INF" if value > 0 else "-INF"
+        return repr(value)
+    elif isinstance(value, date):
+        return value.isoformat()
+
+    # Parsers normalise line endings, so carriage returns are escaped
+    return escape(str(value), _XML_ENTITIES)
+
+
+def _chain(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    if first is not None:
+        yield first
+    yield from rest
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _warn(error: ElementError):
+    warnings.warn(str(error), MalformedElementWarning)
+
+
+_XML_ENTITIES = {"\r": "&#13;"}
+
+# xs:float spells the special values differently than Python
+_XML_SPECIAL_FLOATS = {"INF": "inf", "-INF": "-inf", "NaN": "nan"}
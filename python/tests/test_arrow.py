@@ -0,0 +1,60 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pydantic import ValidationError
+
+from strendabiocat.arrow import read_ipc, read_parquet, write_ipc, write_parquet
+from strendabiocat.components import Components, StorageConditions
+
+RECORD = {
+    "name": "NADH",
+    "smiles": "NC(=O)C1=CN(C=CC1)C1OC(COP(O)(=O)OP(O)(O)=O)C(O)C1O",
+    "persistent_identifier_PID": "CHEBI:16908",
+    "concentration": 0.2,
+    "concentration_unit": "mM",
+    "supplier": "Sigma",
+    "purity": 98.0,
+    "formulation": "powder",
+    "solubility_limit": 50.0,
+    "solubility_limit_unit": "mg/mL",
+}
+
+
+@pytest.mark.parametrize(
+    "write, read", [(write_parquet, read_parquet), (write_ipc, read_ipc)]
+)
+def test_round_trip(tmp_path, write, read):
+    items = [Components(**{**RECORD, "concentration": i / 10}) for i in range(5)]
+    path = tmp_path / "components"
+
+    assert write(path, Components, items) == 5
+    assert list(read(path, Components)) == items
+
+
+def test_foreign_files_are_validated(tmp_path):
+    path = tmp_path / "foreign.parquet"
+    pq.write_table(
+        pa.table({"name": ["NADH"], "purity": [150.0], "concentration": [-3.0]}), path
+    )
+
+    with pytest.raises(ValidationError):
+        list(read_parquet(path, Components))
+
+
+def test_files_of_the_model_without_required_columns_are_validated(tmp_path):
+    path = tmp_path / "components.parquet"
+    write_parquet(path, Components, [Components(**RECORD)])
+    table = pq.read_table(path).drop_columns(["smiles"])
+    pq.write_table(table, path)
+
+    assert table.schema.metadata
+    with pytest.raises(ValidationError):
+        list(read_parquet(path, Components))
+
+
+def test_files_of_other_models_are_rejected(tmp_path):
+    path = tmp_path / "components.parquet"
+    write_parquet(path, Components, [Components(**RECORD)])
+
+    with pytest.raises(ValueError, match="Components records"):
+        list(read_parquet(path, StorageConditions))
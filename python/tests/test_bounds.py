@@ -0,0 +1,75 @@
+import pytest
+from pydantic import ValidationError
+
+from strendabiocat.components import Components
+from strendabiocat.reaction_conditions import pHConstant_WMRS
+from strendabiocat.validation import validate_many
+
+COMPONENT = {
+    "name": "NADH",
+    "smiles": "NC(=O)C1=CN(C=CC1)C1OC(COP(O)(=O)OP(O)(O)=O)C(O)C1O",
+    "persistent_identifier_PID": "CHEBI:16908",
+    "concentration": 0.2,
+    "concentration_unit": "mM",
+    "supplier": "Sigma",
+    "purity": 98.0,
+    "formulation": "powder",
+    "solubility_limit": 50.0,
+    "solubility_limit_unit": "mg/mL",
+}
+
+PH_CONSTANT = {
+    "pH_value": 7.5,
+    "detected_when": "before start",
+    "detected_how": "pH electrode",
+    "temperature": 25.0,
+    "temperature_unit": "°C",
+    "calibration_pH_electrode": "two-point",
+    "special_treatment": "none",
+}
+
+CASES = [
+    (Components, COMPONENT, "purity", [101, 100.5, -1], [0, 100]),
+    (Components, COMPONENT, "concentration", [-3, -1e-9], [0]),
+    (Components, COMPONENT, "solubility_limit", [-0.5], [0, float("inf")]),
+    (pHConstant_WMRS, PH_CONSTANT, "pH_value", [15, 14.01, -0.1], [0, 14]),
+    (pHConstant_WMRS, PH_CONSTANT, "temperature", [-1], [0]),
+]
+
+
+@pytest.mark.parametrize("model, record, name, invalid, valid", CASES)
+def test_bounds_are_enforced_on_construction(model, record, name, invalid, valid):
+    for value in invalid:
+        with pytest.raises(ValidationError) as info:
+            model(**{**record, name: value})
+        assert (name,) in [error["loc"] for error in info.value.errors()]
+
+    for value in valid:
+        assert getattr(model(**{**record, name: value}), name) == value
+
+
+@pytest.mark.parametrize("model, record, name, invalid, valid", CASES)
+def test_bounds_are_enforced_on_assignment(model, record, name, invalid, valid):
+    item = model(**record)
+
+    for value in invalid:
+        with pytest.raises(ValidationError):
+            setattr(item, name, value)
+        assert getattr(item, name) == record[name]
+
+    for value in valid:
+        setattr(item, name, value)
+        assert getattr(item, name) == value
+
+
+def test_bounds_are_enforced_by_validate_many():
+    result = validate_many(
+        Components,
+        [COMPONENT, {**COMPONENT, "purity": 101}, {**COMPONENT, "concentration": -3}],
+    )
+
+    assert result.indices == [0]
+    assert [error[0]["loc"] for error in result.errors.values()] == [
+        ("purity",),
+        ("concentration",),
+    ]
@@ -0,0 +1,87 @@
+import pytest
+from pydantic import ValidationError
+
+from strendabiocat.components import Components
+
+RECORD = {
+    "name": "NADH",
+    "smiles": "NC(=O)C1=CN(C=CC1)C1OC(COP(O)(=O)OP(O)(O)=O)C(O)C1O",
+    "persistent_identifier_PID": "CHEBI:16908",
+    "concentration": 0.2,
+    "concentration_unit": "mM",
+    "supplier": "Sigma",
+    "purity": 98.0,
+    "formulation": "powder",
+    "solubility_limit": 50.0,
+    "solubility_limit_unit": "mg/mL",
+}
+
+
+@pytest.fixture
+def component() -> Components:
+    return Components(**RECORD)
+
+
+def test_validation_is_deferred_to_the_end(component):
+    with component.bulk_edit():
+        component.concentration = "1.5"
+        # Stored as assigned until the block ends
+        assert component.concentration == "1.5"
+        component.concentration_unit = "M"
+
+    assert component.concentration == 1.5
+    assert component.concentration_unit == "M"
+
+
+def test_invalid_fields_roll_back_all_changes(component):
+    with pytest.raises(ValidationError) as info:
+        with component.bulk_edit():
+            component.concentration = 2.0
+            component.supplier = "Merck"
+            component.purity = 150.0
+
+    assert [error["loc"] for error in info.value.errors()] == [("purity",)]
+    assert component.concentration == 0.2
+    assert component.supplier == "Sigma"
+    assert component.purity == 98.0
+
+
+def test_exceptions_in_the_block_roll_back(component):
+    with pytest.raises(KeyError):
+        with component.bulk_edit():
+            component.concentration = 2.0
+            component.name = "NAD+"
+            raise KeyError("abort")
+
+    assert component.concentration == 0.2
+    assert component.name == "NADH"
+
+
+def test_nested_blocks_are_validated_by_the_outermost(component):
+    with pytest.raises(ValidationError):
+        with component.bulk_edit():
+            component.concentration = 2.0
+
+            with component.bulk_edit():
+                component.purity = -1.0
+
+            # The inner block did not validate or roll back
+            assert component.purity == -1.0
+
+    assert component.concentration == 0.2
+    assert component.purity == 98.0
+
+    with component.bulk_edit():
+        with component.bulk_edit():
+            component.purity = 99.0
+        component.concentration = 0.3
+
+    assert (component.purity, component.concentration) == (99.0, 0.3)
+
+
+def test_assignments_outside_the_block_are_validated(component):
+    with component.bulk_edit():
+        component.purity = 99.0
+
+    with pytest.raises(ValidationError):
+        component.purity = 150.0
@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+import pytest
+
+from strendabiocat.columnar import (
+    CategoricalColumn,
+    KineticParametersColumns,
+    convert_array,
+    convert_models,
+)
+from strendabiocat.components import StorageConditions
+from strendabiocat.helpers import id_strategy
+from strendabiocat.results import KineticParameters
+from strendabiocat.units import UnitError
+
+
+def kinetic_parameters(i: int = 0, **values) -> KineticParameters:
+    return KineticParameters(
+        **{
+            "michaelis_constant": 0.1 + i,
+            "michaelis_constant_unit": "mM",
+            "maximum_reaction_rate": 12.5,
+            "maximum_reaction_rate_unit": "U/mg",
+            "turnover_number": 31.0,
+            "turnover_number_unit": "1/s",
+            "catalytic_efficiency": 310.0,
+            "catalytic_efficiency_unit": "1/(mM*s)",
+            "dissociation_constant": 0.8,
+            "dissociation_constant_unit": "mM",
+            "inhibition_type": "competitive",
+            "inhibition_constant": 2.1,
+            "inhibition_constant_unit": "mM",
+            "hill_coefficient": 1.0,
+            "enzyme_stability": "stable",
+            "special_treatment": "none",
+            **values,
+        }
+    )
+
+
+@pytest.mark.parametrize("strategy", ["uuid4", "lazy", "counter", "content"])
+def test_collections_keep_the_identifiers(strategy):
+    with id_strategy(strategy):
+        items = [kinetic_parameters(i) for i in range(3)]
+
+    columns = KineticParametersColumns.from_models(items)
+
+    assert [row.ld_id for row in columns] == [item.ld_id for item in items]
+    assert len(set(columns.column("ld_id"))) == 3
+    assert columns.to_models() == items
+
+
+def test_convert_array_shifts_temperatures():
+    converted = convert_array([25.0, 300.0, -273.15, 0.0], ["°C", "K", "°C", "K"], "°C")
+
+    np.testing.assert_allclose(converted, [25.0, 26.85, -273.15, -273.15])
+    np.testing.assert_allclose(convert_array([25.0], ["°C"], "K"), [298.15])
+    np.testing.assert_allclose(
+        convert_array([212.0, 32.0], ["°F"] * 2, "°C"), [100, 0], atol=1e-9
+    )
+
+
+def test_convert_array_scales_and_parses_each_unit_once():
+    units = CategoricalColumn(["mM", "uM", "M", "mM", None])
+    values = [2.0, 500.0, 0.001, None, 1.0]
+
+    converted = convert_array(values, units, "mM", errors="nan")
+
+    np.testing.assert_allclose(converted[:3], [2.0, 0.5, 1.0])
+    assert math.isnan(converted[3]) and math.isnan(converted[4])
+
+
+@pytest.mark.parametrize("units", [["mM", "s"], ["mM", "furlong"], ["mM", None]])
+def test_convert_array_errors(units):
+    with pytest.raises(UnitError):
+        convert_array([1.0, 1.0], units, "mM")
+
+    converted = convert_array([1.0, 1.0], units, "mM", errors="nan")
+
+    assert converted[0] == 1.0
+    assert math.isnan(converted[1])
+
+
+def test_convert_array_checks_its_arguments():
+    with pytest.raises(ValueError, match="values but"):
+        convert_array([1.0, 2.0], ["mM"], "mM")
+    with pytest.raises(ValueError, match="errors must be"):
+        convert_array([1.0], ["mM"], "mM", errors="ignore")
+
+
+def test_convert_models():
+    items = [
+        kinetic_parameters(0, michaelis_constant=0.5, michaelis_constant_unit="M"),
+        kinetic_parameters(1, michaelis_constant=20.0, michaelis_constant_unit="uM"),
+        kinetic_parameters(2, michaelis_constant=3.0, michaelis_constant_unit="g"),
+    ]
+
+    converted = convert_models(items, "michaelis_constant", "mM", errors="nan")
+
+    np.testing.assert_allclose(converted[:2], [500.0, 0.02])
+    assert math.isnan(converted[2])
+    with pytest.raises(UnitError):
+        convert_models(items, "michaelis_constant", "mM")
+    with pytest.raises(KeyError, match="no unit field"):
+        convert_models(items, "hill_coefficient", "mM")
+    assert convert_models([], "michaelis_constant", "mM").size == 0
+
+
+def test_convert_models_of_temperatures():
+    items = [
+        StorageConditions(
+            temperature=temperature,
+            temperature_unit=unit,
+            storage_start="2024-01-01",
+            additives="none",
+            special_treatment="none",
+        )
+        for temperature, unit in [(-20.0, "°C"), (277.15, "K")]
+    ]
+
+    np.testing.assert_allclose(convert_models(items, "temperature", "°C"), [-20.0, 4.0])
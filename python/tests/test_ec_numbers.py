@@ -0,0 +1,92 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from strendabiocat.ec_numbers import ECIndex, parse_ec
+
+
+def enzyme(ec_number) -> SimpleNamespace:
+    return SimpleNamespace(ec_number=ec_number)
+
+
+@pytest.mark.parametrize(
+    "text, levels",
+    [
+        ("EC 3.1.1.3", ("3", "1", "1", "3")),
+        ("ec:3.01.1.3", ("3", "1", "1", "3")),
+        ("1.14.-.-", ("1", "14")),
+        ("2.7.1.n2", ("2", "7", "1", "n2")),
+    ],
+)
+def test_parse_ec(text, levels):
+    assert parse_ec(text) == levels
+
+
+@pytest.mark.parametrize("text", ["", "-.-.-.-", "1.2.3.4.5", "1.n2.3", "1.a.3"])
+def test_parse_ec_rejects_invalid_numbers(text):
+    with pytest.raises(ValueError, match="Invalid EC number"):
+        parse_ec(text)
+
+
+def test_unparsed_items_are_kept_apart():
+    items = [enzyme("3.1.1.3"), enzyme("unknown"), enzyme(None)]
+    index = ECIndex(items)
+
+    assert index.unparsed == items[1:]
+    assert index.query("*") == items[:1]
+    assert len(index) == 3
+
+
+def test_counts_per_level():
+    index = ECIndex(
+        enzyme(ec)
+        for ec in ["3.1.1.3", "3.1.1.1", "3.1.3.1", "3.1.-.-", "3.1.1.n1", "1.1.1.1"]
+    )
+
+    assert index.counts() == {"1": 1, "3": 5}
+    assert index.counts("3.1") == {"3.1.1": 3, "3.1.3": 1}
+    assert index.counts("3.1.1") == {"3.1.1.1": 1, "3.1.1.3": 1, "3.1.1.n1": 1}
+    assert index.counts("*.1") == {"1.1.1": 1, "3.1.1": 3, "3.1.3": 1}
+    assert index.count("3.1") == 5
+
+
+@pytest.mark.parametrize("pattern", ["1.2.3.4.5", "1.x"])
+def test_invalid_patterns(pattern):
+    with pytest.raises(ValueError, match="pattern"):
+        ECIndex().query(pattern)
+
+
+def matches(levels: tuple[str, ...], pattern: tuple[str, ...]) -> bool:
+    return len(levels) >= len(pattern) and all(
+        query in ("*", "-") or query == level for query, level in zip(pattern, levels)
+    )
+
+
+def test_queries_match_a_brute_force_scan():
+    rng = random.Random(0)
+
+    def ec_number() -> str:
+        depth = rng.randint(1, 4)
+        levels = [rng.choice(["1", "2", "3", "11"]) for _ in range(depth)]
+        if depth == 4 and rng.random() < 0.2:
+            levels[3] = "n1"
+        return ".".join(levels + ["-"] * (4 - depth))
+
+    items = [enzyme(ec_number()) for _ in range(500)]
+    index = ECIndex(items[:300])
+    index.extend(items[300:])
+
+    for _ in range(300):
+        pattern = [
+            rng.choice(["1", "2", "3", "11", "*", "-"])
+            for _ in range(rng.randint(1, 4))
+        ]
+        query = tuple(pattern)
+        while query and query[-1] in ("*", "-"):
+            query = query[:-1]
+
+        expected = [item for item in items if matches(parse_ec(item.ec_number), query)]
+
+        assert index.query(".".join(pattern)) == expected
+        assert index.count(".".join(pattern)) == len(expected)
@@ -0,0 +1,27 @@
+from strendabiocat.helpers import FilterWrapper
+from strendabiocat.query import LazyFilter
+
+
+class Record:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+def test_filter_wrapper_compares_all_keywords():
+    items = [Record(name="a", unit="mM"), Record(name="a", unit="M"), Record(name="b")]
+
+    assert FilterWrapper(items, name="a", unit="mM").filter() == [items[0]]
+
+
+def test_filter_wrapper_compares_literally():
+    items = [Record(purity__ge=90.0, check=len), Record(purity__ge=5.0, check=str)]
+
+    assert FilterWrapper(items, purity__ge=90.0).filter() == [items[0]]
+    assert FilterWrapper(items, check=len).filter() == [items[0]]
+
+
+def test_lazy_filter_applies_lookups():
+    items = [Record(purity=99.0), Record(purity=80.0)]
+
+    assert list(LazyFilter(items, purity__ge=90.0)) == [items[0]]
+    assert list(LazyFilter(items, purity=lambda purity: purity < 90)) == [items[1]]
@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from strendabiocat.components import Components
+from strendabiocat.helpers import id_strategy
+from strendabiocat.validation import validate_many
+
+RECORD = {
+    "name": "ethanol",
+    "smiles": "CCO",
+    "persistent_identifier_PID": "CHEBI:16236",
+    "concentration": 10.0,
+    "concentration_unit": "mM",
+    "supplier": "Sigma-Aldrich",
+    "purity": 99.8,
+    "formulation": "liquid",
+    "solubility_limit": 1000.0,
+    "solubility_limit_unit": "mM",
+}
+
+
+def lazy_components() -> list[Components]:
+    with id_strategy("lazy"):
+        return [Components(**RECORD), Components(**RECORD)]
+
+
+def test_lazy_instances_compare_like_uuid4_instances():
+    first, second = lazy_components()
+
+    assert first != second
+    assert first.ld_id != second.ld_id
+    assert first != second
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [
+        lambda item: item.model_copy(),
+        lambda item: item.model_copy(deep=True),
+        copy.copy,
+        copy.deepcopy,
+        lambda item: pickle.loads(pickle.dumps(item)),
+    ],
+)
+def test_copies_keep_the_lazy_id(duplicate):
+    item, _ = lazy_components()
+    copied = duplicate(item)
+
+    assert copied.ld_id == item.ld_id
+    assert copied == item
+
+
+def test_batch_validation_numbers_valid_rows_once():
+    rows = [RECORD, {**RECORD, "purity": "pure"}, RECORD, {"name": "water"}]
+
+    with id_strategy("counter"):
+        first = Components(**RECORD)
+        result = validate_many(Components, rows)
+        last = Components(**RECORD)
+
+    number = int(first.ld_id.rpartition("/")[2])
+
+    assert result.indices == [0, 2]
+    assert sorted(result.errors) == [1, 3]
+    assert [item.ld_id for item in result.valid] == [
+        f"stbc:Components/{number + 1}",
+        f"stbc:Components/{number + 2}",
+    ]
+    assert last.ld_id == f"stbc:Components/{number + 3}"
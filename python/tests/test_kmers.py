@@ -0,0 +1,96 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from strendabiocat.kmers import KmerIndex, minimizers
+from strendabiocat.sequences import PackedProtein
+
+RESIDUES = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def enzyme(sequence) -> SimpleNamespace:
+    return SimpleNamespace(sequence_amino_acid=sequence)
+
+
+def mutate(sequence: str, mutations: int, rng: random.Random) -> str:
+    residues = list(sequence)
+    for position in rng.sample(range(len(residues)), mutations):
+        residues[position] = rng.choice(RESIDUES)
+    return "".join(residues)
+
+
+def naive_minimizers(sequence: str, k: int, window: int) -> frozenset[str]:
+    kmers = [sequence[i : i + k] for i in range(max(len(sequence) - k, 0) + 1)]
+    if len(kmers) <= window:
+        return frozenset((min(kmers),))
+    return frozenset(
+        min(kmers[start : start + window]) for start in range(len(kmers) - window + 1)
+    )
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b)
+
+
+@pytest.mark.parametrize("k, window", [(1, 1), (3, 4), (5, 10), (8, 3)])
+def test_minimizers_match_a_naive_scan(k, window):
+    rng = random.Random(k * window)
+
+    for length in [1, 2, k, k + window, 50, 300]:
+        sequence = "".join(rng.choice("ACGT") for _ in range(length))
+        assert minimizers(sequence, k, window) == naive_minimizers(sequence, k, window)
+
+
+def test_packed_sequences_are_decoded():
+    sequence = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEG"
+    assert minimizers(PackedProtein(sequence)) == minimizers(sequence)
+
+
+def test_items_without_sequence_are_never_found():
+    index = KmerIndex([enzyme(None), enzyme(""), enzyme("MSKGEELFTG")])
+
+    assert len(index) == 3
+    assert [item for item, _ in index.query("MSKGEELFTG", 1.0)] == [index[2]]
+    assert index.query("") == []
+
+
+@pytest.mark.parametrize("threshold", [0, -0.1, 1.5])
+def test_threshold_must_be_in_range(threshold):
+    with pytest.raises(ValueError, match="Threshold"):
+        KmerIndex().query("MSKGEELFTG", threshold)
+
+
+def test_similar_leaves_out_the_item():
+    items = [enzyme("MSKGEELFTGVVPILVELDG"), enzyme("MSKGEELFTGVVPILVELDG")]
+    index = KmerIndex(items)
+
+    assert index.similar(items[0], 1.0) == [(items[1], 1.0)]
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7, 0.8, 0.9, 1.0])
+def test_queries_match_an_exact_jaccard_scan(threshold):
+    rng = random.Random(0)
+    parents = ["".join(rng.choice(RESIDUES) for _ in range(200)) for _ in range(3)]
+    items = [
+        enzyme(mutate(rng.choice(parents), rng.randint(0, 30), rng)) for _ in range(300)
+    ]
+    index = KmerIndex(items[:200])
+    index.extend(items[200:])
+
+    for _ in range(10):
+        query = mutate(rng.choice(parents), rng.randint(0, 20), rng)
+        found = minimizers(query)
+        expected = sorted(
+            (
+                (position, jaccard(found, minimizers(item.sequence_amino_acid)))
+                for position, item in enumerate(items)
+            ),
+            key=lambda match: (-match[1], match[0]),
+        )
+
+        assert index.query(query, threshold) == [
+            (items[position], similarity)
+            for position, similarity in expected
+            if similarity >= threshold
+        ]
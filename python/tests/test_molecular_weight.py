@@ -0,0 +1,89 @@
+import math
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from strendabiocat.molecular_weight import (
+    RESIDUE_MASSES,
+    WATER_MASS,
+    check_molecular_weights,
+    derived_molecular_weights,
+    molecular_weights,
+)
+from strendabiocat.sequences import PackedProtein
+
+
+def weight(sequence: str) -> float:
+    return sum(RESIDUE_MASSES[residue] for residue in sequence) + WATER_MASS
+
+
+def test_packed_weights_match_text_weights():
+    rng = random.Random(0)
+    # Lengths around multiples of 8 cover the padding of the packed codes
+    texts = [
+        "".join(rng.choice(PackedProtein.ALPHABET.replace("X", "")) for _ in range(n))
+        for n in [*range(1, 42), 200, 1000]
+    ]
+    packed = [PackedProtein(text) for text in texts]
+
+    expected = [weight(text) for text in texts]
+
+    np.testing.assert_allclose(molecular_weights(texts), expected)
+    np.testing.assert_allclose(molecular_weights(packed), expected)
+
+
+def test_mixed_packed_and_text_sequences():
+    sequences = ["MSKGEELFTG", PackedProtein("GG"), None, "mskgee", PackedProtein("")]
+
+    weights = molecular_weights(sequences, "kDa")
+
+    np.testing.assert_allclose(
+        weights[:2], [weight("MSKGEELFTG") / 1000, weight("GG") / 1000]
+    )
+    assert all(math.isnan(value) for value in weights[2:])
+
+
+@pytest.mark.parametrize("sequence", ["MSKXEE", "Met-Ser-Lys", "MSKGÉE", ""])
+def test_unknown_letters_give_nan(sequence):
+    assert math.isnan(molecular_weights([sequence])[0])
+
+
+def test_whitespace_is_skipped():
+    [value] = molecular_weights(["MSK GEE\nLF"])
+
+    assert value == pytest.approx(weight("MSKGEELF"))
+
+
+def test_check_molecular_weights():
+    items = [
+        SimpleNamespace(
+            sequence_amino_acid=PackedProtein("MSKGEELFTG"),
+            molecular_weight=weight("MSKGEELFTG") / 1000,
+            molecular_weight_unit="kDa",
+        ),
+        SimpleNamespace(
+            sequence_amino_acid="MSKGEELFTG",
+            molecular_weight=2 * weight("MSKGEELFTG"),
+            molecular_weight_unit="Da",
+        ),
+        SimpleNamespace(
+            sequence_amino_acid="Met-Ser",
+            molecular_weight=1.0,
+            molecular_weight_unit="kDa",
+        ),
+        SimpleNamespace(
+            sequence_amino_acid="MSKGEELFTG",
+            molecular_weight=1.0,
+            molecular_weight_unit="parsec",
+        ),
+    ]
+
+    [mismatch] = check_molecular_weights(items)
+
+    assert mismatch.position == 1
+    assert mismatch.deviation == pytest.approx(1.0)
+    np.testing.assert_allclose(
+        derived_molecular_weights(items[:2], "Da"), [weight("MSKGEELFTG")] * 2
+    )
@@ -0,0 +1,121 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from strendabiocat.components import Components
+from strendabiocat.ndjson import (
+    LineError,
+    MalformedLineWarning,
+    iter_ndjson_batches,
+    read_ndjson,
+    write_ndjson,
+)
+
+RECORD = {
+    "name": "NADH",
+    "smiles": "NC(=O)C1=CN(C=CC1)C1OC(COP(O)(=O)OP(O)(O)=O)C(O)C1O",
+    "persistent_identifier_PID": "CHEBI:16908",
+    "concentration": 0.2,
+    "concentration_unit": "mM",
+    "supplier": "Sigma",
+    "purity": 98.0,
+    "formulation": "powder",
+    "solubility_limit": 50.0,
+    "solubility_limit_unit": "mg/mL",
+}
+
+
+def fail(error: LineError):
+    pytest.fail(str(error))
+
+
+def components(count: int) -> list[Components]:
+    return [Components(**{**RECORD, "concentration": i / 10}) for i in range(count)]
+
+
+@pytest.mark.parametrize("name", ["components.ndjson", "components.ndjson.gz"])
+def test_round_trip(tmp_path, name):
+    items = components(7)
+    path = tmp_path / name
+
+    assert write_ndjson(path, items, batch_size=3) == 7
+    assert list(read_ndjson(path, Components, on_error=fail)) == items
+
+
+def test_gz_paths_are_compressed(tmp_path):
+    path = tmp_path / "components.ndjson.gz"
+    write_ndjson(path, components(2))
+
+    lines = gzip.decompress(path.read_bytes()).splitlines()
+
+    assert [json.loads(line)["@id"] for line in lines] == [
+        item.ld_id for item in list(read_ndjson(path, Components))
+    ]
+
+
+def test_streams_are_not_closed():
+    stream = io.BytesIO()
+    write_ndjson(stream, components(2), by_alias=False)
+
+    assert not stream.closed
+    assert b'"ld_id"' in stream.getvalue()
+
+    stream.seek(0)
+    assert len(list(read_ndjson(stream, Components))) == 2
+
+
+def test_malformed_lines_are_reported_with_position():
+    valid = json.dumps(RECORD).encode()
+    lines = [
+        valid,
+        b"",
+        b"{not json",
+        b"[1, 2]",
+        json.dumps({**RECORD, "purity": 150}).encode(),
+        valid,
+    ]
+    errors: list[LineError] = []
+
+    items = list(
+        read_ndjson(io.BytesIO(b"\n".join(lines)), Components, on_error=errors.append)
+    )
+
+    assert len(items) == 2
+    assert [(error.line, error.offset) for error in errors] == [
+        (3, len(valid) + 2),
+        (4, len(valid) + 2 + len(b"{not json\n")),
+        (5, len(valid) + 2 + len(b"{not json\n[1, 2]\n")),
+    ]
+    assert errors[0].message.startswith("Invalid JSON")
+    assert errors[1].message == "Expected a JSON object"
+    assert errors[2].message == "Invalid Components: purity"
+    assert [error["loc"] for error in errors[2].errors] == [("purity",)]
+    assert str(errors[1]) == f"line 4 (byte {errors[1].offset}): Expected a JSON object"
+
+
+def test_malformed_lines_warn_without_handler():
+    stream = io.BytesIO(json.dumps(RECORD).encode() + b"\n{\n")
+
+    with pytest.warns(MalformedLineWarning, match="line 2"):
+        assert len(list(read_ndjson(stream, Components))) == 1
+
+
+@pytest.mark.parametrize(
+    "batch_size, sizes", [(1, [1] * 5), (2, [2, 2, 1]), (5, [5]), (9, [5])]
+)
+def test_batch_size(batch_size, sizes):
+    stream = io.BytesIO()
+    write_ndjson(stream, components(5))
+    stream.seek(0)
+
+    batches = list(iter_ndjson_batches(stream, Components, batch_size))
+
+    assert [len(batch) for batch in batches] == sizes
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_batch_size_must_be_positive(batch_size):
+    with pytest.raises(ValueError, match="Batch size"):
+        next(iter_ndjson_batches(io.BytesIO(), Components, batch_size))
@@ -0,0 +1,61 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import strendabiocat
+from strendabiocat.base import StrendaBaseModel
+
+
+def test_models_match_the_modules():
+    defined = {}
+
+    for module in strendabiocat._MODEL_MODULES:
+        namespace = vars(importlib.import_module(f"strendabiocat.{module}"))
+        for name, value in namespace.items():
+            if (
+                isinstance(value, type)
+                and issubclass(value, StrendaBaseModel)
+                and value.__module__ == f"strendabiocat.{module}"
+            ):
+                defined.setdefault(name, []).append(module)
+
+    exported = {
+        name: module
+        for name, (module, attr) in strendabiocat._LAZY_ATTRIBUTES.items()
+        if module in strendabiocat._MODEL_MODULES and name == attr
+    }
+
+    assert exported == {
+        name: modules[0] for name, modules in defined.items() if len(modules) == 1
+    }
+    assert strendabiocat.BiocatalystStorageConditions.__module__.endswith("biocatalyst")
+
+
+def test_all_needs_no_optional_dependencies():
+    for name in strendabiocat.__all__:
+        module, _ = strendabiocat._LAZY_ATTRIBUTES[name]
+        assert module not in strendabiocat._OPTIONAL_MODULES
+
+    assert "read_parquet" not in strendabiocat.__all__
+    assert "KineticParameters" in strendabiocat.__all__
+
+
+def test_star_import_without_optional_dependencies():
+    # Blocked modules raise ImportError on import, as if not installed
+    code = (
+        "import sys\n"
+        "for name in ('numpy', 'pyarrow', 'orjson', 'rdkit'):\n"
+        "    sys.modules[name] = None\n"
+        "from strendabiocat import *\n"
+        "print(KineticParameters.__name__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(strendabiocat.__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "KineticParameters"
@@ -0,0 +1,141 @@
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from strendabiocat.query import IndexedCollection, LazyFilter, parse_lookup
+
+NAN = float("nan")
+
+
+def item(value, **attributes) -> SimpleNamespace:
+    return SimpleNamespace(value=value, **attributes)
+
+
+def values(items) -> list:
+    return [entry.value for entry in items]
+
+
+@pytest.fixture
+def collection() -> IndexedCollection:
+    return IndexedCollection(item(value) for value in (3.0, 1.0, NAN, 2.0, 1.0, 5))
+
+
+@pytest.mark.parametrize(
+    "lookup, expected",
+    [
+        ({"value__lt": 2.0}, [1.0, 1.0]),
+        ({"value__le": 2.0}, [1.0, 2.0, 1.0]),
+        ({"value__gt": 2.0}, [3.0, 5]),
+        ({"value__ge": 2.0}, [3.0, 2.0, 5]),
+        ({"value__between": (1.0, 3.0)}, [3.0, 1.0, 2.0, 1.0]),
+        ({"value__between": (4, 4.5)}, []),
+    ],
+)
+def test_sorted_index_ranges(collection, lookup, expected):
+    assert values(collection.filter(**lookup)) == expected
+    assert collection.sorted_index("value") is not None
+
+
+@pytest.mark.parametrize(
+    "lookup", ["value__lt", "value__le", "value__gt", "value__ge", "value"]
+)
+def test_nan_never_matches(collection, lookup):
+    assert collection.filter(**{lookup: NAN}) == []
+    assert not any(
+        math.isnan(value) for value in values(collection.filter(value__ge=0))
+    )
+    assert values(collection.filter(value__between=(NAN, 10))) == []
+    assert collection.filter(value__ne=NAN) == list(collection)
+
+
+def test_append_updates_both_indexes(collection):
+    collection.filter(value=1.0)
+    collection.filter(value__gt=2.0)
+
+    collection.append(item(4.0))
+    collection.append(item(NAN))
+    collection.append(item(1.0))
+
+    assert values(collection.filter(value=1.0)) == [1.0, 1.0, 1.0]
+    assert values(collection.filter(value__gt=2.0)) == [3.0, 5, 4.0]
+    assert values(collection.filter(value__between=(3.5, 4.5))) == [4.0]
+
+
+def test_append_of_a_non_number_drops_the_sorted_index(collection):
+    collection.filter(value__gt=2.0)
+    collection.append(item("high"))
+
+    assert collection.sorted_index("value") is None
+    assert values(collection.filter(value=1.0)) == [1.0, 1.0]
+    with pytest.raises(TypeError):
+        collection.filter(value__gt=2.0)
+
+
+def test_unhashable_values_fall_back_to_scans():
+    collection = IndexedCollection(
+        [item(1, types=["a"]), item(2, types=["b"]), item(3, types=["a", "b"])]
+    )
+
+    assert values(collection.filter(types=["a"])) == [1]
+    assert values(collection.filter(types__ne=["a"])) == [2, 3]
+    assert values(collection.filter(types__in=[["b"], ["a", "b"]])) == [2, 3]
+    assert values(collection.filter(value__in=[1, 3], types__ne=["a"])) == [3]
+    assert collection.index("types") == {}
+
+
+@pytest.mark.parametrize(
+    "key, value, match",
+    [
+        ("value__like", 1, "Unknown lookup operator 'like'"),
+        ("value__gt", lambda value: True, "can not combine"),
+        ("value__between", (1, 2, 3), r"\(low, high\) pair"),
+    ],
+)
+def test_parse_lookup_errors(key, value, match):
+    with pytest.raises(ValueError, match=match):
+        parse_lookup(key, value)
+
+
+def test_parse_lookup():
+    assert parse_lookup("value", 1) == ("value", "eq")
+    assert parse_lookup("michaelis_constant__ge", 1) == ("michaelis_constant", "ge")
+    assert parse_lookup("value", abs) == ("value", "pred")
+
+
+def test_filter_matches_a_lazy_scan():
+    rng = random.Random(0)
+    items = [
+        item(
+            rng.choice([NAN, *range(10)]) + rng.random() * rng.randint(0, 1),
+            unit=rng.choice(["mM", "uM", "M"]),
+            rank=rng.randint(0, 5),
+        )
+        for _ in range(500)
+    ]
+    collection = IndexedCollection(items[:400])
+    collection.filter(value__ge=0, unit="mM", rank__ne=0)
+    collection.extend(items[400:])
+
+    for _ in range(200):
+        low = rng.uniform(-1, 10)
+        lookups = rng.sample(
+            [
+                ("value__lt", low),
+                ("value__le", low),
+                ("value__gt", low),
+                ("value__ge", low),
+                ("value__between", (low, low + rng.uniform(0, 5))),
+                ("unit", rng.choice(["mM", "uM", "M", "nM"])),
+                ("unit__ne", "mM"),
+                ("unit__in", {"uM", "M"}),
+                ("rank", rng.randint(0, 5)),
+                ("rank__gt", rng.randint(0, 5)),
+                ("rank", lambda rank: rank % 2 == 0),
+            ],
+            rng.randint(1, 3),
+        )
+        kwargs = dict(lookups)
+
+        assert collection.filter(**kwargs) == list(LazyFilter(items, **kwargs))
@@ -0,0 +1,31 @@
+import pytest
+
+from strendabiocat.schemas import SCHEMA_DIR, raw_validator, schema_names, validate_raw
+
+
+def test_schemas_are_package_data():
+    assert (SCHEMA_DIR / "results" / "KineticParameters.json").is_file()
+    assert "results/KineticParameters" in schema_names()
+    assert len(schema_names()) == 48
+
+
+@pytest.mark.parametrize(
+    "document, errors",
+    [
+        ({"purity": 99.5}, []),
+        ({"purity": 120.0}, ["purity: must be <= 100.0"]),
+        ({"purity": "pure"}, ["purity: expected number"]),
+        ({"name": 1}, ["name: expected string"]),
+    ],
+)
+def test_validate_raw(document, errors):
+    assert validate_raw("components/Components", document) == errors
+
+
+def test_ambiguous_and_unknown_names():
+    assert raw_validator("KineticParameters").name == "results/KineticParameters"
+
+    with pytest.raises(KeyError):
+        raw_validator("StorageConditions")
+    with pytest.raises(KeyError):
+        raw_validator("Unknown")
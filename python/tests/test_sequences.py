@@ -0,0 +1,169 @@
+import pickle
+import re
+
+import pytest
+
+from strendabiocat.biocatalyst import BiocatalystSelfProduced
+from strendabiocat.helpers import id_strategy
+from strendabiocat.query import IndexedCollection, LazyFilter
+from strendabiocat.sequences import PackedDNA, PackedProtein, stored_sequence
+
+DNA = "ATGGCTAGCAAAGGAGAAGAACTTTTCACTGGAGTTGTCCCAATT"
+PROTEIN = "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTT*"
+
+
+RECORD = {
+    "name": "GFP",
+    "ec_number": "1.1.1.1",
+    "molecular_weight": 26.9,
+    "molecular_weight_unit": "kDa",
+    "catalyzed_reaction": "none",
+    "sequence_amino_acid": PROTEIN,
+    "sequence_DNA": DNA,
+    "sequence_plasmid": "ATGACC" * 10 + DNA,
+    "plasmid_specifications": "pET-28a(+)",
+    "origin_organism": "Aequorea victoria",
+    "production_organism": "Escherichia coli BL21(DE3)",
+    "posttranslational_modification": "none",
+    "purity": 95.0,
+    "purity_specification": "SDS-PAGE",
+    "purification_method": "Ni-NTA",
+    "formulation": "lyophilised",
+    "special_treatment": "none",
+}
+
+
+def biocatalyst(**values) -> BiocatalystSelfProduced:
+    return BiocatalystSelfProduced(**{**RECORD, **values})
+
+
+@pytest.mark.parametrize(
+    "packed, alphabet",
+    [(PackedDNA, PackedDNA.ALPHABET), (PackedProtein, PackedProtein.ALPHABET)],
+)
+@pytest.mark.parametrize("length", range(0, 18))
+def test_round_trip_of_all_lengths(packed, alphabet, length):
+    text = "".join(alphabet[(i * 7 + 3) % len(alphabet)] for i in range(length))
+    sequence = packed(text)
+
+    assert str(sequence) == text
+    assert len(sequence) == length
+    assert sequence.nbytes == (length * packed.BITS + 7) // 8
+    assert pickle.loads(pickle.dumps(sequence)) == sequence
+
+
+@pytest.mark.parametrize("text", ["A", "T", "AAAA", "TTTTT", "ACGTA"])
+def test_round_trip_of_leading_zero_codes(text):
+    # A is code 0, so leading As must not be lost as padding
+    assert str(PackedDNA(text)) == text
+    assert str(PackedProtein(text)) == text
+
+
+@pytest.mark.parametrize("text", ["atgc", "ATGN", "MSK1", " ATG"])
+def test_rejects_letters_outside_the_alphabet(text):
+    assert not PackedDNA.fits(text)
+
+    with pytest.raises(ValueError):
+        PackedDNA(text)
+
+
+def test_equality_and_hash_contract():
+    sequence = PackedDNA(DNA)
+
+    assert sequence == DNA and DNA == sequence
+    assert sequence == PackedDNA(DNA)
+    assert sequence != DNA[:-1] and sequence != PackedDNA(DNA[:-1])
+    assert sequence != "atg" and sequence != 42
+    assert hash(sequence) == hash(DNA) == hash(PackedDNA(DNA))
+    assert {sequence: 1}[DNA] == 1 and {DNA: 1}[sequence] == 1
+    assert len({sequence, DNA, PackedDNA(DNA)}) == 1
+
+
+def test_string_operations():
+    sequence = PackedDNA(DNA)
+
+    assert sequence + "A" == DNA + "A"
+    assert "A" + sequence == "A" + DNA
+    assert sequence + sequence == DNA + DNA
+    assert "GCTAGC" in sequence
+    assert sequence[3:6] == "GCT"
+    assert sequence.startswith("ATG")
+
+
+def test_model_attributes_are_text():
+    item = biocatalyst()
+
+    assert type(item.sequence_DNA) is str and item.sequence_DNA == DNA
+    assert type(item.sequence_amino_acid) is str
+    assert isinstance(stored_sequence(item, "sequence_DNA"), PackedDNA)
+    assert isinstance(stored_sequence(item, "sequence_amino_acid"), PackedProtein)
+    assert item.sequence_DNA + "A" == DNA + "A"
+    assert re.search("GCTAGC", item.sequence_DNA)
+
+
+def test_unpackable_sequences_are_kept():
+    item = biocatalyst(sequence_DNA="atggct", sequence_amino_acid="Met-Ser-Lys")
+
+    assert stored_sequence(item, "sequence_DNA") == "atggct"
+    assert type(stored_sequence(item, "sequence_amino_acid")) is str
+
+
+def test_assignment_packs_and_reads_as_text():
+    item = biocatalyst()
+    item.sequence_DNA = "ACGT"
+
+    assert item.sequence_DNA == "ACGT" and type(item.sequence_DNA) is str
+    assert isinstance(stored_sequence(item, "sequence_DNA"), PackedDNA)
+
+
+def test_serialization_round_trip():
+    item = biocatalyst()
+    dumped = item.model_dump()
+
+    assert dumped["sequence_DNA"] == DNA and type(dumped["sequence_DNA"]) is str
+
+    loaded = BiocatalystSelfProduced.model_validate_json(item.model_dump_json())
+    assert loaded == item
+    assert pickle.loads(pickle.dumps(item)) == item
+
+
+def test_filters_match_packed_fields():
+    items = [biocatalyst(), biocatalyst(sequence_amino_acid="MSKG")]
+
+    indexed = IndexedCollection(items).filter(sequence_amino_acid="MSKG")
+    scanned = list(LazyFilter(items, sequence_amino_acid="MSKG"))
+
+    assert indexed == scanned == [items[1]]
+
+
+def test_trusted_construction_packs_sequences():
+    item = BiocatalystSelfProduced.from_trusted(RECORD)
+
+    assert isinstance(stored_sequence(item, "sequence_DNA"), PackedDNA)
+    assert isinstance(stored_sequence(item, "sequence_amino_acid"), PackedProtein)
+    assert item.sequence_DNA == DNA and type(item.sequence_DNA) is str
+
+
+def test_content_ids_agree_across_construction_paths():
+    with id_strategy("content"):
+        validated = BiocatalystSelfProduced(**RECORD)
+        trusted = BiocatalystSelfProduced.from_trusted(
+            {name: value for name, value in RECORD.items() if name != "ld_id"}
+        )
+        constructed = BiocatalystSelfProduced.model_construct(**RECORD)
+
+    assert validated.ld_id == trusted.ld_id == constructed.ld_id
+
+
+def test_bulk_edits_pack_sequences_on_exit():
+    item = biocatalyst()
+
+    with item.bulk_edit():
+        item.sequence_DNA = "GATTACA"
+        item.sequence_amino_acid = "mskgee"
+
+    assert stored_sequence(item, "sequence_DNA") == PackedDNA("GATTACA")
+    assert type(stored_sequence(item, "sequence_DNA")) is PackedDNA
+    assert type(stored_sequence(item, "sequence_amino_acid")) is str
+    assert item.sequence_DNA == "GATTACA"
+    assert item.sequence_amino_acid == "mskgee"
@@ -0,0 +1,109 @@
+import pytest
+
+from strendabiocat.units import UnitError, UnitRegistry, convert, parse_unit
+
+
+@pytest.mark.parametrize(
+    "value, source, target, expected",
+    [
+        # Prefixes, µ/μ signs and spacing
+        (2.5, "mM", "uM", 2500.0),
+        (1.0, "µM", "nM", 1000.0),
+        (1.0, "μmol", "mol", 1e-6),
+        (1.0, " mM ", "mM", 1.0),
+        (44.0, "kDa", "Da", 44000.0),
+        (1.0, "mL", "L", 1e-3),
+        # Temperatures are absolute on their own, differences in compounds
+        (37.0, "°C", "K", 310.15),
+        (310.15, "K", "degC", 37.0),
+        (212.0, "°F", "°C", 100.0),
+        (25.0, "℃", "K", 298.15),
+        (1.0, "K/min", "°C/min", 1.0),
+        (9.0, "°F/h", "K/h", 5.0),
+        # Products, quotients, parentheses and powers
+        (60.0, "mmol/(L*min)", "M/s", 1e-3),
+        (1.0, "U/mg", "kat/kg", 1 / 60),
+        (1.0, "M-1s-1", "mM^-1 min^-1", 0.06),
+        (1.0, "M^-1*s^-1", "1/(M*s)", 1.0),
+        (1.0, "m²", "cm^2", 1e4),
+        (1.0, "(m/s)^2", "m^2/s^2", 1.0),
+        (1.0, "mg·mL⁻¹", "g/L", 1.0),
+        (2.0, "mg per mL", "g/L", 2.0),
+        (60.0, "rpm", "Hz", 1.0),
+        # Energy
+        (1.5, "kJ/mol", "J/mol", 1500.0),
+        (1.0, "kcal/mol", "kJ/mol", 4.184),
+        (1.0, "kJ/(mol*K)", "J mol-1 K-1", 1000.0),
+        # Ratios and their qualifiers
+        (1.0, "% (v/v)", "ppm", 1e4),
+        (5.0, "% (w/w)", "%", 5.0),
+        (None, "mM", "M", None),
+    ],
+)
+def test_convert(value, source, target, expected):
+    if expected is None:
+        assert convert(value, source, target) is None
+    else:
+        assert convert(value, source, target) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "text, si",
+    [
+        ("U/mg", "mol/kg/s"),
+        ("mM", "mol/m^3"),
+        ("kJ/mol", "kg*m^2/s^2/mol"),
+        ("%", "1"),
+        ("°C", "K"),
+    ],
+)
+def test_parse_dimension(text, si):
+    assert parse_unit(text).si == si
+
+
+def test_parse_interns_equal_units():
+    assert parse_unit("mM") is parse_unit(" mM ")
+    assert parse_unit("°C").offset == 273.15
+    assert parse_unit("°C/min").offset == 0.0
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("", "Empty unit"),
+        ("   ", "Empty unit"),
+        ("furlong", "Unknown unit"),
+        ("kmin", "Unknown unit"),
+        ("mmol/(L", "Unbalanced parentheses"),
+        ("mmol/L)", "Unbalanced parentheses"),
+        ("mM$", "Cannot parse unit"),
+    ],
+)
+def test_parse_errors(text, message):
+    with pytest.raises(UnitError, match=message):
+        parse_unit(text)
+
+
+@pytest.mark.parametrize(
+    "source, target",
+    [("mM", "K"), ("kJ/mol", "kJ"), ("U/mg", "U/mL"), ("°C", "%")],
+)
+def test_convert_between_dimensions_fails(source, target):
+    with pytest.raises(UnitError, match="Cannot convert"):
+        convert(1.0, source, target)
+
+
+def test_unit_error_is_a_value_error():
+    assert issubclass(UnitError, ValueError)
+
+
+def test_define_adds_units():
+    registry = UnitRegistry()
+
+    with pytest.raises(UnitError):
+        registry.parse("mOD")
+
+    registry.define("OD", 1.0, (0, 0, 0, 0, 0, 0), prefixable=True)
+
+    assert registry.convert(250.0, "mOD", "OD") == pytest.approx(0.25)
+    assert convert(1.0, "mM", "M") == pytest.approx(1e-3)
@@ -0,0 +1,124 @@
+import io
+import math
+from datetime import date
+
+import pytest
+
+from strendabiocat.components import Components, StorageConditions
+from strendabiocat.results import ThermodynamicParameters
+from strendabiocat.xml import _text, read_xml, write_xml
+
+RECORD = {
+    "name": "ethanol",
+    "smiles": "CCO",
+    "persistent_identifier_PID": "CHEBI:16236",
+    "concentration": 10.0,
+    "concentration_unit": "mM",
+    "supplier": "Sigma-Aldrich",
+    "purity": 99.8,
+    "formulation": "liquid",
+    "solubility_limit": float("inf"),
+    "solubility_limit_unit": "mM",
+}
+
+
+def fail(error):
+    pytest.fail(str(error))
+
+
+def round_trip(items: list[Components]) -> list[Components]:
+    stream = io.BytesIO()
+    write_xml(stream, items)
+    stream.seek(0)
+
+    return list(read_xml(stream, Components, on_error=fail))
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("persistent_identifier_PID", ""),
+        ("supplier", "  Sigma-Aldrich  "),
+        ("formulation", "liquid,\n  degassed"),
+        ("formulation", "line\r\nbreak"),
+        ("name", "<ethanol> & water"),
+    ],
+)
+def test_round_trip_keeps_text_verbatim(name, value):
+    item = Components(**{**RECORD, name: value})
+
+    (loaded,) = round_trip([item])
+
+    assert getattr(loaded, name) == value
+    assert loaded.model_dump(exclude={"ld_id"}) == item.model_dump(exclude={"ld_id"})
+
+
+def test_absent_elements_are_missing():
+    stream = io.BytesIO(
+        b"<ComponentsList><Components><name>ethanol</name></Components>"
+        b"</ComponentsList>"
+    )
+    errors = []
+
+    assert list(read_xml(stream, Components, on_error=errors.append)) == []
+    assert "persistent_identifier_PID" in errors[0].message
+
+
+@pytest.mark.parametrize("value", ["NaN", "INF", "-INF", " 1.5 kJ/mol "])
+def test_string_fields_keep_special_float_spellings(value):
+    item = ThermodynamicParameters(
+        gibbs_free_energy_change=value, enthalpy_change="INF", special_treatment=""
+    )
+    stream = io.BytesIO()
+    write_xml(stream, [item])
+    stream.seek(0)
+
+    (loaded,) = read_xml(stream, ThermodynamicParameters, on_error=fail)
+
+    assert loaded.gibbs_free_energy_change == value
+    assert loaded.enthalpy_change == "INF"
+
+
+@pytest.mark.parametrize(
+    "solubility, expected", [(" INF ", math.inf), ("\n  2.5\n", 2.5), ("1e3", 1e3)]
+)
+def test_float_fields_collapse_whitespace(solubility, expected):
+    elements = "".join(
+        f"<{name}>{_text(value)}</{name}>"
+        for name, value in {**RECORD, "solubility_limit": solubility}.items()
+    )
+    stream = io.BytesIO(
+        f"<ComponentsList><Components>{elements}</Components></ComponentsList>".encode()
+    )
+
+    (loaded,) = read_xml(stream, Components, on_error=fail)
+
+    assert loaded.solubility_limit == expected
+
+
+def test_date_fields_collapse_whitespace():
+    stream = io.BytesIO(
+        b"<StorageConditionsList><StorageConditions>"
+        b"<temperature> -20.0 </temperature>"
+        b"<temperature_unit>\xc2\xb0C</temperature_unit>"
+        b"<storage_start>\n  2024-01-01 </storage_start>"
+        b"<additives> 10 % glycerol </additives><special_treatment/>"
+        b"</StorageConditions></StorageConditionsList>"
+    )
+
+    (loaded,) = read_xml(stream, StorageConditions, on_error=fail)
+
+    assert loaded.storage_start == date(2024, 1, 1)
+    assert loaded.temperature == -20.0
+    assert loaded.additives == " 10 % glycerol "
+    assert loaded.special_treatment == ""
+
+    stream = io.BytesIO()
+    write_xml(stream, [loaded])
+    stream.seek(0)
+
+    (reloaded,) = read_xml(stream, StorageConditions, on_error=fail)
+
+    assert reloaded.model_dump(exclude={"ld_id"}) == loaded.model_dump(
+        exclude={"ld_id"}
+    )